@@ -1,10 +1,27 @@
+from collections.abc import Sequence
+from copy import deepcopy
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from functools import cached_property, lru_cache
+from hashlib import blake2b
 from typing import (
     AbstractSet,
+    Annotated,
     Any,
+    Callable,
+    ClassVar,
+    NamedTuple,
+    Optional,
+    TypeVar,
     Union,
+    get_args,
+    get_origin,
 )
+from weakref import WeakKeyDictionary, finalize, ref
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, SecretBytes, SecretStr
+from pydantic.fields import FieldInfo
 
 AbstractSetOrDict = Union[
     AbstractSet[Union[int, str]],
@@ -12,6 +29,473 @@ AbstractSetOrDict = Union[
 ]
 
 
+class ModelMeta(NamedTuple):
+    """Metadata of model class that was computed only once per class."""
+
+    fields: tuple[str, ...]
+    aliases: tuple[str, ...]
+    properties: tuple[str, ...]
+    alias_map: dict[str, str]
+    dependents: dict[str, tuple[str, ...]]
+    cached: tuple[str, ...]
+
+
+# Note: the registry use weak reference of the model class for the dynamic
+#   model class that able to create and drop on runtime.
+_METADATA: WeakKeyDictionary[type, ModelMeta] = WeakKeyDictionary()
+
+
+def _build_metadata(cls: type[BaseModel]) -> ModelMeta:
+    """Build metadata from fields and properties of all classes on the MRO of
+    the model class except the classes from Pydantic.
+    """
+    fields: tuple[str, ...] = tuple(cls.model_fields)
+    aliases: tuple[str, ...] = tuple(
+        (field.alias or name) for name, field in cls.model_fields.items()
+    )
+    props: dict[str, None] = {}
+    cached: dict[str, None] = {}
+    for klass in reversed(cls.__mro__):
+        if klass in BaseModel.__mro__:
+            continue
+        for name, attr in vars(klass).items():
+            if isinstance(attr, property):
+                props[name] = None
+            elif isinstance(attr, cached_property):
+                cached[name] = None
+            elif name in props:
+                # Note: the property was overridden by non-property attribute.
+                props.pop(name)
+
+    # Note: reverse the field depends map to the map of field and all fields
+    #   that depend on it with the declared ordering of fields.
+    depends: dict[str, tuple[str, ...]] = getattr(cls, "field_depends", {})
+    dependents: dict[str, tuple[str, ...]] = {
+        field: tuple(name for name in fields if field in depends.get(name, ()))
+        for field in fields
+    }
+    return ModelMeta(
+        fields=fields,
+        aliases=aliases,
+        properties=tuple(props),
+        alias_map=dict(zip(aliases, fields)),
+        dependents=dependents,
+        cached=tuple(cached),
+    )
+
+
+def _hash(data: bytes) -> bytes:
+    return blake2b(data, digest_size=16).digest()
+
+
+def _encode(value: Any, parts: list[bytes], children: list[BaseModel]) -> bool:
+    """Append the canonical bytes of value to the parts and the mutable models
+    of value to the children, and return True if the value has any model that
+    able to change without notice to its parent.
+    """
+    # Note: the exact type of common scalar values check first because the
+    #   instance check of pydantic model class is slow.
+    cls: type = type(value)
+    if cls is str:
+        data: bytes = value.encode("utf-8")
+        parts.append(b"s%d:" % len(data) + data)
+    elif value is None:
+        parts.append(b"n")
+    elif cls is bool:
+        parts.append(b"t" if value else b"f")
+    elif isinstance(value, BaseUpdatableModel):
+        parts.append(b"m" + value.fingerprint_digest())
+        children.append(value)
+        # Note: the model that does not cache its digest has the untracked
+        #   model, so its parent does not able to cache too.
+        return "__fingerprint__" not in value.__dict__
+    elif isinstance(value, BaseModel):
+        return _encode_model(value, parts, children)
+    elif isinstance(value, Enum):
+        return _encode(value.value, parts, children)
+    elif isinstance(value, int):
+        parts.append(b"i%d;" % value)
+    elif isinstance(value, float):
+        parts.append(b"d" + repr(value).encode() + b";")
+    elif isinstance(value, str):
+        data: bytes = value.encode("utf-8")
+        parts.append(b"s%d:" % len(data) + data)
+    elif isinstance(value, bytes):
+        parts.append(b"b%d:" % len(value) + value)
+    elif isinstance(value, (SecretStr, SecretBytes)):
+        # Note: the secret value keeps only its hash on the parts.
+        secret: Union[str, bytes] = value.get_secret_value()
+        if isinstance(secret, str):
+            secret = secret.encode("utf-8")
+        parts.append(b"x" + _hash(secret))
+    elif isinstance(value, (datetime, date, time, Decimal)):
+        data: bytes = str(value).encode()
+        parts.append(b"T%d:" % len(data) + data)
+    elif isinstance(value, dict):
+        items: list[tuple[bytes, bytes]] = []
+        nested: bool = False
+        for k, v in value.items():
+            key: list[bytes] = []
+            val: list[bytes] = []
+            nested |= _encode(k, key, children) | _encode(v, val, children)
+            items.append((b"".join(key), b"".join(val)))
+        parts.append(b"{")
+        parts.extend(b"".join(item) for item in sorted(items))
+        parts.append(b"}")
+        return nested
+    elif isinstance(value, (set, frozenset)):
+        elements: list[bytes] = []
+        nested: bool = False
+        for v in value:
+            element: list[bytes] = []
+            nested |= _encode(v, element, children)
+            elements.append(b"".join(element))
+        parts.append(b"<" + b"".join(sorted(elements)) + b">")
+        return nested
+    elif isinstance(value, Sequence):
+        parts.append(b"[")
+        nested: bool = False
+        for v in value:
+            nested |= _encode(v, parts, children)
+        parts.append(b"]")
+        return nested
+    else:
+        raise TypeError(f"can not fingerprint value of type {type(value)}")
+    return False
+
+
+def _encode_fields(
+    value: BaseModel,
+    parts: list[bytes],
+    children: list[BaseModel],
+) -> bool:
+    name: bytes = type(value).__name__.encode()
+    parts.append(b"M%d:" % len(name) + name)
+    nested: bool = False
+    for field in value.model_fields:
+        parts.append(field.encode() + b"=")
+        nested |= _encode(getattr(value, field), parts, children)
+    return nested
+
+
+def _leaf_key(value: Any) -> Any:
+    # Note: the equal values of different types, like `1`, `True`, and `1.0`,
+    #   or the equal decimals with different exponents encode to different
+    #   bytes, so the key keeps the type or the text of value.
+    if isinstance(value, (float, Decimal)):
+        return repr(value)
+    return type(value)
+
+
+@lru_cache(maxsize=4096)
+def _leaf_digest(model: type[BaseModel], items: tuple[Any, ...]) -> bytes:
+    parts: list[bytes] = []
+    values: dict[str, Any] = {k: v for k, v, _ in items}
+    _encode_fields(model.model_construct(**values), parts, [])
+    return _hash(b"".join(parts))
+
+
+def _encode_model(
+    value: BaseModel,
+    parts: list[bytes],
+    children: list[BaseModel],
+) -> bool:
+    """Append the digest of model that does not updatable like datatypes and
+    constraints. The digest of model that has only hashable values will cache
+    with its values.
+
+    Note:
+        The model that does not frozen able to change in place, so it appends
+    to the children that clear the cached digests of its parents when it was
+    assigned. The plain model that does not notice its changes reports as the
+    untracked model and its parent does not cache the digest.
+    """
+    untracked: bool = False
+    if not value.model_config.get("frozen", False):
+        children.append(value)
+        untracked = not isinstance(value, BaseWatchedModel)
+    try:
+        parts.append(
+            b"m"
+            + _leaf_digest(
+                type(value),
+                tuple((k, v, _leaf_key(v)) for k, v in value.__dict__.items()),
+            )
+        )
+        return untracked
+    except TypeError:
+        child: list[bytes] = []
+        nested: bool = _encode_fields(value, child, children)
+        parts.append(b"m" + _hash(b"".join(child)))
+        return nested or untracked
+
+
+# Note: the parents that cache their digests over the mutable child models,
+#   it keys by the id of child and drops when the child was collected.
+_PARENTS: dict[int, list[ref["BaseUpdatableModel"]]] = {}
+
+
+def _watch(child: BaseModel, parent: "BaseUpdatableModel") -> None:
+    """Register the parent that caches its digest over the child model."""
+    key: int = id(child)
+    if (parents := _PARENTS.get(key)) is None:
+        parents = _PARENTS[key] = []
+        finalize(child, _PARENTS.pop, key, None)
+    if not any(p() is parent for p in parents):
+        parents.append(ref(parent))
+
+
+def _clear_parents(child: BaseModel) -> None:
+    """Clear the cached digests of all parents of the child model that was
+    changed, and the parents of them.
+    """
+    if parents := _PARENTS.get(id(child)):
+        refs: list[ref[BaseUpdatableModel]] = parents.copy()
+        parents.clear()
+        for p in refs:
+            if (parent := p()) is not None:
+                parent.clear_cached()
+
+
+class BaseWatchedModel(BaseModel):
+    """Base Model of the model that does not updatable, like datatypes and
+    constraints, that clears the cached fingerprints of the models that keep
+    it when any field was assigned.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        _clear_parents(self)
+
+
+def fingerprint(value: Any) -> str:
+    """Return the canonical fingerprint of value that does not depend on the
+    ordering of dict keys and does not keep the raw secret values.
+
+    Examples:
+        >>> fingerprint({"a": 1, "b": [1, 2]}) == fingerprint({"b": [1, 2], "a": 1})
+        True
+        >>> fingerprint(SecretStr("foo")) == fingerprint(SecretStr("bar"))
+        False
+    """
+    if isinstance(value, BaseUpdatableModel):
+        return value.fingerprint()
+    parts: list[bytes] = []
+    _encode(value, parts, [])
+    return _hash(b"".join(parts)).hex()
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Note: the converter of trusted field value that receive the value and the
+#   flag of shape check.
+Converter = Callable[[Any, bool], Any]
+
+
+class TrustedField(NamedTuple):
+    """Construction plan of the field that was computed only once per class."""
+
+    name: str
+    alias: Optional[str]
+    field: FieldInfo
+    converter: Optional[Converter]
+
+
+class TrustedPlan(NamedTuple):
+    """Construction plan of the model that was computed only once per class."""
+
+    fields: tuple[TrustedField, ...]
+    names: frozenset[str]
+    keys: frozenset[str]
+    converters: tuple[tuple[str, Converter], ...]
+
+
+_TRUSTED: WeakKeyDictionary[type, TrustedPlan] = WeakKeyDictionary()
+
+
+def build_model(
+    model: type[ModelT],
+    values: dict[str, Any],
+    fields_set: set[str],
+) -> ModelT:
+    """Return the model instance that use the values dict as its instance dict
+    without any validation. The values must contain all fields of the model.
+    """
+    obj = model.__new__(model)
+    object.__setattr__(obj, "__dict__", values)
+    object.__setattr__(obj, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(obj, "__pydantic_extra__", None)
+    object.__setattr__(obj, "__pydantic_private__", None)
+    return obj
+
+
+def _trusted_model(model: type[BaseModel]) -> Converter:
+    # Note: the model able to override the trusted construction like the
+    #   datatype model that dispatch the values to its registered model.
+    construct: Callable[..., Any] = getattr(model, "from_trusted", None) or (
+        lambda v, check=False: construct_trusted(model, v, check=check)
+    )
+
+    def convert(value: Any, check: bool) -> Any:
+        if isinstance(value, dict):
+            return construct(value, check=check)
+        return value
+
+    return convert
+
+
+def _trusted_union(models: list[type[BaseModel]]) -> Converter:
+    # Note: the dict value converts to the first model that its keys match
+    #   with fields of that model, or keeps as dict.
+    shapes = [
+        (
+            model,
+            frozenset(model.model_fields),
+            frozenset(
+                n for n, f in model.model_fields.items() if f.is_required()
+            ),
+            _trusted_model(model),
+        )
+        for model in models
+    ]
+
+    def convert(value: Any, check: bool) -> Any:
+        if isinstance(value, dict):
+            keys = value.keys()
+            for _, fields, required, converter in shapes:
+                if required <= keys and keys <= fields:
+                    return converter(value, check)
+        return value
+
+    return convert
+
+
+def _trusted_converter(annotation: Any) -> Optional[Converter]:
+    """Return the converter of trusted value from its annotation or None if
+    the value does not need any conversion.
+    """
+    origin: Any = get_origin(annotation)
+    if origin is Annotated:
+        return _trusted_converter(get_args(annotation)[0])
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _trusted_model(annotation)
+        if issubclass(annotation, (SecretStr, SecretBytes)):
+            return lambda v, check: (
+                v if isinstance(v, annotation) else annotation(v)
+            )
+        return None
+    if origin in (list, tuple, set, frozenset, Sequence):
+        args: tuple[Any, ...] = get_args(annotation)
+        if not args or (converter := _trusted_converter(args[0])) is None:
+            return None
+        factory: Callable[..., Any] = list if origin is Sequence else origin
+        return lambda v, check: factory(converter(x, check) for x in v)
+    if origin is Union:
+        models: list[type[BaseModel]] = [
+            arg
+            for arg in get_args(annotation)
+            if isinstance(arg, type) and issubclass(arg, BaseModel)
+        ]
+        if models:
+            return _trusted_union(models)
+    return None
+
+
+def _trusted_plan(model: type[BaseModel]) -> TrustedPlan:
+    try:
+        return _TRUSTED[model]
+    except KeyError:
+        fields: tuple[TrustedField, ...] = tuple(
+            TrustedField(
+                name=name,
+                alias=field.alias if field.alias != name else None,
+                field=field,
+                converter=_trusted_converter(field.annotation),
+            )
+            for name, field in model.model_fields.items()
+        )
+        plan = TrustedPlan(
+            fields=fields,
+            names=frozenset(f.name for f in fields),
+            keys=frozenset(k for f in fields for k in (f.name, f.alias) if k),
+            converters=tuple(
+                (f.name, f.converter) for f in fields if f.converter
+            ),
+        )
+        _TRUSTED[model] = plan
+        return plan
+
+
+def _default(field: FieldInfo) -> Any:
+    """Return the default value of field that copy the mutable default value
+    like the validation of pydantic does.
+    """
+    if field.default_factory is not None:
+        return field.default_factory()
+    if isinstance(field.default, (str, int, float, bool, type(None), tuple)):
+        return field.default
+    return deepcopy(field.default)
+
+
+def construct_trusted(
+    model: type[ModelT],
+    values: dict[str, Any],
+    *,
+    check: bool = False,
+) -> ModelT:
+    """Construct the model and its nested models from the trusted values that
+    was normalized already, like the output of `model_dump`, without any
+    validators or string parsing. The missing fields use their defaults.
+
+    :param model: A model class.
+    :param values: A dict of field name or alias and its normalized value.
+    :param check: A flag that checks the shape of values, all required
+        fields exist and does not have any unknown keys, for all models.
+
+    :raises ValueError: If the shape check does not pass.
+
+    Examples:
+        >>> class Foo(BaseModel):
+        ...     name: str
+        ...     tags: list[str] = []
+        >>> construct_trusted(Foo, {"name": "foo"})
+        Foo(name='foo', tags=[])
+    """
+    plan: TrustedPlan = _trusted_plan(model)
+    if values.keys() == plan.names:
+        # Note: the fast path for the values that has all fields by name, like
+        #   the output of `model_dump`, converts only the nested values.
+        data: dict[str, Any] = dict(values)
+        for name, converter in plan.converters:
+            data[name] = converter(data[name], check)
+        return build_model(model, data, set(plan.names))
+
+    data = {}
+    fields_set: set[str] = set()
+    for name, alias, field, converter in plan.fields:
+        if name in values:
+            value: Any = values[name]
+        elif alias is not None and alias in values:
+            value = values[alias]
+        else:
+            if check and field.is_required():
+                raise ValueError(
+                    f"trusted values of {model.__name__} does not contain "
+                    f"required field {name!r}"
+                )
+            data[name] = _default(field)
+            continue
+        data[name] = value if converter is None else converter(value, check)
+        fields_set.add(name)
+    if check and (unknown := values.keys() - plan.keys):
+        raise ValueError(
+            f"trusted values of {model.__name__} contain unknown keys: "
+            f"{sorted(unknown)}"
+        )
+    return build_model(model, data, fields_set)
+
+
 class __BaseModel(BaseModel):
     # This config allow to validate before assign new data to any field
     model_config = ConfigDict(
@@ -21,21 +505,103 @@ class __BaseModel(BaseModel):
     )
 
 
+UpdatableT = TypeVar("UpdatableT", bound="BaseUpdatableModel")
+
+
 class BaseUpdatableModel(__BaseModel):
     """Base Model that was implemented updatable method and properties."""
 
+    # Note: the map of field and the fields that its validator use from
+    #   `info.data`. It uses to re-validate the field on incremental update.
+    field_depends: ClassVar[dict[str, tuple[str, ...]]] = {}
+
     @classmethod
-    def get_field_names(cls, alias=False):
-        return list(cls.model_json_schema(alias).get("properties").keys())
+    def get_metadata(cls) -> ModelMeta:
+        """Return metadata of this model that was computed on first use."""
+        try:
+            return _METADATA[cls]
+        except KeyError:
+            meta: ModelMeta = _build_metadata(cls)
+            _METADATA[cls] = meta
+            return meta
 
     @classmethod
-    def get_properties(cls) -> list:
-        """Return list of properties of this model"""
-        return [
-            prop
-            for prop in cls.__dict__
-            if isinstance(cls.__dict__[prop], property)
-        ]
+    def from_trusted(cls, values: dict, *, check: bool = False):
+        """Construct this model from the trusted values that was normalized
+        already, like the output of `model_dump`, without any validators.
+        The secret values able to pass as string.
+
+        :param values: A dict of field name or alias and its normalized value.
+        :param check: A flag that checks the shape of values.
+        """
+        return construct_trusted(cls, values, check=check)
+
+    @classmethod
+    def get_field_names(cls, alias=False) -> list[str]:
+        """Return list of field names or aliases of this model"""
+        meta: ModelMeta = cls.get_metadata()
+        return list(meta.aliases if alias else meta.fields)
+
+    @classmethod
+    def get_properties(cls) -> list[str]:
+        """Return list of properties of this model that include properties
+        from parent classes.
+        """
+        return list(cls.get_metadata().properties)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self.clear_cached()
+
+    def __copy__(self: UpdatableT) -> UpdatableT:
+        # Note: the copy does not register to the children of this model, so
+        #   it does not keep the cached digest.
+        rs = super().__copy__()
+        rs.__dict__.pop("__fingerprint__", None)
+        return rs
+
+    def __deepcopy__(
+        self: UpdatableT, memo: Optional[dict[int, Any]] = None
+    ) -> UpdatableT:
+        rs = super().__deepcopy__(memo)
+        rs.__dict__.pop("__fingerprint__", None)
+        return rs
+
+    def clear_cached(self) -> None:
+        """Clear values of all cached properties and the fingerprint of this
+        model that was kept on the instance dict, and the fingerprints of the
+        models that keep this model.
+        """
+        self.__dict__.pop("__fingerprint__", None)
+        for name in self.get_metadata().cached:
+            self.__dict__.pop(name, None)
+        _clear_parents(self)
+
+    def fingerprint_digest(self) -> bytes:
+        """Return the digest of fields of this model that compute from the
+        cached digests of its nested models. The digest caches on this model
+        and registers to its mutable nested models that clear it when they
+        change, so the parent recomputes only when any nested model changes.
+        It does not cache if any nested model does not notice its changes.
+        """
+        if (digest := self.__dict__.get("__fingerprint__")) is not None:
+            return digest
+        parts: list[bytes] = []
+        children: list[BaseModel] = []
+        untracked: bool = _encode_fields(self, parts, children)
+        digest = _hash(b"".join(parts))
+        if not untracked:
+            self.__dict__["__fingerprint__"] = digest
+            for child in children:
+                _watch(child, self)
+        return digest
+
+    def fingerprint(self) -> str:
+        """Return the canonical fingerprint of this model that able to use as
+        the cache key. It will change when any field was assigned or updated,
+        but it does not detect the in-place change of non-model field values.
+        """
+        return self.fingerprint_digest().hex()
 
     def dict(
         self,
@@ -58,27 +624,91 @@ class BaseUpdatableModel(__BaseModel):
             exclude_defaults=exclude_defaults,
             **kwargs,
         )
-        props: list = self.get_properties()
+        props: tuple[str, ...] = self.get_metadata().properties
 
         # Include and exclude properties
         if include:
-            props: list = [prop for prop in props if prop in include]
+            props = tuple(prop for prop in props if prop in include)
         if exclude:
-            props: list = [prop for prop in props if prop not in exclude]
+            props = tuple(prop for prop in props if prop not in exclude)
 
         # Update the attribute dict with the properties
         if props:
             attribs.update({prop: getattr(self, prop) for prop in props})
         return attribs
 
-    def update(self, data: dict):
+    def get_dirty_fields(self) -> set[str]:
+        """Return set of field names that was changed by the update method."""
+        return set(self.__dict__.get("__dirty_fields__", ()))
+
+    def clear_dirty_fields(self) -> None:
+        """Clear the record of dirty fields."""
+        self.__dict__.pop("__dirty_fields__", None)
+
+    def update(self, data: dict, *, incremental: bool = False):
         """Updatable method for update data to existing model data.
         docs: https://github.com/pydantic/pydantic/discussions/3139
+
+        :param data: A mapping of field name or alias and its new value.
+        :param incremental: A flag that validate only the changed fields and
+            the fields that depend on it instead of the whole model.
         """
-        update = self.dict()
-        update.update(data)
-        for k, v in (
-            self.model_validate(update).dict(exclude_defaults=True).items()
-        ):
-            setattr(self, k, v)
+        meta: ModelMeta = self.get_metadata()
+        changes: dict[str, Any] = {
+            meta.alias_map.get(k, k): v for k, v in data.items()
+        }
+        if incremental:
+            self._update_incremental(
+                {k: v for k, v in changes.items() if k in meta.dependents}
+            )
+        else:
+            update: dict[str, Any] = self.model_dump()
+            update.update(changes)
+            validated = self.model_validate(update)
+
+            # Note: assign the validated values instead of its dump because
+            #   the dump with `exclude_defaults` drops the nested default
+            #   values like `type` of datatype.
+            for k in meta.fields:
+                setattr(self, k, validated.__dict__[k])
+
+        # Note: the record of dirty fields keep on the instance dict that does
+        #   not include on serialization and equality of pydantic model.
+        self.__dict__["__dirty_fields__"] = self.get_dirty_fields().union(
+            k for k in changes if k in meta.dependents
+        )
         return self
+
+    def _update_incremental(self, changes: dict) -> None:
+        """Validate only the changed fields and the fields that depend on them
+        on the shallow copy of this model, and apply the result to this model
+        in one step.
+        """
+        if not changes:
+            return
+        meta: ModelMeta = self.get_metadata()
+        fields: set[str] = set(changes)
+        stack: list[str] = list(changes)
+        while stack:
+            for dependent in meta.dependents[stack.pop()]:
+                if dependent not in fields:
+                    fields.add(dependent)
+                    stack.append(dependent)
+
+        copied = self.model_copy()
+        validator = self.__pydantic_validator__
+        for name in meta.fields:
+            if name not in fields:
+                continue
+            value: Any = (
+                changes[name]
+                if name in changes
+                # Note: dump the current value of dependent field for avoid
+                #   mutating the value that share with this model.
+                else copied.model_dump(include={name})[name]
+            )
+            validator.validate_assignment(copied, name, value)
+
+        self.__dict__.update(copied.__dict__)
+        self.__pydantic_fields_set__.update(changes)
+        self.clear_cached()
@@ -0,0 +1,153 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Benchmark runner for the benchmark suite that keep on the directory of
+modules, `bench_*.py`. Each benchmark is the function name `bench_*` that
+receive the size of synthetic catalog and return the callable object that will
+be timed, so the setup of each benchmark does not include on its timing.
+
+Example:
+    *   def bench_table_dump(tables: int, columns: int) -> Callable[[], Any]:
+            tbls = [Tbl.model_validate(t) for t in make_tables(tables, columns)]
+            return lambda: [t.model_dump() for t in tbls]
+
+Note:
+    If the callable object has the `items` attribute, a number of items that
+it processes on each call, the report will include the throughput of it.
+"""
+import importlib.util
+import platform
+import timeit
+from pathlib import Path
+from statistics import mean
+from typing import (
+    Any,
+    Callable,
+    Optional,
+)
+
+from . import __version__
+
+BenchFunc = Callable[[int, int], Callable[[], Any]]
+
+COLUMN_SPECS: tuple[str, ...] = (
+    "integer",
+    "bigint not null",
+    "varchar( 255 ) not null",
+    "varchar( 100 ) not null default 'N/A'",
+    "char( 2 ) unique not null",
+    "numeric( 19, 2 ) null",
+    "timestamp( 6 ) not null default current_timestamp",
+    "text",
+    "varchar( 20 ) not null default 'O' check( <name> <> 'test' )",
+)
+
+
+def make_tables(tables: int, columns: int) -> list[dict[str, Any]]:
+    """Make the list of synthetic raw table values that has one primary key
+    column and the other columns that use the common datatype strings.
+
+    Examples:
+        >>> t = make_tables(2, 3)
+        >>> [x["name"] for x in t]
+        ['table_0', 'table_1']
+        >>> t[0]["feature"][0]
+        {'name': 'id', 'dtype': 'integer primary key'}
+    """
+    return [
+        {
+            "name": f"table_{i}",
+            "feature": [{"name": "id", "dtype": "integer primary key"}]
+            + [
+                {
+                    "name": f"col_{j}",
+                    "dtype": COLUMN_SPECS[(i + j) % len(COLUMN_SPECS)],
+                }
+                for j in range(1, columns)
+            ],
+        }
+        for i in range(tables)
+    ]
+
+
+def discover(
+    path: Path,
+    keyword: Optional[str] = None,
+) -> dict[str, BenchFunc]:
+    """Discover benchmark functions from modules in the directory."""
+    benches: dict[str, BenchFunc] = {}
+    for file in sorted(Path(path).glob("bench_*.py")):
+        spec = importlib.util.spec_from_file_location(
+            f"_armored_bench_{file.stem}", file
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for name, func in vars(module).items():
+            if not (name.startswith("bench_") and callable(func)):
+                continue
+            key: str = name.removeprefix("bench_")
+            if keyword and keyword not in key:
+                continue
+            benches[key] = func
+    return benches
+
+
+def run(
+    benches: dict[str, BenchFunc],
+    *,
+    tables: int = 100,
+    columns: int = 20,
+    repeat: int = 5,
+    number: int = 1,
+) -> dict[str, Any]:
+    """Run benchmark functions and return the report that able to dump to
+    JSON.
+    """
+    results: dict[str, dict[str, float]] = {}
+    for name, bench in benches.items():
+        func: Callable[[], Any] = bench(tables, columns)
+        times: list[float] = [
+            t / number
+            for t in timeit.Timer(func).repeat(repeat=repeat, number=number)
+        ]
+        results[name] = {"min": min(times), "mean": mean(times)}
+        if (items := getattr(func, "items", None)) is not None:
+            results[name]["items_per_sec"] = items / min(times)
+    return {
+        "meta": {
+            "armored": __version__,
+            "python": platform.python_version(),
+            "tables": tables,
+            "columns": columns,
+            "repeat": repeat,
+            "number": number,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float = 0.2,
+) -> dict[str, float]:
+    """Compare the minimum time of the report with the baseline report and
+    return the ratio of benchmarks that slower than the threshold.
+
+    Examples:
+        >>> compare(
+        ...     {"results": {"a": {"min": 1.5}, "b": {"min": 1.0}}},
+        ...     {"results": {"a": {"min": 1.0}, "b": {"min": 1.0}}},
+        ... )
+        {'a': 1.5}
+    """
+    regressions: dict[str, float] = {}
+    for name, result in report["results"].items():
+        if name not in (base := baseline["results"]):
+            continue
+        ratio: float = result["min"] / base[name]["min"]
+        if ratio > 1 + threshold:
+            regressions[name] = ratio
+    return regressions
@@ -3,8 +3,28 @@
 # Licensed under the MIT License. See LICENSE in the project root for
 # license information.
 # ------------------------------------------------------------------------------
+import json
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
 import click
 
+# Note: the benchmark suite keeps on the source tree of the project and does
+#   not ship with the installed package, so it resolves from the package only
+#   if the package is on the source tree that has the project file.
+PROJECT_PATH: Path = Path(__file__).parent.parent
+
+
+def _bench_path() -> Optional[Path]:
+    """Return the benchmark suite of the source tree of this package, None if
+    the package was installed without its source tree.
+    """
+    path: Path = PROJECT_PATH / "tests" / "benchmarks"
+    if (PROJECT_PATH / "pyproject.toml").is_file() and path.is_dir():
+        return path
+    return None
+
 
 @click.group()
 def cli() -> None:
@@ -12,6 +32,88 @@ def cli() -> None:
     pass  # pragma: no cover.
 
 
+@cli.command("bench")
+@click.option(
+    "--path",
+    type=click.Path(file_okay=False, path_type=Path),
+    help=(
+        "A directory of benchmark modules, bench_*.py, it uses the benchmark "
+        "suite of the source tree by default and is required for the "
+        "installed package."
+    ),
+)
+@click.option("-k", "--keyword", help="Run only benchmarks that match.")
+@click.option("--tables", type=int, default=100, show_default=True)
+@click.option("--columns", type=int, default=20, show_default=True)
+@click.option("--repeat", type=int, default=5, show_default=True)
+@click.option("--number", type=int, default=1, show_default=True)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="A file path that write the JSON report.",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="A JSON report file that use to compare with this running.",
+)
+@click.option(
+    "--threshold",
+    type=float,
+    default=0.2,
+    show_default=True,
+    help="A ratio of slower time that allow before it fails.",
+)
+def bench(
+    path: Optional[Path],
+    keyword: Optional[str],
+    tables: int,
+    columns: int,
+    repeat: int,
+    number: int,
+    output: Optional[Path],
+    baseline: Optional[Path],
+    threshold: float,
+) -> None:
+    """Run the benchmark suite with synthetic catalogs and print the JSON
+    report.
+    """
+    from .bench import compare, discover, run
+
+    if path is None and (path := _bench_path()) is None:
+        raise click.UsageError(
+            "the benchmark suite does not ship with the installed package, "
+            "pass the directory of bench_*.py modules with --path"
+        )
+    if not path.is_dir():
+        raise click.BadParameter(
+            f"benchmark directory {str(path)!r} does not exist, pass the "
+            f"directory of bench_*.py modules with --path",
+            param_hint="'--path'",
+        )
+    report: dict[str, Any] = run(
+        discover(path, keyword=keyword),
+        tables=tables,
+        columns=columns,
+        repeat=repeat,
+        number=number,
+    )
+    click.echo(json.dumps(report, indent=2))
+    if output:
+        output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if baseline:
+        regressions: dict[str, float] = compare(
+            report,
+            json.loads(baseline.read_text(encoding="utf-8")),
+            threshold=threshold,
+        )
+        for name, ratio in regressions.items():
+            click.echo(f"Regression: {name} is x{ratio:.2f} of baseline")
+        if regressions:
+            sys.exit(1)
+
+
 def main() -> None:
     cli.main()
 
@@ -4,6 +4,7 @@
 # license information.
 # ------------------------------------------------------------------------------
 from typing import (
+    TYPE_CHECKING,
     Annotated,
     Any,
     Literal,
@@ -22,6 +23,9 @@ from pydantic.types import SecretStr
 from .__base import BaseUpdatableModel
 from .__types import CustomUrl, FileUrl
 
+if TYPE_CHECKING:
+    from .pool import Pool
+
 
 class BaseConn(BaseUpdatableModel):
     type: str = "base"
@@ -98,3 +102,11 @@ class DbConn(BaseConn):
     @field_validator("db")
     def check_db_name(cls, v: str) -> str:
         return v.lstrip("/").split("/")[0]
+
+    def pool(self) -> "Pool":
+        """Return the shared connection pool of this connection model, the
+        models that have the same fingerprint share the same pool.
+        """
+        from .pool import get_pool
+
+        return get_pool(self)
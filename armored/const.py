@@ -5,13 +5,16 @@
 # ------------------------------------------------------------------------------
 from typing import (
     Annotated,
+    Any,
     Optional,
 )
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .__base import BaseWatchedModel, fingerprint
 
-class Const(BaseModel):
+
+class Const(BaseWatchedModel):
     """Constraint Model"""
 
     of: Annotated[
@@ -27,6 +30,10 @@ class Const(BaseModel):
             )
         return f"{self.of}_const"
 
+    def fingerprint(self) -> str:
+        """Return the canonical fingerprint of this constraint."""
+        return fingerprint(self)
+
 
 class Pk(Const):
     """Primary Key Model.
@@ -54,7 +61,7 @@ class Pk(Const):
         raise ValueError("This primary key does not have any columns.")
 
 
-class Ref(BaseModel):
+class Ref(BaseWatchedModel):
     """Reference Model
 
     Examples:
@@ -68,6 +75,27 @@ class Ref(BaseModel):
     col: str
 
 
+def to_ref(value: Any) -> Optional[Ref]:
+    """Return the reference model from the reference value that able to be
+    `Ref` object or dict with `tbl` and `col` keys or `table` and `column`
+    keys. It will return None if the value does not reference.
+
+    Examples:
+        >>> to_ref({"table": "foo", "column": "bar"})
+        Ref(tbl='foo', col='bar')
+        >>> to_ref({}) is None
+        True
+    """
+    if isinstance(value, Ref):
+        return value
+    if isinstance(value, dict):
+        tbl: Any = value.get("tbl", value.get("table"))
+        col: Any = value.get("col", value.get("column"))
+        if isinstance(tbl, str) and isinstance(col, str):
+            return Ref(tbl=tbl, col=col)
+    return None
+
+
 class Fk(Const):
     """Foreign Key Model.
 
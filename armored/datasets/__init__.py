@@ -1,2 +1,33 @@
+from .bulk import TblError, validate_tables
+from .catalog import Catalog, Edge
+from .check import CheckError, Predicate, compile_check
 from .col import Col
 from .db import Tbl
+from .dictionary import DictColumn, encode_columns
+from .diff import (
+    Change,
+    Severity,
+    compare_dtype,
+    diff_catalog,
+    diff_col,
+    diff_tbl,
+    plan_migration,
+)
+from .fixed import FixedColumn
+from .kernels import Coerced, coerce, kernel_for
+from .lazy import LazyCols
+from .reader import (
+    Batch,
+    coerce_column,
+    convert_column,
+    iter_csv,
+    iter_json,
+)
+from .rows import Report, RowValidator, Violation, validate_rows
+from .snapshot import (
+    SnapshotError,
+    StaleSnapshotError,
+    load_snapshot,
+    save_snapshot,
+)
+from .unique import Duplicate, UniqueChecker, check_unique
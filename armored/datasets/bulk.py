@@ -0,0 +1,131 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from itertools import chain, islice
+from typing import (
+    Any,
+    Literal,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from pydantic import ValidationError
+
+from .db import Tbl
+
+
+class TblError(NamedTuple):
+    """Error record of the table that does not pass the validation on the
+    bulk validation.
+    """
+
+    index: int
+    error: ValidationError
+
+
+def _validate_chunk(
+    model: type[Tbl],
+    lazy: bool,
+    start: int,
+    chunk: list[Any],
+) -> list[Union[Tbl, TblError]]:
+    """Validate the chunk of raw table values and keep the error record
+    instead of raise it.
+    """
+    rs: list[Union[Tbl, TblError]] = []
+    for index, value in enumerate(chunk, start=start):
+        try:
+            rs.append(model.model_validate(value, context={"lazy": lazy}))
+        except ValidationError as err:
+            rs.append(TblError(index=index, error=err))
+    return rs
+
+
+def _chunks(values: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    it: Iterator[Any] = iter(values)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def validate_tables(
+    values: Iterable[Any],
+    *,
+    workers: Optional[int] = None,
+    mode: Literal["process", "thread"] = "process",
+    chunk_size: int = 256,
+    model: type[Tbl] = Tbl,
+    lazy: bool = False,
+) -> list[Union[Tbl, TblError]]:
+    """Validate the raw table values together with shard them to chunks and
+    pass each chunk to the pool of workers.
+
+    :param values: An iterable of raw table values that able to validate with
+        `model.model_validate`.
+    :param workers: A number of workers, it will use the number of CPU if
+        it does not set. The validation will run on the current process if
+        this value is 1.
+    :param mode: A pool mode of workers, `process` or `thread`.
+    :param chunk_size: A number of tables that pass to a worker per task.
+    :param model: A table model that use to validate, default be `Tbl`.
+    :param lazy: A flag that validate columns of each table on its first
+        access, the error of column validation will raise on that access.
+    :rtype: list[Union[Tbl, TblError]]
+    :returns: A list of validated tables or error records that keep the same
+        ordered of input values.
+
+    Examples:
+        >>> rs = validate_tables(
+        ...     [{"name": "foo"}, {"feature": []}],
+        ...     workers=1,
+        ... )
+        >>> rs[0].name
+        'foo'
+        >>> rs[1].index
+        1
+    """
+    if mode not in ("process", "thread"):
+        raise ValueError(f"mode of validation does not support for {mode!r}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be greater than 0")
+
+    workers = workers or os.cpu_count() or 1
+    chunks: list[list[Any]] = list(_chunks(values, chunk_size))
+    starts: list[int] = []
+    start: int = 0
+    for chunk in chunks:
+        starts.append(start)
+        start += len(chunk)
+
+    if workers == 1 or len(chunks) <= 1:
+        return list(
+            chain.from_iterable(
+                _validate_chunk(model, lazy, s, c)
+                for s, c in zip(starts, chunks)
+            )
+        )
+
+    pool: type[Executor] = (
+        ProcessPoolExecutor if mode == "process" else ThreadPoolExecutor
+    )
+    with pool(max_workers=min(workers, len(chunks))) as executor:
+        return list(
+            chain.from_iterable(
+                executor.map(
+                    _validate_chunk,
+                    [model] * len(chunks),
+                    [lazy] * len(chunks),
+                    starts,
+                    chunks,
+                )
+            )
+        )
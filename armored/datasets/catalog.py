@@ -0,0 +1,242 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+from collections import Counter, deque
+from functools import cached_property
+from typing import (
+    Annotated,
+    Any,
+    NamedTuple,
+)
+
+from pydantic import Field
+from pydantic.functional_validators import field_validator
+
+from ..__base import BaseUpdatableModel
+from .db import Tbl
+
+
+class Edge(NamedTuple):
+    """Foreign key edge from the column of table to the referenced column."""
+
+    tbl: str
+    col: str
+    ref_tbl: str
+    ref_col: str
+
+
+class Catalog(BaseUpdatableModel):
+    """Catalog Model that index tables by name and the foreign key edges
+    between them.
+
+    Note:
+        The indexes of this model will clear when any field was assigned or
+    updated, but it does not detect the in-place change of `objects`.
+
+    Examples:
+        *   {
+                "name": "warehouse",
+                "objects": [
+                    {
+                        "name": "customer",
+                        "feature": [
+                            {"name": "id", "dtype": "integer primary key"},
+                        ],
+                    },
+                    {
+                        "name": "order",
+                        "feature": [
+                            {
+                                "name": "customer_id",
+                                "dtype": "integer",
+                                "fk": {"tbl": "customer", "col": "id"},
+                            },
+                        ],
+                    },
+                ],
+            }
+    """
+
+    name: str
+    objects: Annotated[
+        list[Tbl],
+        Field(default_factory=list, description="Tables of this Catalog"),
+    ]
+
+    @field_validator("objects")
+    def prepare_objects(cls, value: list[Tbl]) -> list[Tbl]:
+        # RULE: name of tables in the same catalog does not duplicate
+        names: list[str] = [tbl.name for tbl in value]
+        if len(set(names)) != len(names):
+            duplicates: list[str] = [
+                name for name, count in Counter(names).items() if count > 1
+            ]
+            raise ValueError(f"name of tables was duplicated: {duplicates}")
+        return value
+
+    @cached_property
+    def tbl_index(self) -> dict[str, Tbl]:
+        """Return the index of table name and its table."""
+        return {tbl.name: tbl for tbl in self.objects}
+
+    @cached_property
+    def edges(self) -> tuple[Edge, ...]:
+        """Return all foreign key edges of tables in this catalog."""
+        return tuple(
+            dict.fromkeys(
+                Edge(tbl.name, col, ref.tbl, ref.col)
+                for tbl in self.objects
+                for col, ref in tbl.fk_refs()
+            )
+        )
+
+    @cached_property
+    def upstreams(self) -> dict[str, tuple[str, ...]]:
+        """Return the adjacency index of table name and the names of tables
+        that it references. It excludes the self reference and the reference
+        to table that does not exist in this catalog.
+        """
+        adj: dict[str, dict[str, None]] = {tbl.name: {} for tbl in self.objects}
+        for edge in self.edges:
+            if edge.ref_tbl != edge.tbl and edge.ref_tbl in adj:
+                adj[edge.tbl][edge.ref_tbl] = None
+        return {name: tuple(refs) for name, refs in adj.items()}
+
+    @cached_property
+    def downstreams(self) -> dict[str, tuple[str, ...]]:
+        """Return the adjacency index of table name and the names of tables
+        that reference it.
+        """
+        adj: dict[str, list[str]] = {tbl.name: [] for tbl in self.objects}
+        for name, refs in self.upstreams.items():
+            for ref in refs:
+                adj[ref].append(name)
+        return {name: tuple(refs) for name, refs in adj.items()}
+
+    def tbl(self, name: str) -> Tbl:
+        """Return the table of this catalog with its name.
+
+        :raises KeyError: If the table name does not exist in this catalog.
+        """
+        try:
+            return self.tbl_index[name]
+        except KeyError:
+            raise KeyError(
+                f"table {name!r} does not exist in {self.name!r}"
+            ) from None
+
+    def __contains__(self, name: Any) -> bool:
+        return name in self.tbl_index
+
+    def dangling(self) -> list[Edge]:
+        """Return list of foreign key edges that reference the table or column
+        that does not exist in this catalog.
+        """
+        return [
+            edge
+            for edge in self.edges
+            if edge.ref_tbl not in self.tbl_index
+            or edge.ref_col not in self.tbl_index[edge.ref_tbl]
+        ]
+
+    def cycles(self) -> list[list[str]]:
+        """Return list of table cycles that reference each other with the
+        iterative Tarjan's strongly connected components algorithm.
+        """
+        index: dict[str, int] = {}
+        low: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+        cycles: list[list[str]] = []
+        for root in self.upstreams:
+            if root in index:
+                continue
+            work: list[tuple[str, int]] = [(root, 0)]
+            while work:
+                node, i = work.pop()
+                if i == 0:
+                    index[node] = low[node] = len(index)
+                    stack.append(node)
+                    on_stack.add(node)
+                refs: tuple[str, ...] = self.upstreams[node]
+                if i < len(refs):
+                    work.append((node, i + 1))
+                    if (ref := refs[i]) not in index:
+                        work.append((ref, 0))
+                    elif ref in on_stack:
+                        low[node] = min(low[node], index[ref])
+                    continue
+                if low[node] == index[node]:
+                    component: list[str] = []
+                    while True:
+                        member: str = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1:
+                        cycles.append(component[::-1])
+                if work:
+                    parent: str = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+        return cycles
+
+    def waves(self) -> list[list[str]]:
+        """Return list of waves of table names that each table references
+        only tables in the previous waves, so tables in the same wave able to
+        create or load together.
+
+        :raises ValueError: If any tables reference each other with cycle.
+        """
+        degree: dict[str, int] = {
+            name: len(refs) for name, refs in self.upstreams.items()
+        }
+        wave: list[str] = [name for name, d in degree.items() if d == 0]
+        waves: list[list[str]] = []
+        while wave:
+            waves.append(wave)
+            following: list[str] = []
+            for name in wave:
+                for child in self.downstreams[name]:
+                    degree[child] -= 1
+                    if degree[child] == 0:
+                        following.append(child)
+            wave = following
+        if sum(len(w) for w in waves) != len(degree):
+            raise ValueError(
+                f"catalog {self.name!r} has cycles of tables: {self.cycles()}"
+            )
+        return waves
+
+    def order(self) -> list[str]:
+        """Return list of table names that ordered by its dependencies."""
+        return [name for wave in self.waves() for name in wave]
+
+    def _walk(
+        self,
+        name: str,
+        adj: dict[str, tuple[str, ...]],
+        recursive: bool,
+    ) -> list[str]:
+        if name not in adj:
+            raise KeyError(f"table {name!r} does not exist in {self.name!r}")
+        if not recursive:
+            return list(adj[name])
+        seen: dict[str, None] = {}
+        queue: deque[str] = deque(adj[name])
+        while queue:
+            if (node := queue.popleft()) in seen or node == name:
+                continue
+            seen[node] = None
+            queue.extend(adj[node])
+        return list(seen)
+
+    def upstream(self, name: str, recursive: bool = True) -> list[str]:
+        """Return list of table names that the table references."""
+        return self._walk(name, self.upstreams, recursive)
+
+    def downstream(self, name: str, recursive: bool = True) -> list[str]:
+        """Return list of table names that reference the table."""
+        return self._walk(name, self.downstreams, recursive)
@@ -0,0 +1,572 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Compiler of the check statement of column to the predicate that evaluates
+the whole batch of columns. The statement parses with the tokenizer and the
+recursive descent parser to the small tree of nodes, and each node compiles to
+the closure that returns the list of values of all rows, so it does not use
+`eval` on the statement.
+
+Grammar:
+    expr        := and_expr ( OR and_expr )*
+    and_expr    := not_expr ( AND not_expr )*
+    not_expr    := NOT not_expr | predicate
+    predicate   := operand [ cmp operand
+                           | IS [ NOT ] NULL
+                           | [ NOT ] IN ( literal [, literal]* )
+                           | [ NOT ] BETWEEN operand AND operand ]
+    operand     := literal | column | <name> | LENGTH ( expr ) | ( expr )
+    cmp         := = | == | <> | != | < | <= | > | >=
+
+Note:
+    The result follows the three-valued logic of SQL, the row violates the
+check only if its result is false, the NULL result passes the check.
+"""
+import operator
+import re
+from collections.abc import Mapping, Sequence
+from decimal import Decimal
+from functools import lru_cache
+from itertools import repeat
+from typing import (
+    Any,
+    Callable,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from ..settings import ColumnSetting
+from .reader import CONVERTERS
+
+Vector = Callable[[Mapping[str, Sequence[Any]], int], Sequence[Any]]
+
+TOKEN_PATTERN: re.Pattern = re.compile(
+    r"\s*(?:"
+    r"(?P<str>'(?:[^']|'')*')"
+    r"|(?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)"
+    r"|(?P<name><name>)"
+    r"|(?P<op><>|!=|<=|>=|==|=|<|>)"
+    r"|(?P<punct>[(),-])"
+    r"|(?P<ident>[A-Za-z_]\w*|\"(?:[^\"]|\"\")*\")"
+    r")"
+)
+CHECK_PATTERN: re.Pattern = re.compile(
+    r"^\s*check\s*\((?P<body>.*)\)\s*$", re.IGNORECASE | re.DOTALL
+)
+
+OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "<>": operator.ne,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+# Note: the operator that swaps its operands, `a < b` is `b > a`.
+SWAPS: dict[str, str] = {
+    "=": "=",
+    "==": "=",
+    "<>": "<>",
+    "!=": "<>",
+    "<": ">",
+    "<=": ">=",
+    ">": "<",
+    ">=": "<=",
+}
+# Note: the datatypes that compare only with the string literal and the
+#   converters of datatypes that compare with the number literal.
+STRING_DTYPES: frozenset[str] = frozenset({"string", "char", "varchar", "text"})
+NUMBER_CONVERTERS: tuple[Callable[[str], Any], ...] = (int, float, Decimal)
+KEYWORDS: frozenset[str] = frozenset(
+    {"and", "or", "not", "is", "null", "in", "between", "true", "false"}
+)
+FUNCTIONS: frozenset[str] = frozenset({"length", "char_length"})
+
+
+class CheckError(ValueError):
+    """Check statement that does not able to compile."""
+
+
+class Lit(NamedTuple):
+    """Literal node that keeps its value for fold the constant expression."""
+
+    value: Any
+
+
+Node = Union[Lit, Vector]
+
+
+def tokenize(text: str) -> list[tuple[str, str]]:
+    """Return list of kind and text of tokens of the check statement.
+
+    :raises CheckError: If the statement has the character that does not
+        match with any token.
+    """
+    tokens: list[tuple[str, str]] = []
+    pos: int = 0
+    end: int = len(text.rstrip())
+    while pos < end:
+        if not (m := TOKEN_PATTERN.match(text, pos)) or m.lastgroup is None:
+            raise CheckError(f"unexpected character on {pos}: {text!r}")
+        value: str = m.group(m.lastgroup)
+        kind: str = m.lastgroup
+        if kind == "ident" and value.lower() in (KEYWORDS | FUNCTIONS):
+            kind, value = "kw", value.lower()
+        tokens.append((kind, value))
+        pos = m.end()
+    return tokens
+
+
+def _vector(node: Node) -> Vector:
+    if isinstance(node, Lit):
+        value: Any = node.value
+        return lambda cols, size: [value] * size
+    return node
+
+
+def _compare(op: str, left: Node, right: Node) -> Node:
+    func: Callable[[Any, Any], bool] = OPERATORS[op]
+
+    def safe(x: Any, y: Any) -> Optional[bool]:
+        # Note: the values that do not able to compare, like the string and
+        #   the number, are unknown like NULL instead of raising the error in
+        #   the middle of the batch.
+        if x is None or y is None:
+            return None
+        try:
+            return func(x, y)
+        except TypeError:
+            return None
+
+    if isinstance(left, Lit) and isinstance(right, Lit):
+        return Lit(safe(left.value, right.value))
+    if isinstance(left, Lit):
+        return _compare(SWAPS[op], right, left)
+    if isinstance(right, Lit):
+        if (value := right.value) is None:
+            return Lit(None)
+
+        def compare_lit(cols, size):
+            xs = left(cols, size)
+            if None not in xs:
+                try:
+                    return list(map(func, xs, repeat(value)))
+                except TypeError:
+                    pass
+            return [safe(x, value) for x in xs]
+
+        return compare_lit
+
+    def compare(cols, size):
+        xs, ys = left(cols, size), right(cols, size)
+        if None not in xs and None not in ys:
+            try:
+                return list(map(func, xs, ys))
+            except TypeError:
+                pass
+        return list(map(safe, xs, ys))
+
+    return compare
+
+
+def _and(left: Node, right: Node) -> Node:
+    for a, b in ((left, right), (right, left)):
+        if isinstance(a, Lit):
+            if a.value is False:
+                return Lit(False)
+            if a.value is True:
+                return b
+    left, right = _vector(left), _vector(right)
+
+    def run(cols, size):
+        # Note: the values that are not boolean, like the column of integers,
+        #   take their truth value instead of the bitwise operator.
+        xs, ys = left(cols, size), right(cols, size)
+        if None not in xs and None not in ys:
+            return [bool(x and y) for x, y in zip(xs, ys)]
+        return [
+            (
+                False
+                if (x is not None and not x) or (y is not None and not y)
+                else None if x is None or y is None else True
+            )
+            for x, y in zip(xs, ys)
+        ]
+
+    return run
+
+
+def _or(left: Node, right: Node) -> Node:
+    for a, b in ((left, right), (right, left)):
+        if isinstance(a, Lit):
+            if a.value is True:
+                return Lit(True)
+            if a.value is False:
+                return b
+    left, right = _vector(left), _vector(right)
+
+    def run(cols, size):
+        xs, ys = left(cols, size), right(cols, size)
+        if None not in xs and None not in ys:
+            return [bool(x or y) for x, y in zip(xs, ys)]
+        return [
+            (
+                True
+                if (x is not None and x) or (y is not None and y)
+                else None if x is None or y is None else False
+            )
+            for x, y in zip(xs, ys)
+        ]
+
+    return run
+
+
+def _not(node: Node) -> Node:
+    if isinstance(node, Lit):
+        return Lit(None if node.value is None else not node.value)
+
+    def run(cols, size):
+        return [None if x is None else not x for x in node(cols, size)]
+
+    return run
+
+
+def _is_null(node: Node, negate: bool) -> Node:
+    if isinstance(node, Lit):
+        return Lit((node.value is None) is not negate)
+    if negate:
+        return lambda cols, size: [x is not None for x in node(cols, size)]
+    return lambda cols, size: [x is None for x in node(cols, size)]
+
+
+def _in(node: Node, values: list[Any]) -> Node:
+    # Note: the NULL on the list makes the result unknown instead of false.
+    miss: Optional[bool] = None if None in values else False
+    members: frozenset[Any] = frozenset(v for v in values if v is not None)
+    if isinstance(node, Lit):
+        if node.value is None:
+            return Lit(None)
+        return Lit(True if node.value in members else miss)
+
+    def run(cols, size):
+        return [
+            None if x is None else True if x in members else miss
+            for x in node(cols, size)
+        ]
+
+    return run
+
+
+def _length(node: Node) -> Node:
+    # Note: the length of the value that is not the string is unknown like
+    #   NULL instead of raising the error in the middle of the batch.
+    if isinstance(node, Lit):
+        return Lit(len(node.value) if isinstance(node.value, str) else None)
+
+    def run(cols, size):
+        xs = node(cols, size)
+        if None not in xs:
+            try:
+                return list(map(len, xs))
+            except TypeError:
+                pass
+        return [len(x) if isinstance(x, str) else None for x in xs]
+
+    return run
+
+
+def _column(name: str) -> Vector:
+    def run(cols, size):
+        return cols[name]
+
+    return run
+
+
+class Parser:
+    """Recursive descent parser of the check statement that compiles each
+    rule of grammar to the node of predicate.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        name: Optional[str] = None,
+        convert: Optional[Callable[[str], Any]] = None,
+        dtype: Optional[str] = None,
+    ) -> None:
+        self.text: str = text
+        self.tokens: list[tuple[str, str]] = tokenize(text)
+        self.pos: int = 0
+        self.name: Optional[str] = name
+        self.convert: Optional[Callable[[str], Any]] = convert
+        self.dtype: Optional[str] = dtype
+        self.columns: dict[str, None] = {}
+
+    def peek(self, offset: int = 0) -> tuple[str, str]:
+        if (pos := self.pos + offset) < len(self.tokens):
+            return self.tokens[pos]
+        return "end", ""
+
+    def accept(self, *values: str) -> bool:
+        if self.peek()[1] in values and self.peek()[0] in ("kw", "op", "punct"):
+            self.pos += 1
+            return True
+        return False
+
+    def expect(self, value: str) -> None:
+        if not self.accept(value):
+            raise self.error(f"expected {value!r}")
+
+    def error(self, message: str) -> CheckError:
+        kind, value = self.peek()
+        found: str = "end of statement" if kind == "end" else repr(value)
+        return CheckError(f"{message} but found {found}: {self.text!r}")
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise CheckError("check statement does not be empty")
+        node: Node = self.expr()
+        if self.peek()[0] != "end":
+            raise self.error("expected end of statement")
+        return node
+
+    def expr(self) -> Node:
+        node: Node = self.and_expr()
+        while self.accept("or"):
+            node = _or(node, self.and_expr())
+        return node
+
+    def and_expr(self) -> Node:
+        node: Node = self.not_expr()
+        while self.accept("and"):
+            node = _and(node, self.not_expr())
+        return node
+
+    def not_expr(self) -> Node:
+        if self.accept("not"):
+            return _not(self.not_expr())
+        return self.predicate()
+
+    def predicate(self) -> Node:
+        start: int = self.pos
+        target: bool = self.peek()[0] == "name"
+        node: Node = self.operand()
+        kind, value = self.peek()
+        if kind == "op":
+            self.pos += 1
+            if isinstance(node, Lit) and self.peek()[0] == "name":
+                # Note: the literal on the left of `<name>` converts with the
+                #   datatype of column the same as it is on the right.
+                end: int = self.pos
+                self.pos = start
+                node = self.operand(target=True)
+                self.pos = end
+            return _compare(value, node, self.operand(target))
+        if self.accept("is"):
+            negate: bool = self.accept("not")
+            self.expect("null")
+            return _is_null(node, negate)
+        negate = self.accept("not")
+        if self.accept("in"):
+            self.expect("(")
+            values: list[Any] = [self.literal(target)]
+            while self.accept(","):
+                values.append(self.literal(target))
+            self.expect(")")
+            rs: Node = _in(node, values)
+        elif self.accept("between"):
+            low: Node = self.operand(target)
+            self.expect("and")
+            high: Node = self.operand(target)
+            rs = _and(_compare(">=", node, low), _compare("<=", node, high))
+        elif negate:
+            raise self.error("expected 'in' or 'between'")
+        else:
+            return node
+        return _not(rs) if negate else rs
+
+    def operand(self, target: bool = False) -> Node:
+        kind, value = self.peek()
+        if kind in ("str", "num") or value in ("-", "null", "true", "false"):
+            return Lit(self.literal(target))
+        self.pos += 1
+        if kind == "name":
+            if self.name is None:
+                raise CheckError(
+                    f"check statement with <name> needs the column name: "
+                    f"{self.text!r}"
+                )
+            self.columns[self.name] = None
+            return _column(self.name)
+        if kind == "ident":
+            name: str = (
+                value[1:-1].replace('""', '"') if value[0] == '"' else value
+            )
+            self.columns[name] = None
+            return _column(name)
+        if value in FUNCTIONS:
+            self.expect("(")
+            if (
+                self.peek()[0] == "name"
+                and self.peek(1) == ("punct", ")")
+                and self.dtype in CONVERTERS
+            ):
+                raise CheckError(
+                    f"{value}() does not support the column of {self.dtype}: "
+                    f"{self.text!r}"
+                )
+            node: Node = self.expr()
+            self.expect(")")
+            return _length(node)
+        if value == "(":
+            node = self.expr()
+            self.expect(")")
+            return node
+        self.pos -= 1
+        raise self.error("expected operand")
+
+    def literal(self, target: bool = False) -> Any:
+        """Return the value of literal token, the string literal that compares
+        with the column of statement converts with its datatype.
+        """
+        kind, value = self.peek()
+        self.pos += 1
+        if kind == "str":
+            rs: str = value[1:-1].replace("''", "'")
+            if target and self.convert is not None:
+                try:
+                    return self.convert(rs)
+                except (ValueError, ArithmeticError):
+                    raise CheckError(
+                        f"literal {rs!r} does not convert to the datatype of "
+                        f"column: {self.text!r}"
+                    ) from None
+            return rs
+        if kind == "num":
+            return self.number(_number(value), target)
+        if value == "-" and self.peek()[0] == "num":
+            self.pos += 1
+            return self.number(-_number(self.tokens[self.pos - 1][1]), target)
+        if kind == "kw" and value in ("null", "true", "false"):
+            return {"null": None, "true": True, "false": False}[value]
+        self.pos -= 1
+        raise self.error("expected literal")
+
+    def number(
+        self, value: Union[int, Decimal], target: bool
+    ) -> Union[int, Decimal]:
+        """Return the number literal that compares with the column of
+        statement only if its datatype is the number.
+        """
+        if (
+            target
+            and self.dtype is not None
+            and (
+                self.dtype in STRING_DTYPES
+                or (
+                    self.dtype in CONVERTERS
+                    and CONVERTERS[self.dtype] not in NUMBER_CONVERTERS
+                )
+            )
+        ):
+            raise CheckError(
+                f"literal {value} does not compare with the column of "
+                f"{self.dtype}: {self.text!r}"
+            )
+        return value
+
+
+def _number(value: str) -> Union[int, Decimal]:
+    return int(value) if value.isdigit() else Decimal(value)
+
+
+class Predicate:
+    """Compiled predicate of the check statement that evaluates the mapping of
+    column name and its values of the batch.
+
+    Examples:
+        >>> p = compile_check("check( <name> between 1 and 10 )", "qty")
+        >>> p({"qty": [1, None, 11]})
+        [True, None, False]
+        >>> p.violations({"qty": [1, None, 11]})
+        [2]
+    """
+
+    def __init__(self, text: str, node: Node, columns: tuple[str, ...]):
+        self.text: str = text
+        self.columns: tuple[str, ...] = columns
+        self._node: Node = node
+
+    def __call__(
+        self,
+        columns: Mapping[str, Sequence[Any]],
+        size: Optional[int] = None,
+    ) -> list[Optional[bool]]:
+        """Return the result of each row of the batch, None for unknown."""
+        if size is None:
+            size = (
+                len(columns[self.columns[0]])
+                if self.columns
+                else len(next(iter(columns.values()), ()))
+            )
+        return list(_vector(self._node)(columns, size))
+
+    def violations(
+        self,
+        columns: Mapping[str, Sequence[Any]],
+        size: Optional[int] = None,
+    ) -> list[int]:
+        """Return positions of rows that its result is false."""
+        rs: list[Optional[bool]] = self(columns, size)
+        if all(rs):
+            return []
+        return [i for i, v in enumerate(rs) if v is not None and not v]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.text!r})"
+
+
+@lru_cache(maxsize=ColumnSetting.check_cache_size)
+def _compile(
+    text: str,
+    name: Optional[str],
+    dtype: Optional[str],
+) -> Predicate:
+    if m := CHECK_PATTERN.match(text):
+        text = m.group("body")
+    parser: Parser = Parser(
+        text.strip(),
+        name=name,
+        convert=CONVERTERS.get(dtype) if dtype else None,
+        dtype=dtype,
+    )
+    return Predicate(text.strip(), parser.parse(), tuple(parser.columns))
+
+
+def compile_check(
+    text: str,
+    name: Optional[str] = None,
+    dtype: Optional[str] = None,
+) -> Predicate:
+    """Compile the check statement with or without the `check( ... )` wrapper
+    to the predicate, the predicate caches by the statement, the column name,
+    and its datatype.
+
+    :param text: A check statement of the column.
+    :param name: A name of column that replaces the `<name>` on the statement.
+    :param dtype: A type of datatype of column that converts string literals
+        that compare with the `<name>` column.
+
+    :raises CheckError: If the statement does not able to compile.
+    """
+    return _compile(text, name, dtype)
+
+
+def compile_check_cache_clear() -> None:
+    """Clear the cache of compiled predicates."""
+    _compile.cache_clear()
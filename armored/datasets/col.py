@@ -3,7 +3,6 @@
 # Licensed under the MIT License. See LICENSE in the project root for
 # license information.
 # ------------------------------------------------------------------------------
-import re
 from typing import (
     Annotated,
     Any,
@@ -22,10 +21,9 @@ from ..const import Ref
 from ..dtype import Dtype
 from ..settings import ColumnSetting
 from ..utils import (
-    catch_str,
+    extract_column,
     extract_dtype,
     only_one,
-    split_dtype,
 )
 
 
@@ -42,7 +40,6 @@ class BaseCol(BaseUpdatableModel):
     dtype: Annotated[
         Dtype,
         Field(
-            union_mode="left_to_right",
             description="Data Type of Column",
             alias="DataType",
         ),
@@ -114,46 +111,10 @@ class Col(BaseCol):
 
     @classmethod
     def extract_column_from_dtype(cls, value: str) -> dict[str, Any]:
-        values: dict[str, Any] = {"nullable": False}
-        _dtype, _nullable = split_dtype(value)
-
-        # Remove unique value from datatype
-        _dtype, values["unique"] = catch_str(_dtype, key="unique")
-
-        # Remove primary key value from datatype
-        _dtype, values["pk"] = catch_str(_dtype, key="primary key")
-
-        # Rename serial value to int from datatype
-        _dtype, serial_flag = catch_str(_dtype, key="serial", replace="integer")
-
-        if "check" in _dtype:
-            if m := re.search(
-                r"check\s?\((?P<check>[^()]*(?:\(.*\))*[^()]*)\)",
-                _dtype,
-            ):
-                _dtype, values["check"] = catch_str(
-                    _dtype, m.group(), flag=False
-                )
-            else:
-                raise ValueError(
-                    "datatype with type string does not support for "
-                    "this format of check"
-                )
-
-        if re.search("default", _dtype):
-            _dtype, _default = _dtype.split("default", maxsplit=1)
-            values["dtype"] = _dtype.strip()
-            values["default"] = _default.strip()
-        else:
-            values["dtype"] = _dtype
-
-            if serial_flag:
-                _nullable: str = "not null"
-                values["default"] = "nextval('tablename_colname_seq')"
-
-        if not values["pk"]:
-            values["nullable"] = not re.search("not null", _nullable)
-        return values
+        """Extract column values from the datatype string. This method use the
+        cached single pass tokenizer, `extract_column`.
+        """
+        return extract_column(value)
 
     @model_validator(mode="before")
     def prepare_dtype(cls, values):
@@ -173,10 +134,14 @@ class Col(BaseCol):
         ):
             raise ValueError("dtype key does not contain in values")
 
+        # Note: copy the values before pop for does not change the input data.
+        values: dict[str, Any] = dict(values)
         pre_dtype: Any = values.pop(dtype_key)
         values_update: dict[str, Any] = {}
         if isinstance(pre_dtype, str):
-            values_update = cls.extract_column_from_dtype(pre_dtype)
+            # Note: pass the extracted dtype dict for skip parsing string again
+            #   on the `prepare_str2dtype` validator.
+            values_update = extract_column(pre_dtype, parse_dtype=True)
         else:
             values["dtype"] = pre_dtype
 
@@ -0,0 +1,557 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Columnar file format of the table that does not depend on any package. The
+file keeps row groups, one group per written batch, and each group keeps the
+typed buffers of each column that align to 8 bytes, and the footer keeps the
+schema of table and the statistics of each column.
+
+Layout:
+    MAGIC | buffers of group 0 | buffers of group 1 | ... | footer (JSON) |
+    footer size (uint64) | MAGIC
+
+Encodings:
+    *   plain   The typed array of values, the date keeps the number of days
+                and the time and timestamp keep the number of microseconds
+                since the epoch.
+    *   dict    The array of int32 codes and the dictionary of distinct
+                strings, the NULL code is -1.
+    *   text    The int64 offsets and the UTF-8 bytes of strings.
+
+Note:
+    The reader maps the file to memory and returns each buffer as the
+memoryview of the mapping without any copy, so all views should be released
+before it closes.
+
+    The timestamp without time zone keeps the wall-clock time of naive values
+and rejects the timezone-aware value with `ValueError` instead of converting it
+to UTC, because the converted value does not be the time that it writes. The
+timestamp with time zone keeps the aware value on UTC and the naive value as
+it is on UTC.
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from itertools import accumulate
+from pathlib import Path
+from types import TracebackType
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Optional,
+    Union,
+)
+
+from ..dtype import BaseType, StringType
+from .db import Tbl
+from .dictionary import DictColumn
+from .reader import CONVERTERS, Batch
+from .rows import Rows, to_columns
+
+MAGIC: bytes = b"ARMCOL\x00\x01"
+FORMAT_VERSION: int = 1
+TRAILER: struct.Struct = struct.Struct("<Q8s")
+ALIGN: int = 8
+
+# Note: the typecode of array of each datatype that keeps its values on the
+#   plain encoding.
+TYPECODES: dict[str, str] = {
+    "smallint": "h",
+    "short": "h",
+    "integer": "i",
+    "serial": "i",
+    "bigint": "q",
+    "long": "q",
+    "real": "f",
+    "float": "d",
+    "double precision": "d",
+    "date": "i",
+    "time": "q",
+    "timestamp": "q",
+    "datetime": "q",
+}
+
+EPOCH: datetime = datetime(1970, 1, 1)
+EPOCH_TZ: datetime = datetime(1970, 1, 1, tzinfo=timezone.utc)
+EPOCH_DAYS: int = date(1970, 1, 1).toordinal()
+
+
+def _days(value: date) -> int:
+    return value.toordinal() - EPOCH_DAYS
+
+
+def _micros(value: datetime) -> int:
+    delta: timedelta = value - (EPOCH_TZ if value.tzinfo else EPOCH)
+    return (
+        delta.days * 86_400 + delta.seconds
+    ) * 1_000_000 + delta.microseconds
+
+
+def _naive_micros(value: datetime) -> int:
+    if value.tzinfo is not None:
+        raise ValueError(
+            f"timezone-aware value {value.isoformat()!r} does not fit the "
+            f"timestamp without time zone"
+        )
+    return _micros(value)
+
+
+def _time_micros(value: time) -> int:
+    return (
+        (value.hour * 60 + value.minute) * 60 + value.second
+    ) * 1_000_000 + value.microsecond
+
+
+def _from_time_micros(value: int) -> time:
+    seconds, micros = divmod(value, 1_000_000)
+    minutes, second = divmod(seconds, 60)
+    return time(minutes // 60, minutes % 60, second, micros)
+
+
+# Note: the functions that encode the temporal values to integers and decode
+#   them back.
+ENCODERS: dict[str, Callable[[Any], int]] = {
+    "date": _days,
+    "time": _time_micros,
+    "timestamp": _micros,
+    "datetime": _micros,
+}
+DECODERS: dict[str, Callable[[int], Any]] = {
+    "date": lambda v: date.fromordinal(v + EPOCH_DAYS),
+    "time": _from_time_micros,
+    "timestamp": lambda v: EPOCH + timedelta(microseconds=v),
+    "datetime": lambda v: EPOCH + timedelta(microseconds=v),
+}
+
+
+def encoding_of(dtype: BaseType) -> str:
+    """Return the encoding of column of the datatype."""
+    if dtype.type in TYPECODES:
+        return "plain"
+    if isinstance(dtype, StringType):
+        return "dict"
+    return "text"
+
+
+def _encoder(dtype: BaseType) -> Optional[Callable[[Any], int]]:
+    if dtype.type in ("timestamp", "datetime") and not getattr(
+        dtype, "timezone", False
+    ):
+        return _naive_micros
+    return ENCODERS.get(dtype.type)
+
+
+def _decoder(dtype: BaseType) -> Optional[Callable[[Any], Any]]:
+    if getattr(dtype, "timezone", False):
+        return lambda v: EPOCH_TZ + timedelta(microseconds=v)
+    return DECODERS.get(dtype.type)
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _from_json(value: Any, dtype: BaseType) -> Any:
+    if isinstance(value, str) and dtype.type in CONVERTERS:
+        return CONVERTERS[dtype.type](value)
+    return value
+
+
+def _bitmap(
+    values: Sequence[Any],
+    nulls: Optional[Iterable[int]] = None,
+) -> bytes:
+    """Return the validity bitmap of values, the bit of NULL value is 0. The
+    positions of NULL values find from values if it does not pass.
+    """
+    bitmap: bytearray = bytearray(b"\xff" * ((len(values) + 7) // 8))
+    if nulls is None:
+        nulls = (i for i, v in enumerate(values) if v is None)
+    for i in nulls:
+        bitmap[i >> 3] &= ~(1 << (i & 7)) & 0xFF
+    return bytes(bitmap)
+
+
+def _null_positions(bitmap: Union[bytes, memoryview], size: int) -> list[int]:
+    """Return positions of NULL values of the validity bitmap, it visits only
+    the bytes that have any zero bit.
+    """
+    rs: list[int] = []
+    for i, byte in enumerate(bitmap):
+        if byte != 0xFF:
+            rs.extend(
+                i * 8 + bit
+                for bit in range(8)
+                if not byte >> bit & 1 and i * 8 + bit < size
+            )
+    return rs
+
+
+def _strings(values: Sequence[str]) -> tuple[array, bytes]:
+    encoded: list[bytes] = [v.encode() for v in values]
+    offsets: array = array("q", accumulate(map(len, encoded), initial=0))
+    return offsets, b"".join(encoded)
+
+
+class ColumnarWriter:
+    """Writer of the columnar file that writes each batch of rows as one row
+    group and writes the footer on close.
+
+    :param path: A path of the columnar file.
+    :param tbl: A table of the file.
+    """
+
+    def __init__(self, path: Union[str, Path], tbl: Tbl) -> None:
+        self.path: Union[str, Path] = path
+        self.tbl: Tbl = tbl
+        self.groups: list[dict[str, Any]] = []
+        self.rows: int = 0
+        self._file: BinaryIO = open(path, mode="wb")
+        self._file.write(MAGIC)
+        self._pos: int = len(MAGIC)
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+
+    def _buffer(self, data: Any) -> list[int]:
+        """Write the buffer with the padding and return its offset and size."""
+        size: int = memoryview(data).nbytes
+        offset: int = self._pos
+        self._file.write(data)
+        if padding := -size % ALIGN:
+            self._file.write(b"\x00" * padding)
+        self._pos += size + padding
+        return [offset, size]
+
+    def _strings(self, values: Sequence[str]) -> dict[str, list[int]]:
+        offsets, blob = _strings(values)
+        return {"offsets": self._buffer(offsets), "blob": self._buffer(blob)}
+
+    def _column(
+        self, name: str, dtype: BaseType, values: Sequence[Any]
+    ) -> dict[str, Any]:
+        encoding: str = encoding_of(dtype)
+        if encoding == "dict" and isinstance(values, DictColumn):
+            if values.encoded:
+                return self._dict_column(values)
+            values = values.plain
+        present: list[Any] = [v for v in values if v is not None]
+        nulls: int = len(values) - len(present)
+        meta: dict[str, Any] = {"encoding": encoding, "nulls": nulls}
+        if nulls:
+            meta["validity"] = self._buffer(_bitmap(values))
+
+        if encoding == "dict":
+            index: dict[str, int] = {}
+            codes: list[int] = [
+                -1 if v is None else index.setdefault(v, len(index))
+                for v in values
+            ]
+            meta["data"] = self._buffer(array("i", codes))
+            meta["values"] = self._strings(list(index))
+            present = list(index)
+        elif encoding == "text":
+            meta["data"] = self._strings(
+                ["" if v is None else str(v) for v in values]
+            )
+        else:
+            encode: Optional[Callable[[Any], int]] = _encoder(dtype)
+            if encode is not None:
+                try:
+                    filled: Sequence[Any] = [
+                        0 if v is None else encode(v) for v in values
+                    ]
+                except ValueError as err:
+                    raise ValueError(f"column {name!r}: {err}") from None
+            else:
+                filled = [0 if v is None else v for v in values]
+            try:
+                meta["data"] = self._buffer(
+                    array(TYPECODES[dtype.type], filled)
+                )
+            except (OverflowError, TypeError):
+                raise ValueError(
+                    f"values of column {name!r} does not fit {dtype.type}"
+                ) from None
+        if present:
+            meta["min"] = _to_json(min(present))
+            meta["max"] = _to_json(max(present))
+        return meta
+
+    def _dict_column(self, values: DictColumn) -> dict[str, Any]:
+        """Return the meta of the dictionary encoding column that writes its
+        codes and dictionary without encoding them again.
+        """
+        nulls: list[int] = values.null_rows()
+        meta: dict[str, Any] = {"encoding": "dict", "nulls": len(nulls)}
+        if nulls:
+            meta["validity"] = self._buffer(_bitmap(values, nulls))
+        meta["data"] = self._buffer(values.codes)
+        meta["values"] = self._strings(values.dictionary)
+        if values.dictionary:
+            meta["min"] = min(values.dictionary)
+            meta["max"] = max(values.dictionary)
+        return meta
+
+    def write(self, data: Rows) -> int:
+        """Write the batch of rows as one row group and return a number of
+        rows of the group.
+
+        :raises ValueError: If the batch does not have any column of table, or
+            any value does not fit its datatype.
+        """
+        names: list[str] = [col.name for col in self.tbl.feature]
+        _, columns = to_columns(data, names)
+        if not columns:
+            return 0
+        if missing := [name for name in names if name not in columns]:
+            raise ValueError(f"batch does not have columns {missing}")
+        if len(sizes := {len(columns[name]) for name in names}) > 1:
+            raise ValueError("columns of batch have different sizes")
+        size: int = sizes.pop() if sizes else 0
+        self.groups.append(
+            {
+                "rows": size,
+                "columns": {
+                    col.name: self._column(
+                        col.name, col.dtype, columns[col.name]
+                    )
+                    for col in self.tbl.feature
+                },
+            }
+        )
+        self.rows += size
+        return size
+
+    def close(self) -> None:
+        """Write the footer and close the file."""
+        if self._file.closed:
+            return
+        footer: bytes = json.dumps(
+            {
+                "version": FORMAT_VERSION,
+                "byteorder": sys.byteorder,
+                "rows": self.rows,
+                "fingerprint": self.tbl.fingerprint(),
+                "table": self.tbl.model_dump(),
+                "groups": self.groups,
+            },
+            default=str,
+        ).encode()
+        self._file.write(footer)
+        self._file.write(TRAILER.pack(len(footer), MAGIC))
+        self._file.close()
+
+
+class ColumnarReader:
+    """Reader of the columnar file that maps the file to memory and returns
+    the buffers of each column of each row group without any copy.
+
+    :param path: A path of the columnar file.
+
+    :raises ValueError: If the file is not the columnar file or its version
+        does not support.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path: Union[str, Path] = path
+        with open(path, mode="rb") as f:
+            if os.fstat(f.fileno()).st_size < len(MAGIC) + TRAILER.size:
+                raise ValueError("file is not the armored columnar file")
+            self._mmap: mmap.mmap = mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        mm: mmap.mmap = self._mmap
+        size, magic = TRAILER.unpack(mm[-TRAILER.size :])
+        if mm[: len(MAGIC)] != MAGIC or magic != MAGIC:
+            self._mmap.close()
+            raise ValueError("file is not the armored columnar file")
+        end: int = len(mm) - TRAILER.size
+        footer: dict[str, Any] = json.loads(mm[end - size : end])
+        if footer["version"] != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(
+                f"columnar file version {footer['version']} does not support"
+            )
+        self.footer: dict[str, Any] = footer
+        self.tbl: Tbl = Tbl.model_validate(footer["table"])
+        self.groups: list[dict[str, Any]] = footer["groups"]
+        self.rows: int = footer["rows"]
+        self._swap: bool = footer["byteorder"] != sys.byteorder
+        self._view: memoryview = memoryview(mm)
+
+    def __enter__(self) -> "ColumnarReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the mapping of file, the views of columns should be
+        released before.
+        """
+        if not self._mmap.closed:
+            self._view.release()
+            self._mmap.close()
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def _meta(self, name: str, group: int) -> dict[str, Any]:
+        if not 0 <= group < len(self.groups):
+            raise ValueError(f"columnar file does not have group {group}")
+        try:
+            return self.groups[group]["columns"][name]
+        except KeyError:
+            raise ValueError(f"columnar file does not have {name!r}") from None
+
+    def _slice(self, ref: list[int], typecode: str = "B") -> memoryview:
+        offset, size = ref
+        view: memoryview = self._view[offset : offset + size]
+        if typecode == "B":
+            return view
+        if self._swap:
+            # Note: the file of other byte order does not able to use without
+            #   the copy of swapped values.
+            values: array = array(typecode)
+            values.frombytes(view)
+            values.byteswap()
+            return memoryview(values)
+        return view.cast(typecode)
+
+    def column(self, name: str, group: int = 0) -> memoryview:
+        """Return the typed view of data of the column of the row group. It
+        is the values of plain encoding, the codes of dict encoding, or the
+        offsets of text encoding.
+        """
+        meta: dict[str, Any] = self._meta(name, group)
+        if meta["encoding"] == "dict":
+            return self._slice(meta["data"], "i")
+        if meta["encoding"] == "text":
+            return self._slice(meta["data"]["offsets"], "q")
+        return self._slice(
+            meta["data"], TYPECODES[self.tbl.col(name).dtype.type]
+        )
+
+    def validity(self, name: str, group: int = 0) -> Optional[memoryview]:
+        """Return the view of validity bitmap of the column of the row group,
+        or None if the column does not have any NULL value.
+        """
+        meta: dict[str, Any] = self._meta(name, group)
+        return self._slice(meta["validity"]) if "validity" in meta else None
+
+    def _texts(self, ref: dict[str, list[int]]) -> list[str]:
+        offsets: list[int] = self._slice(ref["offsets"], "q").tolist()
+        blob: bytes = bytes(self._slice(ref["blob"]))
+        return [
+            blob[start:end].decode() for start, end in zip(offsets, offsets[1:])
+        ]
+
+    def dictionary(self, name: str, group: int = 0) -> list[str]:
+        """Return the distinct strings of the dict encoding column of the row
+        group.
+        """
+        meta: dict[str, Any] = self._meta(name, group)
+        if meta["encoding"] != "dict":
+            raise ValueError(f"column {name!r} does not encode with dict")
+        return self._texts(meta["values"])
+
+    def stats(self, name: str) -> tuple[Any, Any]:
+        """Return the minimum and maximum values of the column of all row
+        groups, or None if all values are NULL.
+        """
+        dtype: BaseType = self.tbl.col(name).dtype
+        mins: list[Any] = []
+        maxs: list[Any] = []
+        for group in range(len(self.groups)):
+            meta: dict[str, Any] = self._meta(name, group)
+            if "min" in meta:
+                mins.append(_from_json(meta["min"], dtype))
+                maxs.append(_from_json(meta["max"], dtype))
+        return (min(mins), max(maxs)) if mins else (None, None)
+
+    def values(self, name: str, group: int = 0) -> list[Any]:
+        """Return the Python values of the column of the row group."""
+        meta: dict[str, Any] = self._meta(name, group)
+        dtype: BaseType = self.tbl.col(name).dtype
+        encoding: str = meta["encoding"]
+        if encoding == "dict":
+            table: list[str] = self.dictionary(name, group)
+            return [
+                None if code < 0 else table[code]
+                for code in self.column(name, group).tolist()
+            ]
+        if encoding == "text":
+            rs: list[Any] = self._texts(meta["data"])
+            if (convert := CONVERTERS.get(dtype.type)) is not None:
+                rs = [convert(v) if v else v for v in rs]
+        else:
+            rs = self.column(name, group).tolist()
+            if (decode := _decoder(dtype)) is not None:
+                rs = list(map(decode, rs))
+        if meta["nulls"]:
+            for i in _null_positions(
+                self._slice(meta["validity"]), self.groups[group]["rows"]
+            ):
+                rs[i] = None
+        return rs
+
+    def read(self, group: int = 0) -> Batch:
+        """Return the columnar batch of Python values of the row group."""
+        return Batch(
+            start=sum(g["rows"] for g in self.groups[:group]),
+            size=self.groups[group]["rows"],
+            columns={
+                col.name: self.values(col.name, group)
+                for col in self.tbl.feature
+            },
+        )
+
+    def __iter__(self) -> Iterator[Batch]:
+        return (self.read(group) for group in range(len(self.groups)))
+
+
+def write_columnar(
+    path: Union[str, Path],
+    tbl: Tbl,
+    batches: Union[Rows, Iterator[Rows]],
+) -> int:
+    """Write one batch or the iterator of batches of rows to the columnar file
+    and return a number of written rows.
+    """
+    with ColumnarWriter(path, tbl) as writer:
+        if isinstance(batches, Iterator):
+            for batch in batches:
+                writer.write(batch)
+        else:
+            writer.write(batches)
+    return writer.rows
@@ -3,21 +3,34 @@
 # Licensed under the MIT License. See LICENSE in the project root for
 # license information.
 # ------------------------------------------------------------------------------
-from typing import Annotated
+from collections import Counter
+from collections.abc import Sequence
+from functools import cached_property
+from typing import Annotated, Any, ClassVar
 
 from pydantic import (
     Field,
+    SerializerFunctionWrapHandler,
     ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    field_serializer,
 )
 from pydantic.functional_validators import field_validator
 
 from ..__base import BaseUpdatableModel
-from ..const import Fk, Pk
+from ..const import Fk, Pk, Ref, to_ref
 from .col import Col
+from .lazy import LazyCols
 
 
 class BaseTbl(BaseUpdatableModel):
-    """Base Table Model"""
+    """Base Table Model
+
+    Note:
+        The `feature` will be the `LazyCols` object that validate each column
+    on its first access if it passes `{"lazy": True}` to the validation
+    context, or use the `lazy` class method.
+    """
 
     name: str
     feature: Annotated[
@@ -28,10 +41,125 @@ class BaseTbl(BaseUpdatableModel):
         ),
     ]
 
+    @classmethod
+    def lazy(cls, obj: Any):
+        """Validate the table with the lazy columns."""
+        return cls.model_validate(obj, context={"lazy": True})
+
+    @field_validator("feature", mode="wrap")
+    def prepare_lazy_feature(
+        cls,
+        value: Any,
+        handler: ValidatorFunctionWrapHandler,
+        info: ValidationInfo,
+    ) -> Sequence[Col]:
+        if not isinstance(value, LazyCols):
+            value = (
+                LazyCols(value)
+                if (
+                    isinstance(value, list)
+                    and info.context
+                    and info.context.get("lazy")
+                )
+                else handler(value)
+            )
+
+        # RULE: name of columns in the same table does not duplicate
+        names: Sequence[str] = (
+            value.names
+            if isinstance(value, LazyCols)
+            else [col.name for col in value]
+        )
+        if len(set(names)) != len(names):
+            duplicates: list[str] = [
+                name for name, count in Counter(names).items() if count > 1
+            ]
+            raise ValueError(f"name of columns was duplicated: {duplicates}")
+        return value
+
+    @field_serializer("feature", mode="wrap")
+    def serialize_feature(
+        self,
+        value: Sequence[Col],
+        handler: SerializerFunctionWrapHandler,
+    ) -> Any:
+        if isinstance(value, LazyCols):
+            return handler(value.materialize())
+        return handler(value)
+
+    def col_names(self) -> list[str]:
+        """Return list of column names that does not validate the lazy
+        columns.
+        """
+        if isinstance(self.feature, LazyCols):
+            return list(self.feature.names)
+        return [col.name for col in self.feature]
+
+    @cached_property
+    def col_index(self) -> dict[str, int]:
+        """Return the index of column name and its position on the feature.
+        It will clear when any field of this table was changed.
+        """
+        return {name: i for i, name in enumerate(self.col_names())}
+
+    def _col_position(self, name: str) -> int:
+        """Return position of column name, it will rebuild the index if it
+        does not match with the feature that was changed in-place, like append
+        or replace the column.
+        """
+        pos: int = self.col_index.get(name, -1)
+        if (
+            pos != -1
+            and len(self.col_index) == len(self.feature)
+            and self._col_name_at(pos) == name
+        ):
+            return pos
+        # Note: the miss rebuilds the index once because the column that was
+        #   replaced in-place keeps the same size of the feature.
+        self.clear_cached()
+        return self.col_index.get(name, -1)
+
+    def _col_name_at(self, pos: int) -> str:
+        if isinstance(self.feature, LazyCols):
+            return self.feature.names[pos]
+        return self.feature[pos].name
+
+    def col(self, name: str) -> Col:
+        """Return the column of this table with its name.
+
+        :raises KeyError: If the column name does not exist in this table.
+        """
+        if (pos := self._col_position(name)) == -1:
+            raise KeyError(f"column {name!r} does not exist in {self.name!r}")
+        return self.feature[pos]
+
+    def __contains__(self, name: Any) -> bool:
+        return isinstance(name, str) and self._col_position(name) != -1
+
+    def cols_where(self, **conditions: Any) -> list[Col]:
+        """Return list of columns that all attributes match with conditions.
+
+        Examples:
+        *   tbl.cols_where(pk=True)
+        *   tbl.cols_where(nullable=False, unique=True)
+        """
+        if conditions == {"pk": True} and isinstance(self.feature, LazyCols):
+            return [self.col(name) for name in self.feature.pk_names]
+        return [
+            col
+            for col in self.feature
+            if all(getattr(col, k) == v for k, v in conditions.items())
+        ]
+
 
 class Tbl(BaseTbl):
     """Table Model"""
 
+    field_depends: ClassVar[dict[str, tuple[str, ...]]] = {
+        "pk": ("name", "feature"),
+        "fk": ("name",),
+    }
+
     pk: Annotated[
         Pk,
         Field(validate_default=True, description="Primary Key"),
@@ -41,6 +169,21 @@ class Tbl(BaseTbl):
         Field(default_factory=list, description="Foreign Key"),
     ]
 
+    def fk_refs(self) -> list[tuple[str, Ref]]:
+        """Return list of column name and its foreign key reference from the
+        foreign keys of this table and its columns.
+        """
+        refs: list[tuple[str, Ref]] = [(fk.to, fk.ref) for fk in self.fk]
+        if isinstance(self.feature, LazyCols):
+            refs.extend(self.feature.fk_refs)
+        else:
+            refs.extend(
+                (col.name, ref)
+                for col in self.feature
+                if (ref := to_ref(col.fk)) is not None
+            )
+        return refs
+
     @field_validator("pk")
     def prepare_pk_from_schemas(
         cls,
@@ -49,20 +192,25 @@ class Tbl(BaseTbl):
     ) -> Pk:
         # Note: we respect that `info.data` should contain schema before `pk`
         #   validation.
-        pks: list[str] = [
-            i.name for i in filter(lambda x: x.pk, info.data["feature"])
-        ]
+        # Note: `feature` or `name` does not exist in `info.data` if it does
+        #   not pass its validation.
+        feature: Sequence[Col] = info.data.get("feature", [])
+        pks: list[str] = (
+            list(feature.pk_names)
+            if isinstance(feature, LazyCols)
+            else [i.name for i in filter(lambda x: x.pk, feature)]
+        )
         if pks and not value.cols:
             # Note: pass primary key cols if `pk` does not set.
             value = Pk(cols=list(pks))
 
         # Note: change name of `pk` with parent Tbl class name
-        value.of = info.data["name"]
+        value.of = info.data.get("name")
         return value
 
     @field_validator("fk")
     def prepare_fk(cls, value: list[Fk], info: ValidationInfo) -> list[Fk]:
         # Note: change name of `fk` with parent Tbl class name
         for fk in value:
-            fk.of = info.data["name"]
+            fk.of = info.data.get("name")
         return value
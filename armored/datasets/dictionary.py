@@ -0,0 +1,207 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Dictionary encoding column of the string column that keeps the int32 code
+of each value and the dictionary of distinct values, so the column of status
+codes or country codes keeps each distinct string only once. The code of NULL
+is `-1`, the same as the dict encoding of the columnar file.
+
+Note:
+    The column falls back to the plain list of values when it has too many
+distinct values, because the dictionary of them does not save any memory and
+the rules of validator do not save any loop.
+"""
+from array import array
+from collections.abc import Iterator, Sequence
+from typing import (
+    Any,
+    Optional,
+    Union,
+    cast,
+    overload,
+)
+
+from ..dtype import StringType, TextType
+from ..settings import ColumnSetting
+from .col import Col
+
+NULL_CODE: int = -1
+
+# Note: the number of rows that the column keeps the dictionary before it
+#   checks the ratio of distinct values.
+SAMPLE_ROWS: int = 4_096
+
+
+class DictColumn(Sequence[Optional[str]]):
+    """Dictionary encoding column of the string column that able to extend
+    with batches of values. It acts as the sequence of values, so it passes to
+    the validator and the columnar writer that use its codes directly.
+
+    Examples:
+        >>> col = DictColumn(Col(name="status", dtype="varchar( 3 )"))
+        >>> col.extend(["new", "done", None, "new"])
+        >>> col.codes, col.dictionary
+        (array('i', [0, 1, -1, 0]), ['new', 'done'])
+        >>> col.length_violations()
+        [1]
+
+    :param col: A string column.
+    :param values: Values of the first batch.
+    :param max_distinct: A number of distinct values that it falls back to
+        the plain list.
+    :param max_ratio: A ratio of distinct values to rows that it falls back to
+        the plain list after the sample rows.
+
+    :raises ValueError: If the column does not be the string column.
+    """
+
+    def __init__(
+        self,
+        col: Col,
+        values: Optional[Sequence[Optional[str]]] = None,
+        *,
+        max_distinct: int = ColumnSetting.dict_max_distinct,
+        max_ratio: float = ColumnSetting.dict_max_ratio,
+    ) -> None:
+        if not isinstance(col.dtype, (StringType, TextType)):
+            raise ValueError(
+                f"column {col.name!r} of {col.dtype.type} does not be the "
+                f"string column"
+            )
+        self.col: Col = col
+        self.max_distinct: int = max_distinct
+        self.max_ratio: float = max_ratio
+        self.codes: array[int] = array("i")
+        self.dictionary: list[str] = []
+        self.plain: Optional[list[Optional[str]]] = None
+        self._index: dict[Optional[str], int] = {None: NULL_CODE}
+        if values is not None:
+            self.extend(values)
+
+    @property
+    def encoded(self) -> bool:
+        """Return True if the column keeps values with the dictionary."""
+        return self.plain is None
+
+    @property
+    def max_length(self) -> int:
+        return getattr(self.col.dtype, "max_length", -1)
+
+    def extend(self, values: Sequence[Optional[str]]) -> None:
+        """Append values to this column, it falls back to the plain list if
+        the distinct values exceed the limits.
+        """
+        if self.plain is not None:
+            self.plain.extend(values)
+            return
+        index: dict[Optional[str], int] = self._index
+        size: int = len(index)
+        # Note: the code of new value is the size of index before it inserts,
+        #   and the index has NULL, so the code starts from zero.
+        self.codes.extend([index.setdefault(v, len(index) - 1) for v in values])
+        if len(index) > size:
+            # Note: the new values are after the NULL key, so they are not None.
+            self.dictionary.extend(cast(list[str], list(index)[size:]))
+        distinct: int = len(self.dictionary)
+        if distinct > self.max_distinct or (
+            len(self.codes) >= SAMPLE_ROWS
+            and distinct > len(self.codes) * self.max_ratio
+        ):
+            self.plain = self.tolist()
+            self.codes, self.dictionary = array("i"), []
+            self._index = {None: NULL_CODE}
+
+    def __len__(self) -> int:
+        return len(self.codes) if self.plain is None else len(self.plain)
+
+    @overload
+    def __getitem__(self, index: int) -> Optional[str]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Optional[str]]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Optional[str], list[Optional[str]]]:
+        if self.plain is not None:
+            return self.plain[index]
+        if isinstance(index, slice):
+            return list(map(self._decode, self.codes[index]))
+        return self._decode(self.codes[index])
+
+    def _decode(self, code: int) -> Optional[str]:
+        return None if code == NULL_CODE else self.dictionary[code]
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return iter(self.tolist())
+
+    def __contains__(self, value: Any) -> bool:
+        if self.plain is not None:
+            return value in self.plain
+        if value is None:
+            return NULL_CODE in self.codes
+        return value in self._index
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(col={self.col.name!r}, "
+            f"size={len(self)}, distinct={len(self.dictionary)}, "
+            f"encoded={self.encoded})"
+        )
+
+    def tolist(self) -> list[Optional[str]]:
+        """Return the values of this column."""
+        if self.plain is not None:
+            return list(self.plain)
+        table: list[Optional[str]] = [*self.dictionary, None]
+        # Note: the code of NULL is the last item of the table.
+        return [table[code] for code in self.codes]
+
+    def rows_of(self, codes: Sequence[int]) -> list[int]:
+        """Return positions of rows that have any code of codes."""
+        if not codes:
+            return []
+        if len(codes) == 1:
+            code: int = codes[0]
+            return [i for i, c in enumerate(self.codes) if c == code]
+        found: frozenset[int] = frozenset(codes)
+        return [i for i, c in enumerate(self.codes) if c in found]
+
+    def null_rows(self) -> list[int]:
+        """Return positions of NULL values."""
+        if self.plain is not None:
+            return [i for i, v in enumerate(self.plain) if v is None]
+        return self.rows_of([NULL_CODE])
+
+    def length_violations(self) -> list[int]:
+        """Return positions of values that are longer than the max length of
+        the column, it checks the length once per distinct value.
+        """
+        if (max_length := self.max_length) < 0:
+            return []
+        if self.plain is not None:
+            return [
+                i
+                for i, v in enumerate(self.plain)
+                if v is not None and len(v) > max_length
+            ]
+        return self.rows_of(
+            [i for i, v in enumerate(self.dictionary) if len(v) > max_length]
+        )
+
+
+def encode_columns(
+    cols: Sequence[Col],
+    columns: dict[str, Sequence[Any]],
+    **kwargs: Any,
+) -> dict[str, Sequence[Any]]:
+    """Return the columns of batch that the string columns encode with the
+    dictionary, other columns keep as they are.
+    """
+    rs: dict[str, Sequence[Any]] = dict(columns)
+    for col in cols:
+        if col.name in rs and isinstance(col.dtype, (StringType, TextType)):
+            rs[col.name] = DictColumn(col, rs[col.name], **kwargs)
+    return rs
@@ -0,0 +1,380 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+from collections.abc import Iterable
+from enum import IntEnum
+from typing import (
+    Any,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from ..dtype import (
+    BaseType,
+    NumericType,
+    StringType,
+    TimestampType,
+)
+from .catalog import Catalog
+from .col import Col
+from .db import Tbl
+
+
+class Severity(IntEnum):
+    """Severity of the change that order from the safest change."""
+
+    ADDITIVE: int = 0
+    WIDENING: int = 1
+    BREAKING: int = 2
+
+
+class Change(NamedTuple):
+    """Change of table or column between two versions of table."""
+
+    action: str
+    severity: Severity
+    tbl: str
+    col: Optional[str] = None
+    attr: Optional[str] = None
+    before: Any = None
+    after: Any = None
+
+
+# Note: the phase of each action on the migration plan. The constraints drop
+#   before any table or column change and add after all of them.
+ACTIONS: dict[str, int] = {
+    "drop_fk": 0,
+    "drop_pk": 1,
+    "drop_table": 2,
+    "create_table": 3,
+    "add_column": 4,
+    "alter_column": 5,
+    "drop_column": 6,
+    "add_pk": 7,
+    "add_fk": 8,
+}
+
+# Note: the rank of integer types that the larger rank able to keep all values
+#   of the smaller rank, and number of decimal digits of its largest value.
+INTEGER_RANKS: dict[str, int] = {
+    "smallint": 0,
+    "short": 0,
+    "integer": 1,
+    "serial": 1,
+    "bigint": 2,
+    "long": 2,
+}
+INTEGER_DIGITS: tuple[int, ...] = (5, 10, 19)
+FLOAT_RANKS: dict[str, int] = {
+    "real": 0,
+    "float": 1,
+    "double precision": 1,
+}
+STRING_TYPES: frozenset[str] = frozenset({"string", "char", "varchar"})
+
+
+def _widen(widening: bool) -> Severity:
+    return Severity.WIDENING if widening else Severity.BREAKING
+
+
+def _numeric(before: NumericType, after: NumericType) -> Severity:
+    if after.precision == -1:
+        return Severity.WIDENING
+    if before.precision == -1:
+        return Severity.BREAKING
+    b_scale: int = max(before.scale, 0)
+    a_scale: int = max(after.scale, 0)
+    return _widen(
+        a_scale >= b_scale
+        and (after.precision - a_scale) >= (before.precision - b_scale)
+    )
+
+
+def compare_dtype(before: BaseType, after: BaseType) -> Optional[Severity]:
+    """Return severity of the change between two datatypes or None if they
+    are the same datatype. The widening change is the change that the new
+    datatype able to keep all values of the old datatype.
+
+    Examples:
+        >>> from armored.dtype import VarcharType, IntegerType
+        >>> compare_dtype(VarcharType(max_length=10), VarcharType())
+        <Severity.WIDENING: 1>
+        >>> compare_dtype(VarcharType(max_length=10), IntegerType())
+        <Severity.BREAKING: 2>
+    """
+    # Note: compare the instance dict instead of the model because the interned
+    #   datatype is the instance of the frozen model class.
+    if before.__dict__ == after.__dict__:
+        return None
+    b, a = before.type, after.type
+    if b in INTEGER_RANKS and a in INTEGER_RANKS:
+        return _widen(INTEGER_RANKS[a] >= INTEGER_RANKS[b])
+    if b in INTEGER_RANKS and isinstance(after, NumericType):
+        return _widen(
+            after.precision == -1
+            or (after.precision - max(after.scale, 0))
+            >= INTEGER_DIGITS[INTEGER_RANKS[b]]
+        )
+    if b in FLOAT_RANKS and a in FLOAT_RANKS:
+        return _widen(FLOAT_RANKS[a] >= FLOAT_RANKS[b])
+    if isinstance(before, NumericType) and isinstance(after, NumericType):
+        return _numeric(before, after)
+    if b in STRING_TYPES and a == "text":
+        return Severity.WIDENING
+    if isinstance(before, StringType) and isinstance(after, StringType):
+        # Note: the fixed length string does not widen from other strings
+        #   because it pads values with spaces.
+        if a == "char" and b != "char":
+            return Severity.BREAKING
+        if after.max_length == -1:
+            return Severity.WIDENING
+        return _widen(-1 < before.max_length <= after.max_length)
+    if isinstance(after, TimestampType):
+        if b == "date":
+            return Severity.WIDENING
+        if isinstance(before, TimestampType):
+            # Note: the default precision of timestamp is 6.
+            b_precision: int = 6 if before.precision == -1 else before.precision
+            a_precision: int = 6 if after.precision == -1 else after.precision
+            return _widen(
+                before.timezone == after.timezone and a_precision >= b_precision
+            )
+    return Severity.BREAKING
+
+
+def diff_col(tbl: str, before: Col, after: Col) -> list[Change]:
+    """Return list of changes of attributes between two versions of column.
+    The primary key and foreign key of column does not compare on this
+    function because they are the constraints of its table.
+    """
+    changes: list[Change] = []
+    name: str = after.name
+    if (severity := compare_dtype(before.dtype, after.dtype)) is not None:
+        changes.append(
+            Change(
+                "alter_column",
+                severity,
+                tbl,
+                name,
+                "dtype",
+                before.dtype,
+                after.dtype,
+            )
+        )
+    if before.nullable != after.nullable:
+        changes.append(
+            Change(
+                "alter_column",
+                _widen(after.nullable),
+                tbl,
+                name,
+                "nullable",
+                before.nullable,
+                after.nullable,
+            )
+        )
+    if before.unique != after.unique:
+        changes.append(
+            Change(
+                "alter_column",
+                _widen(not after.unique),
+                tbl,
+                name,
+                "unique",
+                before.unique,
+                after.unique,
+            )
+        )
+    if before.default != after.default:
+        changes.append(
+            Change(
+                "alter_column",
+                (
+                    Severity.BREAKING
+                    if after.default is None
+                    else Severity.ADDITIVE
+                ),
+                tbl,
+                name,
+                "default",
+                before.default,
+                after.default,
+            )
+        )
+    if before.check != after.check:
+        changes.append(
+            Change(
+                "alter_column",
+                _widen(after.check is None),
+                tbl,
+                name,
+                "check",
+                before.check,
+                after.check,
+            )
+        )
+    return changes
+
+
+def _fk_keys(tbl: Tbl) -> dict[tuple[str, str, str], None]:
+    return dict.fromkeys((col, ref.tbl, ref.col) for col, ref in tbl.fk_refs())
+
+
+def _add_constraints(tbl: Tbl) -> list[Change]:
+    changes: list[Change] = []
+    if tbl.pk.cols:
+        changes.append(
+            Change(
+                "add_pk", Severity.ADDITIVE, tbl.name, after=tuple(tbl.pk.cols)
+            )
+        )
+    changes.extend(
+        Change("add_fk", Severity.ADDITIVE, tbl.name, key[0], after=key[1:])
+        for key in _fk_keys(tbl)
+    )
+    return changes
+
+
+def diff_tbl(before: Tbl, after: Tbl) -> list[Change]:
+    """Return list of changes between two versions of table that match
+    columns by name.
+    """
+    if before == after:
+        return []
+    name: str = after.name
+    changes: list[Change] = []
+    b_cols: dict[str, Col] = {col.name: col for col in before.feature}
+    a_cols: dict[str, Col] = {col.name: col for col in after.feature}
+    for col_name, col in a_cols.items():
+        if (old := b_cols.get(col_name)) is None:
+            changes.append(
+                Change(
+                    "add_column",
+                    (
+                        Severity.ADDITIVE
+                        if col.nullable or col.default is not None
+                        else Severity.BREAKING
+                    ),
+                    name,
+                    col_name,
+                    after=col,
+                )
+            )
+        elif old != col:
+            changes.extend(diff_col(name, old, col))
+    changes.extend(
+        Change("drop_column", Severity.BREAKING, name, col_name, before=col)
+        for col_name, col in b_cols.items()
+        if col_name not in a_cols
+    )
+
+    b_pk, a_pk = tuple(before.pk.cols), tuple(after.pk.cols)
+    if b_pk != a_pk:
+        if b_pk:
+            changes.append(
+                Change("drop_pk", Severity.WIDENING, name, before=b_pk)
+            )
+        if a_pk:
+            changes.append(
+                Change("add_pk", Severity.BREAKING, name, after=a_pk)
+            )
+
+    b_fks, a_fks = _fk_keys(before), _fk_keys(after)
+    changes.extend(
+        Change("drop_fk", Severity.WIDENING, name, key[0], before=key[1:])
+        for key in b_fks
+        if key not in a_fks
+    )
+    changes.extend(
+        Change("add_fk", Severity.BREAKING, name, key[0], after=key[1:])
+        for key in a_fks
+        if key not in b_fks
+    )
+    return changes
+
+
+def _tables(tables: Union[Catalog, Iterable[Tbl]]) -> dict[str, Tbl]:
+    if isinstance(tables, Catalog):
+        return tables.tbl_index
+    return {tbl.name: tbl for tbl in tables}
+
+
+def diff_catalog(
+    before: Union[Catalog, Iterable[Tbl]],
+    after: Union[Catalog, Iterable[Tbl]],
+) -> list[Change]:
+    """Return list of changes between two versions of catalog that match
+    tables by name. The new table returns with the changes that add its
+    constraints for apply them after all tables were created.
+
+    Note: the foreign key of the kept table that still references a dropped
+        table returns with the change that drops it, because the table can
+        not drop while any foreign key references it.
+    """
+    b_tbls: dict[str, Tbl] = _tables(before)
+    a_tbls: dict[str, Tbl] = _tables(after)
+    dropped: set[str] = {name for name in b_tbls if name not in a_tbls}
+    changes: list[Change] = []
+    for name, tbl in a_tbls.items():
+        if (old := b_tbls.get(name)) is None:
+            changes.append(
+                Change("create_table", Severity.ADDITIVE, name, after=tbl)
+            )
+            changes.extend(_add_constraints(tbl))
+            continue
+        if old is not tbl:
+            changes.extend(diff_tbl(old, tbl))
+        if dropped:
+            a_fks: dict[tuple[str, str, str], None] = _fk_keys(tbl)
+            changes.extend(
+                Change(
+                    "drop_fk", Severity.WIDENING, name, key[0], before=key[1:]
+                )
+                for key in _fk_keys(old)
+                if key[1] in dropped and key in a_fks
+            )
+    for name, tbl in b_tbls.items():
+        if name in dropped:
+            changes.extend(
+                Change(
+                    "drop_fk", Severity.WIDENING, name, key[0], before=key[1:]
+                )
+                for key in _fk_keys(tbl)
+            )
+            changes.append(
+                Change("drop_table", Severity.BREAKING, name, before=tbl)
+            )
+    return changes
+
+
+def plan_migration(
+    before: Union[Catalog, Iterable[Tbl]],
+    after: Union[Catalog, Iterable[Tbl]],
+    *,
+    breaking: bool = True,
+) -> list[Change]:
+    """Return the migration plan, list of changes that order by its phase.
+    The constraints drop first, then tables and columns change, and the
+    constraints add at last, so each step does not depend on the following
+    step. The changes in the same phase keep the order of tables.
+
+    :param breaking: A flag that allow the breaking changes on the plan.
+    :raises ValueError: If it does not allow the breaking changes but the
+        plan has them.
+    """
+    changes: list[Change] = diff_catalog(before, after)
+    if not breaking and (
+        errors := [c for c in changes if c.severity == Severity.BREAKING]
+    ):
+        raise ValueError(
+            f"migration plan has {len(errors)} breaking changes: "
+            + ", ".join(
+                f"{c.action} {c.tbl}" + (f".{c.col}" if c.col else "")
+                for c in errors[:5]
+            )
+        )
+    # Note: the sorted function is stable, so it keeps the order of tables.
+    return sorted(changes, key=lambda c: ACTIONS[c.action])
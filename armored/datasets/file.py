@@ -3,10 +3,13 @@
 # Licensed under the MIT License. See LICENSE in the project root for
 # license information.
 # ------------------------------------------------------------------------------
-from typing import Literal
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Literal, Optional, Union
 
 from ..__base import BaseUpdatableModel
 from .col import Col
+from .reader import Batch, Errors, iter_csv, iter_json
 
 
 class BaseFl(BaseUpdatableModel):
@@ -26,11 +29,48 @@ class CsvFl(BaseFl):
     quote_char: str = '"'
     encoding: str = "utf-8"
 
+    def read(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        *,
+        chunk_size: int = 65_536,
+        errors: Errors = "raise",
+    ) -> Iterator[Batch]:
+        """Read the local CSV file with chunks of rows and yield the columnar
+        batch of each chunk. The path will be the name of this model if it
+        does not pass.
+        """
+        return iter_csv(
+            self, path or self.name, chunk_size=chunk_size, errors=errors
+        )
+
 
 class JsonFl(BaseFl):
-    """Json File Model"""
+    """Json File Model that able to be the JSON lines file, `ndjson`, or the
+    JSON file of the top-level array of objects, `array`.
+    """
 
     type: Literal["json"] = "json"
+    format: Literal["ndjson", "array"] = "ndjson"
+    feature: Optional[list[Col]] = None
+    encoding: str = "utf-8"
+
+    def read(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        *,
+        chunk_size: int = 65_536,
+        errors: Errors = "raise",
+    ) -> Iterator[Batch]:
+        """Read the local JSON file with chunks of objects and yield the
+        columnar batch of columns of the feature of each chunk. The path will
+        be the name of this model if it does not pass.
+
+        :raises ValueError: If this model does not have the feature.
+        """
+        return iter_json(
+            self, path or self.name, chunk_size=chunk_size, errors=errors
+        )
 
 
 class ParqFl(BaseFl):
@@ -0,0 +1,359 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Fixed-point column of the numeric datatype that keeps each value as the
+integer that scales by the scale of its datatype, so `12.34` of the column of
+`numeric( 19, 2 )` keeps as `1234`. The column that has precision until 18
+keeps its values on the int64 array, and the larger precision keeps them on
+the int64 array while they fit or on the list of Python integers.
+
+Note:
+    The parsing, formatting, sum, and comparison work on the scaled integers
+without any decimal object, so they are exact and do not depend on the context
+of `decimal`. The value that has fraction digits more than the scale rounds
+half up, the same as the numeric of SQL.
+"""
+import operator
+import re
+from array import array
+from collections.abc import Iterator, Sequence
+from decimal import (
+    MAX_EMAX,
+    MAX_PREC,
+    MIN_EMIN,
+    ROUND_FLOOR,
+    ROUND_HALF_UP,
+    Context,
+    Decimal,
+)
+from itertools import compress, repeat
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    Union,
+)
+
+from ..dtype import NumericType
+from .check import OPERATORS
+from .kernels import ERROR, NULL, VALID
+
+# Note: the largest precision that all scaled values fit the int64.
+INT64_PRECISION: int = 18
+
+NUMBER_PATTERN = re.compile(r"\s*([-+]?)([0-9]*)(?:\.([0-9]*))?\s*")
+
+# Note: the context that does not round any result, so the conversion between
+#   decimals and scaled integers does not depend on the current context.
+EXACT: Context = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+Scalar = Union[Decimal, int, str]
+
+
+def _parse(text: str, scale: int, digits: int) -> int:
+    """Return the scaled integer of the number string.
+
+    :raises ValueError: If the string does not be the finite number or its
+        integer part has more than the digits.
+    """
+    # Note: the common string that has all fraction digits of the scale
+    #   converts with one integer conversion.
+    whole, _, frac = text.partition(".")
+    if (
+        len(frac) == scale
+        and (not frac or frac.isdigit())
+        and whole.removeprefix("-").isdigit()
+    ):
+        return int(whole + frac)
+    if (match := NUMBER_PATTERN.fullmatch(text)) is None or not (
+        match.group(2) or match.group(3)
+    ):
+        # Note: the number that has the exponent parses with the decimal.
+        try:
+            return _from_decimal(Decimal(text), scale, digits)
+        except ArithmeticError:
+            raise ValueError(f"{text!r} is not the valid number") from None
+    sign, whole, frac = match.groups()
+    frac = frac or ""
+    if len(frac) > scale:
+        rs: int = int(whole + frac[:scale] or "0") + (frac[scale] >= "5")
+    else:
+        rs = int(whole + frac.ljust(scale, "0") or "0")
+    return -rs if sign == "-" else rs
+
+
+def _from_decimal(value: Union[Decimal, int], scale: int, digits: int) -> int:
+    """Return the scaled integer of the decimal or integer value.
+
+    :raises ValueError: If the decimal has more than the digits of its integer
+        part.
+    :raises ArithmeticError: If the decimal does not be finite.
+    """
+    if isinstance(value, int):
+        factor: int = 10**scale
+        return value * factor
+    # Note: the exact context builds the whole integer of the exponent, so the
+    #   value that overflows the precision rejects before it scales.
+    if value.is_finite() and value and value.adjusted() >= digits:
+        raise ValueError(f"{value!r} overflows the precision")
+    return int(
+        value.scaleb(scale, EXACT).quantize(
+            Decimal(1), rounding=ROUND_HALF_UP, context=EXACT
+        )
+    )
+
+
+def _format(value: int, scale: int) -> str:
+    """Return the number string of the scaled integer."""
+    if not scale:
+        return str(value)
+    digits: str = str(abs(value)).rjust(scale + 1, "0")
+    sign: str = "-" if value < 0 else ""
+    return f"{sign}{digits[:-scale]}.{digits[-scale:]}"
+
+
+class FixedColumn:
+    """Fixed-point column of the numeric or decimal datatype with the mask of
+    each value that is `VALID`, `NULL`, or `ERROR` like the coercion kernel.
+    The slot of NULL or error value keeps zero.
+
+    Examples:
+        >>> col = FixedColumn.parse(["1.25", "", "-0.5"], NumericType(
+        ...     precision=19, scale=2,
+        ... ))
+        >>> col.values, col.sum(), col.strings()
+        (array('q', [125, 0, -50]), Decimal('0.75'), ['1.25', None, '-0.50'])
+
+    :param dtype: A numeric datatype that has precision.
+    :param values: Scaled integers of values.
+    :param mask: A mask of values, all values are valid by default.
+
+    :raises ValueError: If the datatype does not have precision.
+    """
+
+    def __init__(
+        self,
+        dtype: NumericType,
+        values: Optional[Sequence[int]] = None,
+        mask: Optional[bytearray] = None,
+    ) -> None:
+        if dtype.precision < 0:
+            raise ValueError(
+                "numeric datatype without precision does not have fixed point"
+            )
+        self.dtype: NumericType = dtype
+        self.scale: int = max(dtype.scale, 0)
+        self.bound: int = 10**dtype.precision
+        self.values: Union[array[int], list[int]] = self.storage(values or [])
+        self.mask: bytearray = (
+            bytearray(len(self.values)) if mask is None else mask
+        )
+        if len(self.mask) != len(self.values):
+            raise ValueError("mask and values have different sizes")
+
+    def storage(self, values: Sequence[int]) -> Union["array[int]", list[int]]:
+        """Return the storage of scaled integers of this datatype. The larger
+        precision keeps its values on the int64 array while all of them fit,
+        like `numeric( 19, 2 )` that rarely uses its largest values.
+        """
+        try:
+            return array("q", values)
+        except OverflowError:
+            if self.dtype.precision <= INT64_PRECISION:
+                raise
+            return list(values)
+
+    @classmethod
+    def parse(
+        cls,
+        values: Sequence[Optional[str]],
+        dtype: NumericType,
+    ) -> "FixedColumn":
+        """Parse the column of number strings, the empty string or None is
+        NULL, and the string that does not be the number or overflows the
+        precision is the error.
+        """
+        return cls._build(values, dtype, _parse)
+
+    @classmethod
+    def from_values(
+        cls,
+        values: Sequence[Optional[Union[Decimal, int]]],
+        dtype: NumericType,
+    ) -> "FixedColumn":
+        """Convert the column of decimals or integers, None is NULL."""
+        return cls._build(values, dtype, _from_decimal)
+
+    @classmethod
+    def _build(
+        cls,
+        values: Sequence[Any],
+        dtype: NumericType,
+        convert: Callable[[Any, int, int], int],
+    ) -> "FixedColumn":
+        rs: FixedColumn = cls(dtype)
+        scale, bound = rs.scale, rs.bound
+        digits: int = dtype.precision - scale
+        scaled: list[int] = [0] * len(values)
+        mask: bytearray = bytearray(len(values))
+        for i, v in enumerate(values):
+            if v is None or v == "":
+                mask[i] = NULL
+                continue
+            try:
+                x: int = convert(v, scale, digits)
+            except (ValueError, ArithmeticError):
+                mask[i] = ERROR
+                continue
+            if -bound < x < bound:
+                scaled[i] = x
+            else:
+                mask[i] = ERROR
+        rs.values, rs.mask = rs.storage(scaled), mask
+        return rs
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Optional[Decimal]:
+        if self.mask[index]:
+            return None
+        return self.decimal(self.values[index])
+
+    def __iter__(self) -> Iterator[Optional[Decimal]]:
+        return iter(self.tolist())
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(dtype={self.dtype.type}"
+            f"( {self.dtype.precision}, {self.scale} ), size={len(self)})"
+        )
+
+    @property
+    def nulls(self) -> int:
+        return self.mask.count(NULL)
+
+    @property
+    def errors(self) -> int:
+        return self.mask.count(ERROR)
+
+    @property
+    def complete(self) -> bool:
+        """Return True if all values are valid."""
+        return self.mask.count(VALID) == len(self.mask)
+
+    def decimal(self, value: int) -> Decimal:
+        """Return the decimal of the scaled integer."""
+        return Decimal(value).scaleb(-self.scale, EXACT)
+
+    def scaled(self, value: Scalar) -> Decimal:
+        """Return the exact scaled value of the scalar that able to have
+        fraction digits more than the scale.
+        """
+        return Decimal(value).scaleb(self.scale, EXACT)
+
+    def _valid(self) -> Iterator[int]:
+        if self.complete:
+            return iter(self.values)
+        return compress(self.values, map(operator.not_, self.mask))
+
+    def tolist(self) -> list[Optional[Decimal]]:
+        """Return the decimals of this column, None for the NULL and error
+        values.
+        """
+        rs: list[Optional[Decimal]] = list(map(self.decimal, self.values))
+        if not self.complete:
+            for i, m in enumerate(self.mask):
+                if m:
+                    rs[i] = None
+        return rs
+
+    def strings(self) -> list[Optional[str]]:
+        """Return the number strings of this column with all digits of the
+        scale, None for the NULL and error values.
+        """
+        rs: list[Optional[str]] = list(
+            map(_format, self.values, repeat(self.scale))
+        )
+        if not self.complete:
+            for i, m in enumerate(self.mask):
+                if m:
+                    rs[i] = None
+        return rs
+
+    def sum(self) -> Optional[Decimal]:
+        """Return the exact sum of valid values, None if it does not have any
+        valid value. The sum does not overflow, the same as the sum of SQL
+        that widens its result.
+        """
+        if self.complete:
+            return self.decimal(sum(self.values)) if self.values else None
+        if self.mask.count(VALID) == 0:
+            return None
+        # Note: the slot of NULL and error value keeps zero.
+        return self.decimal(sum(self.values))
+
+    def min(self) -> Optional[Decimal]:
+        """Return the minimum of valid values."""
+        rs: Optional[int] = min(self._valid(), default=None)
+        return None if rs is None else self.decimal(rs)
+
+    def max(self) -> Optional[Decimal]:
+        """Return the maximum of valid values."""
+        rs: Optional[int] = max(self._valid(), default=None)
+        return None if rs is None else self.decimal(rs)
+
+    def compare(
+        self,
+        op: str,
+        other: Union[Scalar, "FixedColumn"],
+    ) -> list[Optional[bool]]:
+        """Return the result of comparison of each value with the scalar or
+        the value of other column at the same position, None for the NULL and
+        error values like the three-valued logic of SQL.
+
+        :param op: A comparison operator like `=`, `<>`, `<`, or `>=`.
+        :param other: A scalar or the fixed-point column of the same size.
+
+        :raises ValueError: If the operator does not support or the other
+            column has the different size.
+        """
+        if (func := OPERATORS.get(op)) is None:
+            raise ValueError(f"operator {op!r} does not support")
+        mask: bytearray = self.mask
+        if isinstance(other, FixedColumn):
+            if len(other) != len(self):
+                raise ValueError("columns have different sizes")
+            left: Sequence[int] = self.values
+            right: Sequence[int] = other.values
+            if (shift := other.scale - self.scale) > 0:
+                left = [v * 10**shift for v in left]
+            elif shift < 0:
+                right = [v * 10**-shift for v in right]
+            rs: list[Optional[bool]] = list(map(func, left, right))
+            if not other.complete:
+                mask = bytearray(map(operator.or_, mask, other.mask))
+        else:
+            rs = self._compare_scalar(op, self.scaled(other))
+        if mask.count(VALID) != len(mask):
+            for i, m in enumerate(mask):
+                if m:
+                    rs[i] = None
+        return rs
+
+    def _compare_scalar(self, op: str, value: Decimal) -> list[Optional[bool]]:
+        bound: int = int(
+            value.to_integral_value(rounding=ROUND_FLOOR, context=EXACT)
+        )
+        if bound != value:
+            # Note: the scalar that has fraction digits more than the scale
+            #   does not equal any value, and the value that is greater than
+            #   its floor is greater than the scalar.
+            if op in ("=", "=="):
+                return [False] * len(self)
+            if op in ("<>", "!="):
+                return [True] * len(self)
+            op = {"<": "<=", ">=": ">"}.get(op, op)
+        return list(map(OPERATORS[op], self.values, repeat(bound)))
@@ -0,0 +1,285 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Coercion kernels of datatypes that convert the whole column of raw strings
+to the storage values of its datatype at once. Each kernel checks the storage
+rules of its datatype, like the range of integer, the precision and scale of
+numeric, the precision of timestamp, and the max length of string, and returns
+the values with the mask of NULL and error values.
+
+Storages:
+    *   integer     The array of 2, 4, or 8 bytes integers.
+    *   float       The array of 4 or 8 bytes floats.
+    *   date        The array of int32 days since the epoch.
+    *   time        The array of int64 microseconds since midnight.
+    *   timestamp   The array of int64 microseconds since the epoch, on UTC
+                    for the timestamp with time zone.
+    *   numeric     The list of decimals that round to its scale.
+    *   string      The list of strings.
+
+Note:
+    The kernel picks once per column with `kernel_for`, so the datatype does
+not check on each value. The empty string is NULL the same as the CSV reader.
+
+    The timestamp without time zone keeps the wall-clock time of naive values,
+and the value that has the offset is the error instead of converting it to
+UTC, the same as the columnar writer. The timestamp with time zone converts
+the value that has the offset to UTC and keeps the naive value as UTC.
+"""
+from array import array
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from ..dtype import (
+    BaseType,
+    NumericType,
+    StringType,
+    TimestampType,
+    frozen_dtype,
+)
+from .columnar import TYPECODES, _decoder, _encoder, _micros
+from .reader import CONVERTERS
+from .rows import INTEGER_RANGES
+
+VALID: int = 0
+NULL: int = 1
+ERROR: int = 2
+
+# Note: the largest finite value of 4 bytes float.
+REAL_MAX: float = 3.4028234663852886e38
+
+Values = Union["array[Any]", list[Any]]
+
+
+class Coerced(NamedTuple):
+    """Coerced column with the storage values of its datatype and the mask of
+    each value that is `VALID`, `NULL`, or `ERROR`. The slot of NULL or error
+    value keeps zero or None.
+    """
+
+    dtype: BaseType
+    values: Values
+    mask: bytearray
+
+    @property
+    def nulls(self) -> int:
+        return self.mask.count(NULL)
+
+    @property
+    def errors(self) -> int:
+        return self.mask.count(ERROR)
+
+    def error_rows(self) -> list[int]:
+        """Return positions of values that do not coerce."""
+        return _positions(self.mask, ERROR)
+
+    def tolist(self) -> list[Any]:
+        """Return the Python values of this column, None for the NULL and
+        error values.
+        """
+        rs: list[Any] = (
+            self.values.tolist()
+            if isinstance(self.values, array)
+            else list(self.values)
+        )
+        if isinstance(self.values, array):
+            if (decode := _decoder(self.dtype)) is not None:
+                rs = list(map(decode, rs))
+        if self.mask.count(VALID) != len(self.mask):
+            for i, m in enumerate(self.mask):
+                if m:
+                    rs[i] = None
+        return rs
+
+
+Kernel = Callable[[Sequence[str]], Coerced]
+
+
+def _positions(mask: bytearray, code: int) -> list[int]:
+    rs: list[int] = []
+    pos: int = mask.find(code)
+    while pos != -1:
+        rs.append(pos)
+        pos = mask.find(code, pos + 1)
+    return rs
+
+
+def _kernel(
+    dtype: BaseType,
+    parse: Callable[[str], Any],
+    check: Optional[Callable[[Any], bool]] = None,
+    typecode: Optional[str] = None,
+    bulk_check: Optional[Callable[[list[Any]], bool]] = None,
+) -> Kernel:
+    """Return the kernel that parses each value with the parser and checks it
+    with the check function. The kernel tries the fast path that maps the
+    parser over all values and checks them with the bulk check first, and it
+    visits each value only if the fast path fails.
+    """
+    fill: Any = None if typecode is None else 0
+
+    def store(rs: list[Any]) -> Values:
+        return rs if typecode is None else array(typecode, rs)
+
+    def kernel(values: Sequence[str]) -> Coerced:
+        mask: bytearray = bytearray(len(values))
+        if "" not in values:
+            try:
+                rs: list[Any] = list(map(parse, values))
+                if bulk_check is None or bulk_check(rs):
+                    return Coerced(dtype, store(rs), mask)
+            except (ValueError, TypeError, ArithmeticError):
+                pass
+
+        rs = [fill] * len(values)
+        for i, v in enumerate(values):
+            if not v:
+                mask[i] = NULL
+                continue
+            try:
+                x: Any = parse(v)
+            except (ValueError, TypeError, ArithmeticError):
+                mask[i] = ERROR
+                continue
+            if check is None or check(x):
+                rs[i] = x
+            else:
+                mask[i] = ERROR
+        return Coerced(dtype, store(rs), mask)
+
+    return kernel
+
+
+def _integer(dtype: BaseType) -> Kernel:
+    low, high = INTEGER_RANGES[dtype.type]
+    return _kernel(
+        dtype,
+        int,
+        check=lambda x: low <= x <= high,
+        typecode=TYPECODES[dtype.type],
+        bulk_check=lambda rs: not rs or (low <= min(rs) and max(rs) <= high),
+    )
+
+
+def _float(dtype: BaseType) -> Kernel:
+    if dtype.type == "real":
+        # Note: the value that overflows the 4 bytes float is the error, but
+        #   the infinity and NaN keep as they are.
+        def check(x: float) -> bool:
+            return abs(x) <= REAL_MAX or x != x or abs(x) == float("inf")
+
+        return _kernel(
+            dtype,
+            float,
+            check=check,
+            typecode="f",
+            bulk_check=lambda rs: all(map(check, rs)),
+        )
+    return _kernel(dtype, float, typecode=TYPECODES[dtype.type])
+
+
+def _numeric(dtype: NumericType) -> Kernel:
+    if dtype.precision < 0:
+        return _kernel(dtype, Decimal)
+    scale: int = max(dtype.scale, 0)
+    quantum: Decimal = Decimal(1).scaleb(-scale)
+    bound: Decimal = Decimal(10) ** (dtype.precision - scale)
+
+    def parse(value: str) -> Decimal:
+        rs: Decimal = Decimal(value)
+        # Note: round the value to its scale with the same rounding of SQL.
+        rs = rs.quantize(quantum, rounding=ROUND_HALF_UP)
+        if not -bound < rs < bound:
+            raise ValueError("numeric value overflows its precision")
+        return rs
+
+    return _kernel(dtype, parse)
+
+
+def _timestamp(dtype: TimestampType) -> Kernel:
+    precision: int = 6 if dtype.precision == -1 else dtype.precision
+    step: int = 10 ** (6 - precision)
+
+    def parse(value: str) -> int:
+        rs: datetime = datetime.fromisoformat(value)
+        if rs.tzinfo is None:
+            if dtype.timezone:
+                rs = rs.replace(tzinfo=timezone.utc)
+        elif not dtype.timezone:
+            raise ValueError("timestamp without time zone has the offset")
+        micros: int = _micros(rs)
+        if step > 1:
+            micros = (micros + step // 2) // step * step
+        return micros
+
+    return _kernel(dtype, parse, typecode="q")
+
+
+def _string(dtype: BaseType) -> Kernel:
+    max_length: int = getattr(dtype, "max_length", -1)
+    if max_length < 0:
+        return _kernel(dtype, str)
+    return _kernel(
+        dtype,
+        str,
+        check=lambda x: len(x) <= max_length,
+        bulk_check=lambda rs: max(map(len, rs), default=0) <= max_length,
+    )
+
+
+@lru_cache(maxsize=256)
+def _kernel_for(dtype: BaseType) -> Kernel:
+    if dtype.type in INTEGER_RANGES:
+        return _integer(dtype)
+    if dtype.type in ("float", "real", "double precision"):
+        return _float(dtype)
+    if isinstance(dtype, NumericType):
+        return _numeric(dtype)
+    if isinstance(dtype, TimestampType):
+        return _timestamp(dtype)
+    if (encode := _encoder(dtype)) is not None:
+        parse: Callable[[str], Any] = CONVERTERS[dtype.type]
+        return _kernel(
+            dtype, lambda v: encode(parse(v)), typecode=TYPECODES[dtype.type]
+        )
+    if isinstance(dtype, StringType):
+        return _string(dtype)
+    return _kernel(dtype, str)
+
+
+def kernel_for(dtype: BaseType) -> Kernel:
+    """Return the coercion kernel of the datatype, the kernel caches by the
+    frozen copy of the datatype, so the equal datatypes share the same kernel
+    without interning them.
+
+    Examples:
+        >>> from armored.dtype import SmallIntType
+        >>> rs = kernel_for(SmallIntType())(["1", "", "x", "99999"])
+        >>> rs.values, list(rs.mask)
+        (array('h', [1, 0, 0, 0]), [0, 1, 2, 2])
+    """
+    model: type[BaseType] = frozen_dtype(type(dtype))
+    if type(dtype) is not model:
+        dtype = model.model_construct(dtype.model_fields_set, **dtype.__dict__)
+    try:
+        return _kernel_for(dtype)
+    except TypeError:
+        # Note: the custom datatype that has unhashable values does not able
+        #   to cache its kernel.
+        return _kernel_for.__wrapped__(dtype)
+
+
+def coerce(values: Sequence[str], dtype: BaseType) -> Coerced:
+    """Coerce the column of raw strings with the kernel of its datatype."""
+    return kernel_for(dtype)(values)
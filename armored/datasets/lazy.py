@@ -0,0 +1,141 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+from collections.abc import Iterable, Iterator, Sequence
+from typing import (
+    Any,
+    Optional,
+    Union,
+    overload,
+)
+
+from pydantic import TypeAdapter
+
+from ..const import Ref, to_ref
+from ..settings import ColumnSetting
+from ..utils import extract_column, only_one
+from .col import Col
+
+# Note: the lax boolean adapter that coerce the raw primary key flag with the
+#   same rule of the `Col.pk` field, such as "false" or "0" is False.
+BOOL_ADAPTER: TypeAdapter[bool] = TypeAdapter(bool)
+
+
+def _raw_name(value: Any) -> str:
+    """Return the prepared name of raw column values without validation."""
+    if isinstance(value, Col):
+        return value.name
+    if isinstance(value, dict):
+        name: Any = value.get("name", value.get("ColumnName"))
+        if isinstance(name, str):
+            return "".join(name.strip().split())
+    raise ValueError("column values does not contain string name")
+
+
+def _raw_pk(value: Any) -> bool:
+    """Return the primary key flag of raw column values without validation.
+    It uses the cached column specification parser for the string datatype.
+    """
+    if isinstance(value, Col):
+        return value.pk
+    for key in ("pk", "PrimaryKey"):
+        if key in value:
+            return BOOL_ADAPTER.validate_python(value[key])
+    if dtype_key := only_one(value, ColumnSetting.dtype, default=False):
+        if isinstance(dtype := value[dtype_key], str):
+            return extract_column(dtype)["pk"]
+    return False
+
+
+def _raw_fk(value: Any) -> Optional[Ref]:
+    """Return the foreign key reference of raw column values without
+    validation.
+    """
+    if isinstance(value, Col):
+        return to_ref(value.fk)
+    return to_ref(value.get("fk", value.get("ForeignKey")))
+
+
+class LazyCols(Sequence):
+    """Sequence of columns that keep the raw column values and validate each
+    value to the `Col` model on its first access. The names, primary key
+    names, and foreign key references of columns are available without any
+    validation.
+
+    Examples:
+        >>> cols = LazyCols(
+        ...     [
+        ...         {"name": "id", "dtype": "integer primary key"},
+        ...         {"name": "name", "dtype": "varchar( 256 )"},
+        ...     ]
+        ... )
+        >>> cols.names, cols.pk_names, cols.materialized
+        (('id', 'name'), ('id',), 0)
+        >>> cols[1].dtype.max_length, cols.materialized
+        (256, 1)
+    """
+
+    def __init__(self, values: Iterable[Any]) -> None:
+        self._raws: list[Any] = list(values)
+        self._cols: list[Optional[Col]] = [None] * len(self._raws)
+        self.names: tuple[str, ...] = tuple(_raw_name(v) for v in self._raws)
+        self.pk_names: tuple[str, ...] = tuple(
+            name
+            for name, value in zip(self.names, self._raws)
+            if _raw_pk(value)
+        )
+        self.fk_refs: tuple[tuple[str, Ref], ...] = tuple(
+            (name, ref)
+            for name, value in zip(self.names, self._raws)
+            if (ref := _raw_fk(value)) is not None
+        )
+
+    def _get(self, index: int) -> Col:
+        if (col := self._cols[index]) is None:
+            raw: Any = self._raws[index]
+            col = raw if isinstance(raw, Col) else Col.model_validate(raw)
+            self._cols[index] = col
+
+            # Note: release the raw values after validation.
+            self._raws[index] = None
+        return col
+
+    @overload
+    def __getitem__(self, index: int) -> Col: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Col]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Col, list[Col]]:
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self)))]
+        return self._get(range(len(self))[index])
+
+    def __len__(self) -> int:
+        return len(self._cols)
+
+    def __iter__(self) -> Iterator[Col]:
+        for i in range(len(self)):
+            yield self._get(i)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (LazyCols, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(names={list(self.names)}, "
+            f"materialized={self.materialized})"
+        )
+
+    @property
+    def materialized(self) -> int:
+        """Return a number of columns that was validated."""
+        return sum(col is not None for col in self._cols)
+
+    def materialize(self) -> list[Col]:
+        """Validate all columns and return the list of them."""
+        return list(self)
@@ -0,0 +1,508 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Streaming readers of the file models that read the local file with chunks
+of rows and convert each chunk to the columnar batch with the datatype of
+each column, so the memory usage bounds by the chunk size.
+"""
+import csv
+import json
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date, datetime, time
+from decimal import Decimal
+from itertools import islice
+from pathlib import Path
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Literal,
+    NamedTuple,
+    Union,
+)
+
+from ..dtype import BaseType, NumericType
+from .col import Col
+
+if TYPE_CHECKING:
+    from .file import CsvFl, JsonFl
+
+Errors = Literal["raise", "null"]
+
+# Note: the map of datatype and the function that convert the string value to
+#   its Python value. The datatype that does not exist on this map keeps the
+#   string value.
+CONVERTERS: dict[str, Callable[[str], Any]] = {
+    "integer": int,
+    "smallint": int,
+    "bigint": int,
+    "short": int,
+    "long": int,
+    "serial": int,
+    "numeric": Decimal,
+    "decimal": Decimal,
+    "float": float,
+    "real": float,
+    "double precision": float,
+    "date": date.fromisoformat,
+    "time": time.fromisoformat,
+    "timestamp": datetime.fromisoformat,
+    "datetime": datetime.fromisoformat,
+}
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, bool):
+        raise ValueError("boolean is not integer")
+    if isinstance(value, (float, Decimal)):
+        if value != int(value):
+            raise ValueError("number is not integer")
+        return int(value)
+    return int(value)
+
+
+def _to_decimal(value: Any) -> Decimal:
+    if isinstance(value, bool):
+        raise ValueError("boolean is not numeric")
+    if isinstance(value, float):
+        return Decimal(repr(value))
+    return Decimal(value)
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, bool):
+        raise ValueError("boolean is not float")
+    return float(value)
+
+
+def _to_str(value: Any) -> str:
+    if isinstance(value, (dict, list, bool)):
+        return json.dumps(value)
+    return str(value)
+
+
+def _parser(parse: Callable[[str], Any]) -> Callable[[Any], Any]:
+    def rs(value: Any) -> Any:
+        if not isinstance(value, str):
+            raise ValueError("temporal value should be string")
+        return parse(value)
+
+    return rs
+
+
+# Note: the map of datatype and the function that coerce the decoded JSON value
+#   to its Python value, and the map of datatype and the types of values that
+#   do not need the coercion. The datatype that does not exist on this map
+#   coerces to string.
+COERCERS: dict[str, Callable[[Any], Any]] = {
+    **{k: _to_int for k, v in CONVERTERS.items() if v is int},
+    "numeric": _to_decimal,
+    "decimal": _to_decimal,
+    "float": _to_float,
+    "real": _to_float,
+    "double precision": _to_float,
+    **{
+        k: _parser(v)
+        for k, v in CONVERTERS.items()
+        if k in ("date", "time", "timestamp", "datetime")
+    },
+}
+NATIVE_TYPES: dict[str, frozenset[type]] = {
+    **{
+        k: frozenset({int, type(None)})
+        for k, v in COERCERS.items()
+        if v is _to_int
+    },
+    "numeric": frozenset({Decimal, type(None)}),
+    "decimal": frozenset({Decimal, type(None)}),
+    "float": frozenset({float, type(None)}),
+    "real": frozenset({float, type(None)}),
+    "double precision": frozenset({float, type(None)}),
+    "date": frozenset({date, type(None)}),
+    "time": frozenset({time, type(None)}),
+    "timestamp": frozenset({datetime, type(None)}),
+    "datetime": frozenset({datetime, type(None)}),
+}
+STRING_TYPES: frozenset[type] = frozenset({str, type(None)})
+WHITESPACE: re.Pattern = re.compile(r"[ \t\n\r]*")
+
+
+class Batch(NamedTuple):
+    """Columnar batch of rows that keep values of each column on the list
+    with its position of the first row on the file.
+    """
+
+    start: int
+    size: int
+    columns: dict[str, list[Any]]
+
+    def rows(self) -> Iterator[tuple[Any, ...]]:
+        """Return the iterator of rows of this batch."""
+        return zip(*self.columns.values())
+
+
+def convert_column(
+    values: Sequence[str],
+    dtype: BaseType,
+    *,
+    errors: Errors = "raise",
+    start: int = 0,
+    name: str = "",
+) -> list[Any]:
+    """Convert the string values of column to the values of its datatype with
+    one loop. The empty string converts to None.
+
+    :raises ValueError: If any value does not convert to its datatype and the
+        errors mode is `raise`.
+
+    Examples:
+        >>> from armored.dtype import IntegerType
+        >>> convert_column(["1", "", "3"], IntegerType())
+        [1, None, 3]
+    """
+    func: Callable[[str], Any] = CONVERTERS.get(dtype.type, str)
+    if func is str:
+        return [v if v else None for v in values]
+    try:
+        if "" not in values:
+            return list(map(func, values))
+        return [func(v) if v else None for v in values]
+    except (ValueError, ArithmeticError):
+        pass
+
+    rs: list[Any] = []
+    for i, v in enumerate(values):
+        try:
+            rs.append(func(v) if v else None)
+        except (ValueError, ArithmeticError):
+            if errors == "raise":
+                raise ValueError(
+                    f"value {v!r} of column {name!r} on row {start + i} does "
+                    f"not convert to {dtype.type}"
+                ) from None
+            rs.append(None)
+    return rs
+
+
+def coerce_column(
+    values: Sequence[Any],
+    dtype: BaseType,
+    *,
+    errors: Errors = "raise",
+    start: int = 0,
+    name: str = "",
+) -> list[Any]:
+    """Coerce the decoded JSON values of column to the values of its datatype.
+    The values that already be the Python type of datatype keep as they are.
+
+    :raises ValueError: If any value does not coerce to its datatype and the
+        errors mode is `raise`.
+
+    Examples:
+        >>> from armored.dtype import IntegerType, DateType
+        >>> coerce_column([1, "2", None, 3.0], IntegerType())
+        [1, 2, None, 3]
+        >>> coerce_column(["2024-01-01"], DateType())
+        [datetime.date(2024, 1, 1)]
+    """
+    native: frozenset[type] = NATIVE_TYPES.get(dtype.type, STRING_TYPES)
+    kinds: set[type] = set(map(type, values))
+    if native.issuperset(kinds):
+        return list(values)
+    if STRING_TYPES.issuperset(kinds) and dtype.type in CONVERTERS:
+        # Note: the values are strings only, so it able to use the converter
+        #   of string on one loop.
+        convert: Callable[[str], Any] = CONVERTERS[dtype.type]
+        try:
+            return [None if v is None else convert(v) for v in values]
+        except (ValueError, ArithmeticError):
+            pass
+    func: Callable[[Any], Any] = COERCERS.get(dtype.type, _to_str)
+    rs: list[Any] = []
+    for i, v in enumerate(values):
+        if type(v) in native:
+            rs.append(v)
+            continue
+        try:
+            rs.append(func(v))
+        except (ValueError, TypeError, ArithmeticError):
+            if errors == "raise":
+                raise ValueError(
+                    f"value {v!r} of column {name!r} on row {start + i} does "
+                    f"not convert to {dtype.type}"
+                ) from None
+            rs.append(None)
+    return rs
+
+
+def _skip_footer(records: Iterable[list[str]], n: int) -> Iterator[list[str]]:
+    """Yield records except the last n records with the look-ahead buffer of
+    n records.
+    """
+    buffer: deque[list[str]] = deque()
+    for record in records:
+        buffer.append(record)
+        if len(buffer) > n:
+            yield buffer.popleft()
+
+
+def _normalize(name: str) -> str:
+    return "".join(name.strip().split())
+
+
+def iter_csv(
+    fl: "CsvFl",
+    path: Union[str, Path],
+    *,
+    chunk_size: int = 65_536,
+    errors: Errors = "raise",
+) -> Iterator[Batch]:
+    """Yield the columnar batches of the CSV file with the options of the CSV
+    file model.
+
+    Note:
+        The comment line is the line that starts with the comment character,
+    and the `skip_rows` skips the first lines of the file before the header.
+
+    :param fl: A CSV file model.
+    :param path: A path of the local file.
+    :param chunk_size: A number of rows of each batch.
+    :param errors: A mode of the value that does not convert to its datatype,
+        `raise` for raise ValueError or `null` for convert it to None.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size should be positive")
+    feature: list[Col] = list(fl.feature)
+    with open(path, encoding=fl.encoding, newline="") as f:
+        for _ in range(fl.skip_rows):
+            if not f.readline():
+                return
+        lines: Iterable[str] = (
+            (line for line in f if not line.startswith(fl.comment))
+            if fl.comment
+            else f
+        )
+        reader = csv.reader(
+            lines,
+            delimiter=fl.sep,
+            quotechar=fl.quote_char or None,
+            quoting=csv.QUOTE_MINIMAL if fl.quote_char else csv.QUOTE_NONE,
+        )
+        # Note: skip the blank lines that the reader returns the empty list.
+        records: Iterator[list[str]] = filter(None, reader)
+        if fl.header:
+            if (header := next(records, None)) is None:
+                return
+            index: dict[str, int] = {
+                _normalize(name): i for i, name in enumerate(header)
+            }
+            if missing := [c.name for c in feature if c.name not in index]:
+                raise ValueError(f"header of csv does not contain {missing}")
+            positions: list[int] = [index[c.name] for c in feature]
+            width: int = len(header)
+        else:
+            positions = list(range(len(feature)))
+            width = len(feature)
+        if fl.skip_footer:
+            records = _skip_footer(records, fl.skip_footer)
+
+        start: int = 0
+        while rows := list(islice(records, chunk_size)):
+            if set(map(len, rows)) != {width}:
+                i: int = next(i for i, r in enumerate(rows) if len(r) != width)
+                raise ValueError(
+                    f"row {start + i} has {len(rows[i])} fields, "
+                    f"it should have {width} fields"
+                )
+            values: list[tuple[str, ...]] = list(zip(*rows))
+            yield Batch(
+                start=start,
+                size=len(rows),
+                columns={
+                    col.name: convert_column(
+                        values[pos],
+                        col.dtype,
+                        errors=errors,
+                        start=start,
+                        name=col.name,
+                    )
+                    for col, pos in zip(feature, positions)
+                },
+            )
+            start += len(rows)
+
+
+def _iter_ndjson(
+    f: IO[str],
+    decoder: json.JSONDecoder,
+    lines: int = 4_096,
+) -> Iterator[Any]:
+    """Yield the decoded value of each line of the JSON lines file. It decodes
+    the chunk of lines as one array with one call of the decoder, and decodes
+    each line again only if any line of the chunk does not decode to exactly
+    one object.
+    """
+    number: int = 0
+    while chunk := list(islice(f, lines)):
+        texts: list[str] = [line for line in chunk if not line.isspace()]
+        try:
+            # Note: each line decodes to its own array, so the line that has
+            #   many values, like `1, 2`, or the object that splits to many
+            #   lines does not decode to the array of one object.
+            values: list[Any] = decoder.decode(f"[[{'],['.join(texts)}]]")
+            if len(values) == len(texts) and all(
+                type(v) is list and len(v) == 1 and type(v[0]) is dict
+                for v in values
+            ):
+                yield from (v[0] for v in values)
+                number += len(chunk)
+                continue
+        except json.JSONDecodeError:
+            pass
+        for i, line in enumerate(chunk, number + 1):
+            if line.isspace():
+                continue
+            try:
+                yield decoder.decode(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(
+                    f"line {i} is not the valid json, {e.msg}"
+                ) from None
+        number += len(chunk)
+
+
+def _iter_array(
+    f: IO[str],
+    decoder: json.JSONDecoder,
+    size: int = 65_536,
+) -> Iterator[Any]:
+    """Yield the decoded value of each element of the top-level JSON array
+    with the buffer that keeps only the current element and the following
+    block of text.
+    """
+    buf: str = ""
+    pos: int = 0
+    eof: bool = False
+
+    def more() -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        # Note: the read size grows with the buffer for the large element, so
+        #   it decodes the large element again for a few times.
+        if not (data := f.read(max(size, len(buf) - pos))):
+            eof = True
+            return False
+        buf, pos = buf[pos:] + data, 0
+        return True
+
+    def token() -> str:
+        nonlocal pos
+        while True:
+            pos = WHITESPACE.match(buf, pos).end()
+            if pos < len(buf):
+                return buf[pos]
+            if not more():
+                return ""
+
+    if token() != "[":
+        raise ValueError("json file does not start with the array")
+    pos += 1
+    if token() == "]":
+        pos += 1
+    else:
+        while True:
+            token()
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError as e:
+                    if more():
+                        continue
+                    raise ValueError(
+                        f"element of json array is not valid, {e.msg}"
+                    ) from None
+                # Note: the number on the end of buffer may not be complete.
+                if end == len(buf) and more():
+                    continue
+                break
+            pos = end
+            yield value
+            if (char := token()) == ",":
+                pos += 1
+            elif char == "]":
+                pos += 1
+                break
+            else:
+                raise ValueError(
+                    f"json array expects ',' or ']' but found {char!r}"
+                )
+    if token():
+        raise ValueError("json file has extra data after the array")
+
+
+def iter_json(
+    fl: "JsonFl",
+    path: Union[str, Path],
+    *,
+    chunk_size: int = 65_536,
+    errors: Errors = "raise",
+) -> Iterator[Batch]:
+    """Yield the columnar batches of the JSON lines file or the JSON file of
+    the top-level array of objects. Each batch takes only the columns of the
+    feature of the JSON file model from objects and coerces them with their
+    datatype, the missing key will be None.
+
+    :param fl: A JSON file model.
+    :param path: A path of the local file.
+    :param chunk_size: A number of rows of each batch.
+    :param errors: A mode of the value that does not convert to its datatype,
+        `raise` for raise ValueError or `null` for convert it to None.
+
+    :raises ValueError: If the JSON file model does not have the feature.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size should be positive")
+    if not fl.feature:
+        raise ValueError(f"json file {fl.name!r} does not have the feature")
+    feature: list[Col] = list(fl.feature)
+    # Note: decode the float number to decimal for keep its exact value if any
+    #   column is the numeric.
+    decoder: json.JSONDecoder = (
+        json.JSONDecoder(parse_float=Decimal)
+        if any(isinstance(col.dtype, NumericType) for col in feature)
+        else json.JSONDecoder()
+    )
+    with open(path, encoding=fl.encoding) as f:
+        records: Iterator[Any] = (
+            _iter_ndjson(f, decoder)
+            if fl.format == "ndjson"
+            else _iter_array(f, decoder)
+        )
+        start: int = 0
+        while rows := list(islice(records, chunk_size)):
+            if not all(type(row) is dict for row in rows):
+                i: int = next(
+                    i for i, r in enumerate(rows) if type(r) is not dict
+                )
+                raise ValueError(f"row {start + i} is not the json object")
+            yield Batch(
+                start=start,
+                size=len(rows),
+                columns={
+                    col.name: coerce_column(
+                        [row.get(col.name) for row in rows],
+                        col.dtype,
+                        errors=errors,
+                        start=start,
+                        name=col.name,
+                    )
+                    for col in feature
+                },
+            )
+            start += len(rows)
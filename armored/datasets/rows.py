@@ -0,0 +1,462 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Validation engine of rows that checks the batch of rows with the rules of
+columns of the table. Each rule checks values of one column with one loop and
+returns positions of the values that do not pass, so it does not construct any
+model per row.
+
+Rules:
+    *   null        The value is None on the column that is not nullable and
+                    does not have the default value.
+    *   type        The value does not be the Python type of its datatype.
+    *   length      The string is longer than the `max_length` of datatype.
+    *   range       The integer is out of the range of its datatype.
+    *   precision   The numeric has integer digits more than its precision and
+                    scale allow, or the timestamp has fraction of second more
+                    than its precision.
+    *   scale       The decimal has fraction digits more than its scale.
+    *   check       The result of the check statement of column is false.
+"""
+from collections.abc import Iterator, Mapping, Sequence
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import (
+    Any,
+    Callable,
+    NamedTuple,
+    Optional,
+    Union,
+    cast,
+)
+
+from ..dtype import NumericType, StringType, TimestampType
+from .check import Predicate, compile_check
+from .col import Col
+from .db import Tbl
+from .dictionary import DictColumn
+from .reader import Batch
+
+Rule = Callable[[Sequence[Any]], list[int]]
+Rows = Union[
+    Batch,
+    Mapping[str, Sequence[Any]],
+    Sequence[Sequence[Any]],
+    Sequence[Mapping[str, Any]],
+]
+
+# Note: the range of integer datatypes.
+INTEGER_RANGES: dict[str, tuple[int, int]] = {
+    "smallint": (-(2**15), 2**15 - 1),
+    "short": (-(2**15), 2**15 - 1),
+    "integer": (-(2**31), 2**31 - 1),
+    "serial": (1, 2**31 - 1),
+    "bigint": (-(2**63), 2**63 - 1),
+    "long": (-(2**63), 2**63 - 1),
+}
+
+# Note: the Python types of datatypes, the datatype that does not exist on
+#   this map does not check its type.
+PYTHON_TYPES: dict[str, tuple[type, ...]] = {
+    **dict.fromkeys(INTEGER_RANGES, (int,)),
+    "numeric": (Decimal, int),
+    "decimal": (Decimal, int),
+    "float": (float, int),
+    "real": (float, int),
+    "double precision": (float, int),
+    "string": (str,),
+    "char": (str,),
+    "varchar": (str,),
+    "text": (str,),
+    "date": (date,),
+    "time": (time,),
+    "timestamp": (datetime,),
+    "datetime": (datetime,),
+}
+
+
+class Violation(NamedTuple):
+    """Violation of the rule on the value of row and column."""
+
+    row: int
+    col: str
+    rule: str
+
+
+class Report:
+    """Report of violations that keeps only the first violations until its
+    cap, but counts all violations of each column and rule.
+    """
+
+    def __init__(self, max_violations: int = 1_000) -> None:
+        self.max_violations: int = max_violations
+        self.violations: list[Violation] = []
+        self.counts: dict[tuple[str, str], int] = {}
+        self.rows: int = 0
+
+    def add(self, col: str, rule: str, rows: Sequence[int]) -> None:
+        """Add the violations of the rule on rows of the column."""
+        if not rows:
+            return
+        key: tuple[str, str] = (col, rule)
+        self.counts[key] = self.counts.get(key, 0) + len(rows)
+        if (room := self.max_violations - len(self.violations)) > 0:
+            self.violations.extend(
+                Violation(row, col, rule) for row in rows[:room]
+            )
+
+    @property
+    def total(self) -> int:
+        """Return a number of all violations."""
+        return sum(self.counts.values())
+
+    @property
+    def truncated(self) -> bool:
+        """Return True if the report does not keep all violations."""
+        return self.total > len(self.violations)
+
+    @property
+    def ok(self) -> bool:
+        return not self.counts
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(rows={self.rows}, "
+            f"violations={self.total}, truncated={self.truncated})"
+        )
+
+
+def to_columns(
+    data: Rows,
+    names: Sequence[str],
+) -> tuple[int, Mapping[str, Sequence[Any]]]:
+    """Return the start position and values of each column of the batch of
+    rows, the row that is the tuple keeps values with the order of names.
+
+    :raises ValueError: If any tuple row does not have one value per name.
+    """
+    if isinstance(data, Batch):
+        return data.start, data.columns
+    if isinstance(data, Mapping):
+        return 0, data
+    if not data:
+        return 0, {}
+    if isinstance(data[0], Mapping):
+        return 0, {name: [row.get(name) for row in data] for name in names}
+    width: int = len(names)
+    for i, row in enumerate(data):
+        if len(row) != width:
+            raise ValueError(
+                f"row {i} has {len(row)} values but the batch has {width} "
+                f"columns"
+            )
+    return 0, dict(zip(names, zip(*data)))
+
+
+def _not_null(values: Sequence[Any]) -> list[int]:
+    if None not in values:
+        return []
+    return [i for i, v in enumerate(values) if v is None]
+
+
+def _type(types: tuple[type, ...]) -> Rule:
+    exact: frozenset[type] = frozenset((*types, type(None)))
+
+    def rule(values: Sequence[Any]) -> list[int]:
+        if exact.issuperset(map(type, values)):
+            return []
+        return [
+            i
+            for i, v in enumerate(values)
+            if v is not None
+            and (not isinstance(v, types) or isinstance(v, bool))
+        ]
+
+    return rule
+
+
+def _length(max_length: int) -> Rule:
+    def rule(values: Sequence[Any]) -> list[int]:
+        if max(map(len, filter(None, values)), default=0) <= max_length:
+            return []
+        return [
+            i
+            for i, v in enumerate(values)
+            if v is not None and len(v) > max_length
+        ]
+
+    return rule
+
+
+def _range(low: int, high: int) -> Rule:
+    def rule(values: Sequence[Any]) -> list[int]:
+        present: list[Any] = [v for v in values if v is not None]
+        if not present or (low <= min(present) and max(present) <= high):
+            return []
+        return [
+            i
+            for i, v in enumerate(values)
+            if v is not None and not low <= v <= high
+        ]
+
+    return rule
+
+
+def _numeric_precision(precision: int, scale: int) -> Rule:
+    bound: Decimal = Decimal(10) ** (precision - max(scale, 0))
+
+    def rule(values: Sequence[Any]) -> list[int]:
+        # Note: the NaN does not equal itself and does not able to order, so it
+        #   passes this rule.
+        present: list[Any] = [v for v in values if v is not None and v == v]
+        if not present or (-bound < min(present) and max(present) < bound):
+            return []
+        return [
+            i
+            for i, v in enumerate(values)
+            if v is not None and v == v and not -bound < v < bound
+        ]
+
+    return rule
+
+
+def _numeric_scale(scale: int) -> Rule:
+    shift: Decimal = Decimal(10) ** scale
+
+    def exceed(v: Any) -> bool:
+        return (
+            isinstance(v, Decimal)
+            and v.is_finite()
+            and v.as_tuple().exponent < -scale
+        )
+
+    def rule(values: Sequence[Any]) -> list[int]:
+        # Note: the remainder of the shifted value is faster than the tuple of
+        #   digits of each value, but it does not work with the infinity, so it
+        #   checks the remainder first and confirms only values that it found.
+        try:
+            rows: list[int] = [
+                i
+                for i, v in enumerate(values)
+                if v is not None and (v * shift) % 1
+            ]
+        except ArithmeticError:
+            rows = list(range(len(values)))
+        return [i for i in rows if exceed(values[i])]
+
+    return rule
+
+
+def _timestamp_precision(precision: int) -> Rule:
+    step: int = 10 ** (6 - precision)
+
+    def rule(values: Sequence[Any]) -> list[int]:
+        return [
+            i
+            for i, v in enumerate(values)
+            if v is not None and v.microsecond % step
+        ]
+
+    return rule
+
+
+def compile_rules(col: Col) -> list[tuple[str, Rule]]:
+    """Return list of rule names and rule functions of the column except the
+    null rule.
+    """
+    dtype = col.dtype
+    rules: list[tuple[str, Rule]] = []
+    if (types := PYTHON_TYPES.get(dtype.type)) is not None:
+        rules.append(("type", _type(types)))
+    if isinstance(dtype, StringType) and dtype.max_length > -1:
+        rules.append(("length", _length(dtype.max_length)))
+    if dtype.type in INTEGER_RANGES:
+        rules.append(("range", _range(*INTEGER_RANGES[dtype.type])))
+    if isinstance(dtype, NumericType):
+        if dtype.precision > -1:
+            rules.append(
+                (
+                    "precision",
+                    _numeric_precision(dtype.precision, dtype.scale),
+                )
+            )
+        if dtype.scale > -1:
+            rules.append(("scale", _numeric_scale(dtype.scale)))
+    if isinstance(dtype, TimestampType) and -1 < dtype.precision < 6:
+        rules.append(("precision", _timestamp_precision(dtype.precision)))
+    return rules
+
+
+class ColRules(NamedTuple):
+    """Compiled rules of the column."""
+
+    name: str
+    not_null: bool
+    rules: list[tuple[str, Rule]]
+    check: Optional[Predicate] = None
+
+
+class RowValidator:
+    """Validator of rows that compiles rules of all columns of the table once
+    and checks each batch of rows column by column.
+
+    Examples:
+        >>> tbl = Tbl(
+        ...     name="foo",
+        ...     feature=[
+        ...         {"name": "id", "dtype": "integer primary key"},
+        ...         {"name": "code", "dtype": "varchar( 2 )"},
+        ...     ],
+        ... )
+        >>> report = RowValidator(tbl).validate([(1, "ab"), (None, "abc")])
+        >>> report.violations
+        [Violation(row=1, col='id', rule='null'), \
+Violation(row=1, col='code', rule='length')]
+    """
+
+    def __init__(self, tbl: Tbl) -> None:
+        self.tbl: Tbl = tbl
+        self.cols: list[ColRules] = [
+            ColRules(
+                name=col.name,
+                not_null=(not col.nullable or col.pk) and col.default is None,
+                rules=compile_rules(col),
+                check=(
+                    compile_check(col.check, col.name, col.dtype.type)
+                    if col.check
+                    else None
+                ),
+            )
+            for col in tbl.feature
+        ]
+
+    def columns(self, data: Rows) -> tuple[int, Mapping[str, Sequence[Any]]]:
+        """Return the start position and values of each column of the data."""
+        return to_columns(data, [c.name for c in self.cols])
+
+    def validate(
+        self,
+        data: Rows,
+        *,
+        start: Optional[int] = None,
+        report: Optional[Report] = None,
+        max_violations: int = 1_000,
+    ) -> Report:
+        """Validate the batch of rows and return the report. The batch able
+        to be the columnar batch, the mapping of column name and its values,
+        or the sequence of rows that are tuples or mappings.
+
+        :param data: A batch of rows.
+        :param start: A position of the first row of this batch.
+        :param report: A report that collects violations of many batches.
+        :param max_violations: A cap of violations of the new report.
+        """
+        offset, columns = self.columns(data)
+        if start is not None:
+            offset = start
+        if report is None:
+            report = Report(max_violations)
+        size: int = 0
+        checked: dict[str, Sequence[Any]] = {}
+        for col in self.cols:
+            if (values := columns.get(col.name)) is None:
+                continue
+            size = max(size, len(values))
+            if isinstance(values, DictColumn) and values.encoded:
+                values = self._validate_codes(report, col, values, offset)
+                checked[col.name] = values
+                continue
+            if col.not_null:
+                self._add(report, col.name, "null", _not_null(values), offset)
+            for rule, func in col.rules:
+                if rows := func(values):
+                    self._add(report, col.name, rule, rows, offset)
+                    if rule == "type":
+                        # Note: the following rules check only the values that
+                        #   pass the type rule.
+                        values = list(values)
+                        for i in rows:
+                            values[i] = None
+            checked[col.name] = values
+        for col in self.cols:
+            # Note: the check statement able to use other columns, so it runs
+            #   after all columns pass their type rules.
+            if col.check is None or not all(
+                name in checked for name in (col.name, *col.check.columns)
+            ):
+                continue
+            self._add(
+                report,
+                col.name,
+                "check",
+                col.check.violations(checked, len(checked[col.name])),
+                offset,
+            )
+        report.rows += size
+        return report
+
+    def _validate_codes(
+        self,
+        report: Report,
+        col: ColRules,
+        values: DictColumn,
+        offset: int,
+    ) -> Sequence[Any]:
+        """Validate the dictionary encoding column, each rule checks only the
+        distinct values and maps them back to rows with their codes.
+        """
+        if col.not_null:
+            self._add(report, col.name, "null", values.null_rows(), offset)
+        for rule, func in col.rules:
+            if codes := func(values.dictionary):
+                rows: list[int] = values.rows_of(codes)
+                self._add(report, col.name, rule, rows, offset)
+                if rule == "type":
+                    # Note: the following rules check the decoded values that
+                    #   pass the type rule.
+                    decoded: list[Any] = values.tolist()
+                    for i in rows:
+                        decoded[i] = None
+                    for other, func in col.rules:
+                        if other != "type" and (found := func(decoded)):
+                            self._add(report, col.name, other, found, offset)
+                    return decoded
+        return values
+
+    @staticmethod
+    def _add(
+        report: Report,
+        col: str,
+        rule: str,
+        rows: list[int],
+        offset: int,
+    ) -> None:
+        if rows and offset:
+            rows = [i + offset for i in rows]
+        report.add(col, rule, rows)
+
+
+def validate_rows(
+    tbl: Tbl,
+    batches: Union[Rows, Iterator[Rows]],
+    *,
+    max_violations: int = 1_000,
+) -> Report:
+    """Validate one batch, the iterator of batches, or the list of `Batch`
+    of rows with the table and return one report of all batches.
+    """
+    validator: RowValidator = RowValidator(tbl)
+    report: Report = Report(max_violations)
+    if isinstance(batches, Iterator):
+        for batch in batches:
+            validator.validate(batch, report=report)
+    elif isinstance(batches, (Batch, Mapping)):
+        validator.validate(batches, report=report)
+    elif len(batches) > 0 and isinstance(batches[0], Batch):
+        for item in batches:
+            validator.validate(cast(Batch, item), report=report)
+    else:
+        validator.validate(batches, report=report)
+    return report
@@ -0,0 +1,397 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Compact binary snapshot of validated tables and catalog that able to load
+without the validation. The snapshot file is the fixed size header and the
+compressed payload of plain tuples that marshal with the datatype table, so
+each distinct datatype keeps only once.
+
+Note:
+    The snapshot loads only on the same Python version and the same layout
+of models that it was saved, any other snapshot raise `StaleSnapshotError`
+for rebuild it from the source.
+"""
+import gc
+import marshal
+import struct
+import sys
+import zlib
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from hashlib import blake2b
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Optional,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from ..__base import build_model, fingerprint
+from ..const import Fk, Pk, Ref, to_ref
+from ..dtype import DTYPES, BaseType, get_dtype, intern_dtype
+from ..settings import DtypeSetting
+from .catalog import Catalog
+from .col import Col
+from .db import Tbl
+from .lazy import LazyCols
+
+MAGIC: bytes = b"ARMSNAP\x00"
+FORMAT_VERSION: int = 1
+
+# Note: magic, format version, layout digest, source digest, model digest,
+#   and payload checksum.
+HEADER: struct.Struct = struct.Struct("<8sH16s16s16s16s")
+
+Snapshot = Union[Catalog, list[Tbl]]
+
+
+class SnapshotError(ValueError):
+    """Snapshot file that does not able to load."""
+
+
+class StaleSnapshotError(SnapshotError):
+    """Snapshot file that does not match with the current source or layout of
+    models.
+    """
+
+
+def _digest(data: bytes) -> bytes:
+    return blake2b(data, digest_size=16).digest()
+
+
+def _layout() -> bytes:
+    """Return digest of the layout of models and the marshal format that the
+    snapshot depends on, it keys by the datatype models of the registry, so
+    the datatype that registers later changes the layout.
+    """
+    return _layout_of(tuple(DTYPES.items()))
+
+
+@lru_cache(maxsize=4)
+def _layout_of(dtypes: tuple[tuple[str, type[BaseType]], ...]) -> bytes:
+    models: list[type[BaseModel]] = [Catalog, Tbl, Col, Pk, Fk, Ref]
+    models.extend(model for _, model in dtypes)
+    return _digest(
+        repr(
+            (
+                FORMAT_VERSION,
+                sys.version_info[:2],
+                marshal.version,
+                [(m.__name__, tuple(m.model_fields)) for m in models],
+            )
+        ).encode()
+    )
+
+
+@contextmanager
+def _no_gc() -> Iterator[None]:
+    """Disable the garbage collector while it creates millions of objects that
+    do not have any cycles, because the collection on each threshold of
+    generations costs more than the creation itself.
+    """
+    enabled: bool = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _mask(model: BaseModel) -> int:
+    """Return the bitmask of the fields that was set on the model."""
+    fields_set: set[str] = model.__pydantic_fields_set__
+    return sum(
+        1 << i
+        for i, name in enumerate(model.model_fields)
+        if name in fields_set
+    )
+
+
+def _unmask(model: type[BaseModel], mask: int) -> set[str]:
+    return {name for i, name in enumerate(model.model_fields) if mask >> i & 1}
+
+
+def _dump(obj: Snapshot) -> tuple[Any, ...]:
+    dtypes: dict[tuple[Any, ...], int] = {}
+
+    def dtype_id(dtype: BaseType) -> int:
+        if get_dtype(dtype.type).__name__ != type(dtype).__name__:
+            raise TypeError(
+                f"datatype {type(dtype).__name__} does not register with its "
+                f"type, {dtype.type!r}"
+            )
+        key = (_mask(dtype), tuple(dtype.__dict__.items()))
+        return dtypes.setdefault(key, len(dtypes))
+
+    def dump_col(col: Col) -> tuple[Any, ...]:
+        if type(col) is not Col:
+            raise TypeError(f"snapshot does not support {type(col).__name__}")
+        return (
+            _mask(col),
+            col.name,
+            dtype_id(col.dtype),
+            col.nullable,
+            col.unique,
+            col.default,
+            col.check,
+            col.pk,
+            (col.fk.tbl, col.fk.col) if isinstance(col.fk, Ref) else col.fk,
+        )
+
+    def dump_tbl(tbl: Tbl) -> tuple[Any, ...]:
+        if type(tbl) is not Tbl:
+            raise TypeError(f"snapshot does not support {type(tbl).__name__}")
+        return (
+            _mask(tbl),
+            tbl.name,
+            tuple(dump_col(col) for col in tbl.feature),
+            (_mask(tbl.pk), tuple(tbl.pk.cols)),
+            tuple(
+                (_mask(fk), _mask(fk.ref), fk.to, fk.ref.tbl, fk.ref.col)
+                for fk in tbl.fk
+            ),
+        )
+
+    if isinstance(obj, Catalog):
+        catalog: Optional[tuple[int, str]] = (_mask(obj), obj.name)
+        tables: list[Tbl] = obj.objects
+    else:
+        catalog = None
+        tables = obj
+    rs: tuple[Any, ...] = tuple(dump_tbl(tbl) for tbl in tables)
+    return catalog, tuple((mask, dict(items)) for mask, items in dtypes), rs
+
+
+class _SnapshotCols(LazyCols):
+    """Lazy columns that keep the column values of snapshot and construct each
+    column on its first access without validation.
+    """
+
+    def __init__(
+        self,
+        values: tuple[tuple[Any, ...], ...],
+        loader: Callable[[tuple[Any, ...]], Col],
+    ) -> None:
+        self._raws: list[Any] = list(values)
+        self._cols: list[Optional[Col]] = [None] * len(self._raws)
+        self._loader = loader
+        self.names: tuple[str, ...] = tuple(v[1] for v in values)
+        self.pk_names: tuple[str, ...] = tuple(v[1] for v in values if v[7])
+        self.fk_refs: tuple[tuple[str, Ref], ...] = tuple(
+            (v[1], ref) for v in values if (ref := _to_ref(v[8])) is not None
+        )
+
+    def _get(self, index: int) -> Col:
+        if (col := self._cols[index]) is None:
+            col = self._cols[index] = self._loader(self._raws[index])
+            self._raws[index] = None
+        return col
+
+
+def _to_ref(value: Any) -> Optional[Ref]:
+    if isinstance(value, tuple):
+        return build_model(
+            Ref, {"tbl": value[0], "col": value[1]}, {"tbl", "col"}
+        )
+    return to_ref(value)
+
+
+def _load(payload: tuple[Any, ...], lazy: bool = False) -> Snapshot:
+    catalog, dtype_values, tables = payload
+    intern: bool = DtypeSetting.intern
+    dtypes: list[tuple[type[BaseType], dict[str, Any], set[str]]] = []
+    for mask, values in dtype_values:
+        model: type[BaseType] = get_dtype(values["type"])
+        dtypes.append((model, values, _unmask(model, mask)))
+    # Note: the datatypes share between columns only if the setting interns
+    #   them, the same as the construction of columns.
+    shared: list[BaseType] = (
+        [
+            intern_dtype(build_model(model, dict(values), fields_set))
+            for model, values, fields_set in dtypes
+        ]
+        if intern
+        else []
+    )
+
+    def load_dtype(i: int) -> BaseType:
+        if intern:
+            return shared[i]
+        model, values, fields_set = dtypes[i]
+        return build_model(model, dict(values), set(fields_set))
+
+    col_masks: dict[int, set[str]] = {}
+    tbl_masks: dict[int, set[str]] = {}
+    pk_masks: dict[int, set[str]] = {}
+
+    def fields(masks: dict[int, set[str]], model, mask: int) -> set[str]:
+        if (rs := masks.get(mask)) is None:
+            rs = masks[mask] = _unmask(model, mask)
+        return set(rs)
+
+    def load_col(values: tuple[Any, ...]) -> Col:
+        mask, name, dtype, nullable, unique, default, check, pk, fk = values
+        return build_model(
+            Col,
+            {
+                "name": name,
+                "dtype": load_dtype(dtype),
+                "nullable": nullable,
+                "unique": unique,
+                "default": default,
+                "check": check,
+                "pk": pk,
+                "fk": _to_ref(fk) if isinstance(fk, tuple) else fk,
+            },
+            fields(col_masks, Col, mask),
+        )
+
+    def load_tbl(values: tuple[Any, ...]) -> Tbl:
+        mask, name, cols, (pk_mask, pk_cols), fks = values
+        return build_model(
+            Tbl,
+            {
+                "name": name,
+                "feature": (
+                    _SnapshotCols(cols, load_col)
+                    if lazy
+                    else [load_col(col) for col in cols]
+                ),
+                "pk": build_model(
+                    Pk,
+                    {"of": name, "cols": list(pk_cols)},
+                    fields(pk_masks, Pk, pk_mask),
+                ),
+                "fk": [
+                    build_model(
+                        Fk,
+                        {
+                            "of": name,
+                            "to": to,
+                            "ref": build_model(
+                                Ref,
+                                {"tbl": ref_tbl, "col": ref_col},
+                                _unmask(Ref, ref_mask),
+                            ),
+                        },
+                        _unmask(Fk, fk_mask),
+                    )
+                    for fk_mask, ref_mask, to, ref_tbl, ref_col in fks
+                ],
+            },
+            fields(tbl_masks, Tbl, mask),
+        )
+
+    objects: list[Tbl] = [load_tbl(values) for values in tables]
+    if catalog is None:
+        return objects
+    mask, name = catalog
+    return build_model(
+        Catalog,
+        {"name": name, "objects": objects},
+        _unmask(Catalog, mask),
+    )
+
+
+def _source_digest(source: Any) -> bytes:
+    return (
+        b"\x00" * 16 if source is None else bytes.fromhex(fingerprint(source))
+    )
+
+
+def _model_digest(obj: Snapshot) -> bytes:
+    return bytes.fromhex(
+        obj.fingerprint() if isinstance(obj, Catalog) else fingerprint(obj)
+    )
+
+
+def save_snapshot(
+    obj: Snapshot,
+    file: Union[str, Path, BinaryIO],
+    *,
+    source: Any = None,
+    level: int = 6,
+) -> int:
+    """Save the catalog or list of tables to the snapshot file and return a
+    number of written bytes.
+
+    :param obj: A catalog or list of tables that was validated.
+    :param file: A path or binary file object of the snapshot.
+    :param source: An optional source of the catalog, like the raw config
+        text, that its fingerprint keeps on the snapshot for the staleness
+        check on loading.
+    :param level: A compression level of zlib.
+    """
+    if isinstance(file, (str, Path)):
+        with open(file, mode="wb") as f:
+            return save_snapshot(obj, f, source=source, level=level)
+
+    with _no_gc():
+        payload: bytes = zlib.compress(marshal.dumps(_dump(obj)), level)
+        header: bytes = HEADER.pack(
+            MAGIC,
+            FORMAT_VERSION,
+            _layout(),
+            _source_digest(source),
+            _model_digest(obj),
+            _digest(payload),
+        )
+    file.write(header)
+    file.write(payload)
+    return len(header) + len(payload)
+
+
+def load_snapshot(
+    file: Union[str, Path, BinaryIO],
+    *,
+    source: Any = None,
+    verify: bool = False,
+    lazy: bool = False,
+) -> Snapshot:
+    """Load the catalog or list of tables from the snapshot file without the
+    validation of models.
+
+    :param file: A path or binary file object of the snapshot.
+    :param source: An optional source of the catalog that compare its
+        fingerprint with the fingerprint on the snapshot.
+    :param verify: A flag that compare the fingerprint of loaded models with
+        the fingerprint on the snapshot, it costs as hashing all models.
+    :param lazy: A flag that keep columns of each table as the lazy columns
+        that construct each column on its first access.
+
+    :raises StaleSnapshotError: If the snapshot does not match with the
+        source, the layout of models, or the Python version.
+    :raises SnapshotError: If the snapshot file was corrupted.
+    """
+    if isinstance(file, (str, Path)):
+        with open(file, mode="rb") as f:
+            return load_snapshot(f, source=source, verify=verify, lazy=lazy)
+
+    header: bytes = file.read(HEADER.size)
+    if len(header) != HEADER.size or header[:8] != MAGIC:
+        raise SnapshotError("file is not the armored snapshot")
+    _, version, layout, source_digest, model_digest, checksum = HEADER.unpack(
+        header
+    )
+    if version != FORMAT_VERSION or layout != _layout():
+        raise StaleSnapshotError(
+            "snapshot was saved with the other layout of models"
+        )
+    if source is not None and source_digest != _source_digest(source):
+        raise StaleSnapshotError("snapshot does not match with the source")
+
+    payload: bytes = file.read()
+    if _digest(payload) != checksum:
+        raise SnapshotError("payload of snapshot was corrupted")
+    with _no_gc():
+        rs: Snapshot = _load(marshal.loads(zlib.decompress(payload)), lazy)
+    if verify and _model_digest(rs) != model_digest:
+        raise SnapshotError("models of snapshot does not match its fingerprint")
+    return rs
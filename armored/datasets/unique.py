@@ -0,0 +1,387 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Uniqueness checker of the primary key and unique columns of the table that
+keeps only the 16 bytes digest and the row position of each key on memory.
+When the number of entries exceeds the memory budget, it spills the entries to
+the sorted runs on the temporary directory with partitions by their digest,
+and merges runs of each partition on the finish.
+
+Note:
+    The key that has any NULL value does not check, the same as the unique
+constraint of SQL. The primary key column that is NULL reports on the null
+rule of `RowValidator` instead. The numbers that are equal on SQL, like `1`,
+`1.0`, and `Decimal('1.00')`, have the same digest.
+"""
+import heapq
+import os
+import struct
+import tempfile
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from decimal import MAX_EMAX, MAX_PREC, MIN_EMIN, Context, Decimal
+from hashlib import blake2b
+from itertools import chain, compress, count, islice
+from operator import eq, itemgetter
+from types import TracebackType
+from typing import (
+    Any,
+    NamedTuple,
+    Optional,
+)
+
+from .db import Tbl
+from .reader import Batch
+from .rows import Rows, to_columns
+
+# Note: the estimated bytes of one entry on memory, the 16 bytes digest object,
+#   the position object, and the slot of dict.
+ENTRY_SIZE: int = 112
+
+# Note: the digest and the row position of each record on the run file.
+RECORD: struct.Struct = struct.Struct("<16sQ")
+PACK_RECORDS: int = 1_024
+PACK: struct.Struct = struct.Struct("<" + "16sQ" * PACK_RECORDS)
+
+NUMBERS: frozenset[type] = frozenset({float, Decimal})
+
+# Note: the context that does not round the decimal when it normalizes, and
+#   the largest number of digits of the decimal that converts to integer.
+EXACT: Context = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+INTEGER_DIGITS: int = 1_000
+
+
+class Duplicate(NamedTuple):
+    """Duplicate key with positions of all rows that have this key."""
+
+    key: str
+    cols: tuple[str, ...]
+    rows: tuple[int, ...]
+
+
+def _canonical(value: Any) -> Any:
+    """Return the canonical number of the float or decimal that has the same
+    repr for all numbers that are equal, the integral value converts to the
+    integer and the decimal that is exactly the float converts to the float.
+    """
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    if not value.is_finite():
+        return value
+    if value == value.to_integral_value() and value.adjusted() < INTEGER_DIGITS:
+        return int(value)
+    if (f := float(value)) == value:
+        return f
+    return value.normalize(EXACT)
+
+
+def _write_run(path: str, records: list[tuple[bytes, int]]) -> None:
+    full: int = len(records) - len(records) % PACK_RECORDS
+    with open(path, mode="wb") as f:
+        for i in range(0, full, PACK_RECORDS):
+            f.write(
+                PACK.pack(*chain.from_iterable(records[i : i + PACK_RECORDS]))
+            )
+        if rest := records[full:]:
+            f.write(
+                struct.pack(
+                    "<" + "16sQ" * len(rest), *chain.from_iterable(rest)
+                )
+            )
+
+
+def _load_run(path: str) -> list[tuple[bytes, int]]:
+    with open(path, mode="rb") as f:
+        return list(RECORD.iter_unpack(f.read()))
+
+
+def _read_run(path: str) -> Iterator[tuple[bytes, int]]:
+    with open(path, mode="rb") as f:
+        while block := f.read(RECORD.size * PACK_RECORDS):
+            yield from RECORD.iter_unpack(block)
+
+
+def _sorted_duplicates(
+    records: list[tuple[bytes, int]],
+) -> Iterator[tuple[int, ...]]:
+    """Yield positions of rows of each duplicate digest of sorted records, it
+    compares each digest with its next digest on C loops and visits only the
+    records that equal their next records.
+    """
+    digests: list[bytes] = list(map(itemgetter(0), records))
+    equals: Iterator[bool] = map(eq, digests, islice(digests, 1, None))
+    group: list[int] = []
+    prev: int = -2
+    for i in compress(count(), equals):
+        if i != prev + 1:
+            if group:
+                yield tuple(group)
+            group = [records[i][1]]
+        group.append(records[i + 1][1])
+        prev = i
+    if group:
+        yield tuple(group)
+
+
+def _merged_duplicates(
+    records: Iterable[tuple[bytes, int]],
+) -> Iterator[tuple[int, ...]]:
+    """Yield positions of rows of each duplicate digest of the stream of
+    sorted records.
+    """
+    prev: Optional[bytes] = None
+    group: list[int] = []
+    for d, row in records:
+        if d == prev:
+            group.append(row)
+            continue
+        if len(group) > 1:
+            yield tuple(group)
+        prev, group = d, [row]
+    if len(group) > 1:
+        yield tuple(group)
+
+
+class _Key:
+    """State of one unique key, the first position of each digest and the
+    positions of the following rows that have the same digest.
+    """
+
+    __slots__ = ("name", "cols", "seen", "extra", "runs")
+
+    def __init__(self, name: str, cols: tuple[str, ...], partitions: int):
+        self.name: str = name
+        self.cols: tuple[str, ...] = cols
+        self.seen: dict[bytes, int] = {}
+        self.extra: list[tuple[bytes, int]] = []
+        self.runs: list[list[str]] = [[] for _ in range(partitions)]
+
+    def __len__(self) -> int:
+        return len(self.seen) + len(self.extra)
+
+    @property
+    def spilled(self) -> bool:
+        return any(self.runs)
+
+
+class UniqueChecker:
+    """Uniqueness checker of the primary key and unique columns of the table
+    that adds batches of rows in order and reports duplicate keys on finish.
+
+    Examples:
+        >>> tbl = Tbl(
+        ...     name="foo",
+        ...     feature=[{"name": "id", "dtype": "integer primary key"}],
+        ... )
+        >>> with UniqueChecker(tbl) as checker:
+        ...     checker.add({"id": [1, 2, 1]})
+        ...     checker.finish()
+        [Duplicate(key='foo_id_pk', cols=('id',), rows=(0, 2))]
+
+    :param tbl: A table that has the primary key or unique columns.
+    :param memory: A memory budget in bytes of entries of all keys.
+    :param partitions: A number of partitions of each spill.
+    :param max_duplicates: A cap of duplicate keys on the result.
+    :param tmpdir: A parent directory of the temporary directory of runs.
+    """
+
+    def __init__(
+        self,
+        tbl: Tbl,
+        *,
+        memory: int = 256 * 2**20,
+        partitions: int = 16,
+        max_duplicates: int = 1_000,
+        tmpdir: Optional[str] = None,
+    ) -> None:
+        if not 0 < partitions <= 256:
+            raise ValueError("partitions should be between 1 and 256")
+        self.tbl: Tbl = tbl
+        self.max_entries: int = max(memory // ENTRY_SIZE, 1)
+        self.partitions: int = partitions
+        self.max_duplicates: int = max_duplicates
+        self.tmpdir: Optional[str] = tmpdir
+        self.keys: list[_Key] = []
+        if pk := tuple(tbl.pk.cols):
+            self.keys.append(_Key(tbl.pk.name, pk, partitions))
+        self.keys.extend(
+            _Key(f"{tbl.name}_{col.name}_key", (col.name,), partitions)
+            for col in tbl.feature
+            if col.unique and (col.name,) != pk
+        )
+        self.rows: int = 0
+        self.spills: int = 0
+        self.count: int = 0
+        self._tmp: Optional[tempfile.TemporaryDirectory] = None
+
+    def __enter__(self) -> "UniqueChecker":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Remove the temporary directory of runs."""
+        if self._tmp is not None:
+            self._tmp.cleanup()
+            self._tmp = None
+
+    @property
+    def entries(self) -> int:
+        """Return a number of entries of all keys on memory."""
+        return sum(map(len, self.keys))
+
+    def add(self, data: Rows, *, start: Optional[int] = None) -> None:
+        """Add the batch of rows, the position of the first row of batch is
+        the start of batch or the number of added rows.
+
+        :raises ValueError: If the batch does not have columns of any key.
+        """
+        if start is None:
+            start = data.start if isinstance(data, Batch) else self.rows
+        _, columns = to_columns(data, [c.name for c in self.tbl.feature])
+        size: int = 0
+        for key in self.keys:
+            if missing := [c for c in key.cols if c not in columns]:
+                raise ValueError(
+                    f"batch does not have columns {missing} of {key.name}"
+                )
+            size = max(size, len(columns[key.cols[0]]))
+            values: Iterable[Any] = (
+                columns[key.cols[0]]
+                if len(key.cols) == 1
+                else zip(*(columns[c] for c in key.cols))
+            )
+            self._add(key, values, start)
+            if self.entries > self.max_entries:
+                self.spill()
+        self.rows = max(self.rows, start + size)
+
+    def _add(self, key: _Key, values: Iterable[Any], start: int) -> None:
+        seen: dict[bytes, int] = key.seen
+        extra: list[tuple[bytes, int]] = key.extra
+        single: bool = len(key.cols) == 1
+        for row, value in enumerate(values, start):
+            if single:
+                if value is None:
+                    continue
+                if type(value) in NUMBERS:
+                    value = _canonical(value)
+            else:
+                if None in value:
+                    continue
+                if not NUMBERS.isdisjoint(map(type, value)):
+                    value = tuple(
+                        _canonical(v) if type(v) in NUMBERS else v
+                        for v in value
+                    )
+            d: bytes = blake2b(repr(value).encode(), digest_size=16).digest()
+            if seen.setdefault(d, row) != row:
+                extra.append((d, row))
+
+    def spill(self) -> None:
+        """Write entries of all keys to the sorted runs with partitions by
+        their digest and release them from memory.
+        """
+        if self._tmp is None:
+            self._tmp = tempfile.TemporaryDirectory(
+                prefix="armored-unique-", dir=self.tmpdir
+            )
+        # Note: the partition is the range of the first byte of digest, so the
+        #   records of each partition are contiguous after sorting.
+        bounds: list[tuple[bytes]] = [
+            (bytes([-(-part * 256 // self.partitions)]),)
+            for part in range(1, self.partitions)
+        ]
+        for i, key in enumerate(self.keys):
+            if not len(key):
+                continue
+            records: list[tuple[bytes, int]] = list(key.seen.items())
+            records.extend(key.extra)
+            key.seen, key.extra = {}, []
+            records.sort()
+            starts: list[int] = [0, *(bisect_left(records, b) for b in bounds)]
+            for part, (lo, hi) in enumerate(
+                zip(starts, [*starts[1:], len(records)])
+            ):
+                if lo == hi:
+                    continue
+                path: str = os.path.join(
+                    self._tmp.name, f"{i}-{part}-{self.spills}.run"
+                )
+                _write_run(path, records[lo:hi])
+                key.runs[part].append(path)
+        self.spills += 1
+
+    def _groups(self, key: _Key) -> Iterator[tuple[int, ...]]:
+        if not key.spilled:
+            rows: dict[bytes, list[int]] = {}
+            for d, row in key.extra:
+                rows.setdefault(d, [key.seen[d]]).append(row)
+            yield from (tuple(sorted(r)) for r in rows.values())
+            return
+
+        # Note: the same digest always goes to the same partition, so it
+        #   merges only runs of each partition together. The partition that
+        #   fits the memory budget sorts on memory, and the larger partition
+        #   merges its sorted runs with streaming.
+        for paths in key.runs:
+            if not paths:
+                continue
+            if (
+                sum(map(os.path.getsize, paths)) // RECORD.size
+                <= self.max_entries
+            ):
+                records: list[tuple[bytes, int]] = []
+                for path in paths:
+                    records.extend(_load_run(path))
+                records.sort()
+                yield from _sorted_duplicates(records)
+            else:
+                yield from _merged_duplicates(
+                    heapq.merge(*(_read_run(path) for path in paths))
+                )
+
+    def finish(self) -> list[Duplicate]:
+        """Return list of duplicate keys that order by key and the position of
+        the first row. It keeps only the first duplicate keys until its cap,
+        but counts all of them on the `count` attribute.
+        """
+        if any(key.spilled for key in self.keys):
+            self.spill()
+        rs: list[Duplicate] = []
+        self.count = 0
+        for key in self.keys:
+            found: list[Duplicate] = []
+            for rows in self._groups(key):
+                self.count += 1
+                if len(rs) + len(found) < self.max_duplicates:
+                    found.append(Duplicate(key.name, key.cols, rows))
+            rs.extend(sorted(found, key=lambda d: d.rows))
+        return rs
+
+
+def check_unique(
+    tbl: Tbl,
+    batches: Iterable[Rows],
+    *,
+    memory: int = 256 * 2**20,
+    max_duplicates: int = 1_000,
+    tmpdir: Optional[str] = None,
+) -> list[Duplicate]:
+    """Return list of duplicate keys of the iterable of batches of rows with
+    the primary key and unique columns of the table.
+    """
+    with UniqueChecker(
+        tbl, memory=memory, max_duplicates=max_duplicates, tmpdir=tmpdir
+    ) as checker:
+        for batch in batches:
+            checker.add(batch)
+        return checker.finish()
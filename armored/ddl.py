@@ -0,0 +1,311 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""DDL renderer that stream the statements from table models with dialect
+plugins. Each dialect caches the rendered fragments of datatypes, columns and
+references because the same fragments always repeat on large catalogs.
+"""
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import (
+    Any,
+    Optional,
+    TextIO,
+    Union,
+)
+
+from .const import Fk, Ref
+from .datasets.catalog import Catalog
+from .datasets.col import Col
+from .datasets.db import Tbl
+from .dtype import (
+    BaseType,
+    NumericType,
+    StringType,
+    TimestampType,
+)
+from .utils import SERIAL_DEFAULT
+
+
+class Dialect:
+    """Base Dialect that render the DDL statements from table models."""
+
+    name: str = "base"
+
+    # Note: the map of datatype name and the name that this dialect use.
+    types: dict[str, str] = {}
+
+    # Note: the dialect that accepts the foreign key to the table that does
+    #   not create yet keeps the foreign keys of cycles on create table.
+    forward_refs: bool = False
+
+    def __init__(self) -> None:
+        self._dtypes: dict[Any, str] = {}
+        self._columns: dict[Any, str] = {}
+        self._refs: dict[tuple[str, str], str] = {}
+
+    def cache_info(self) -> dict[str, int]:
+        """Return a number of cached fragments of this dialect."""
+        return {
+            "dtypes": len(self._dtypes),
+            "columns": len(self._columns),
+            "refs": len(self._refs),
+        }
+
+    def quote(self, name: str) -> str:
+        return '"' + name.replace('"', '""') + '"'
+
+    @staticmethod
+    def _dtype_key(dtype: BaseType) -> Any:
+        return type(dtype), tuple(dtype.__dict__.items())
+
+    def dtype(self, dtype: BaseType) -> str:
+        """Return the cached datatype fragment."""
+        key: Any = self._dtype_key(dtype)
+        try:
+            rs: Optional[str] = self._dtypes.get(key)
+        except TypeError:
+            # Note: the custom datatype that has unhashable values does not
+            #   able to cache its fragment.
+            return self.render_dtype(dtype)
+        if rs is None:
+            rs = self._dtypes[key] = self.render_dtype(dtype)
+        return rs
+
+    def render_dtype(self, dtype: BaseType) -> str:
+        name: str = self.types.get(dtype.type, dtype.type)
+        if isinstance(dtype, StringType) and dtype.max_length > -1:
+            return f"{name}({dtype.max_length})"
+        if isinstance(dtype, NumericType) and dtype.precision > -1:
+            scale: str = f", {dtype.scale}" if dtype.scale > -1 else ""
+            return f"{name}({dtype.precision}{scale})"
+        if isinstance(dtype, TimestampType) and dtype.precision > -1:
+            return f"{name}({dtype.precision})"
+        return name
+
+    def default(self, col: Col) -> Optional[str]:
+        """Return the default value fragment of column or None if it does not
+        set or does not support on this dialect.
+        """
+        if col.default is None or col.default == SERIAL_DEFAULT:
+            return None
+        return str(col.default)
+
+    def column(self, col: Col) -> str:
+        """Return the column definition with the cached fragment of datatype
+        and flags of column.
+        """
+        key: Any = (
+            self._dtype_key(col.dtype),
+            col.nullable,
+            col.unique,
+            col.default,
+        )
+        try:
+            rs: Optional[str] = self._columns.get(key)
+        except TypeError:
+            rs = key = None
+        if rs is None:
+            rs = self.render_column(col)
+            if key is not None:
+                self._columns[key] = rs
+        if col.check:
+            rs = f"{rs} {self.check(col)}"
+        return f"{self.quote(col.name)} {rs}"
+
+    def render_column(self, col: Col) -> str:
+        fragments: list[str] = [self.dtype(col.dtype)]
+        if not col.nullable:
+            fragments.append("NOT NULL")
+        if col.unique:
+            fragments.append("UNIQUE")
+        if (default := self.default(col)) is not None:
+            fragments.append(f"DEFAULT {default}")
+        return " ".join(fragments)
+
+    def check(self, col: Col) -> str:
+        """Return the check fragment that replace the `<name>` placeholder
+        with the column name.
+        """
+        statement: str = col.check.strip()
+        if statement[:5].lower() == "check":
+            statement = statement[5:].strip()
+        return f"CHECK {statement.replace('<name>', self.quote(col.name))}"
+
+    def ref(self, ref: Ref) -> str:
+        """Return the cached reference fragment."""
+        key: tuple[str, str] = (ref.tbl, ref.col)
+        if (rs := self._refs.get(key)) is None:
+            rs = self._refs[key] = (
+                f"REFERENCES {self.quote(ref.tbl)} ({self.quote(ref.col)})"
+            )
+        return rs
+
+    def pk(self, tbl: Tbl) -> Optional[str]:
+        if not tbl.pk.cols:
+            return None
+        cols: str = ", ".join(self.quote(c) for c in tbl.pk.cols)
+        return f"CONSTRAINT {self.quote(tbl.pk.name)} PRIMARY KEY ({cols})"
+
+    def fks(self, tbl: Tbl) -> list[str]:
+        """Return list of foreign key constraints of the table without the
+        duplicate references.
+        """
+        fks: dict[str, str] = {}
+        for col, ref in tbl.fk_refs():
+            fk: Fk = Fk(of=tbl.name, to=col, ref=ref)
+            fks.setdefault(
+                fk.name,
+                (
+                    f"CONSTRAINT {self.quote(fk.name)} "
+                    f"FOREIGN KEY ({self.quote(col)}) {self.ref(ref)}"
+                ),
+            )
+        return list(fks.values())
+
+    def create_table(self, tbl: Tbl, *, fk: bool = True) -> str:
+        """Return the create table statement of the table."""
+        lines: list[str] = [self.column(col) for col in tbl.feature]
+        if (pk := self.pk(tbl)) is not None:
+            lines.append(pk)
+        if fk:
+            lines.extend(self.fks(tbl))
+        body: str = ",\n    ".join(lines)
+        return f"CREATE TABLE {self.quote(tbl.name)} (\n    {body}\n)"
+
+    def alter_fks(self, tbl: Tbl) -> list[str]:
+        """Return list of alter table statements that add foreign keys."""
+        return [
+            f"ALTER TABLE {self.quote(tbl.name)} ADD {fk}"
+            for fk in self.fks(tbl)
+        ]
+
+
+class SqliteDialect(Dialect):
+    """SQLite Dialect"""
+
+    name: str = "sqlite"
+    types: dict[str, str] = {
+        "integer": "INTEGER",
+        "smallint": "INTEGER",
+        "bigint": "INTEGER",
+        "short": "INTEGER",
+        "long": "INTEGER",
+        "serial": "INTEGER",
+        "string": "TEXT",
+        "char": "CHARACTER",
+        "varchar": "VARCHAR",
+        "text": "TEXT",
+        "numeric": "NUMERIC",
+        "decimal": "DECIMAL",
+        "float": "REAL",
+        "real": "REAL",
+        "double precision": "REAL",
+        "timestamp": "TIMESTAMP",
+        "datetime": "DATETIME",
+        "date": "DATE",
+        "time": "TIME",
+    }
+    forward_refs: bool = True
+
+
+class PostgresDialect(Dialect):
+    """PostgreSQL Dialect"""
+
+    name: str = "postgres"
+    types: dict[str, str] = {
+        "string": "varchar",
+        "short": "smallint",
+        "long": "bigint",
+        "float": "double precision",
+        "datetime": "timestamp",
+    }
+
+    def render_dtype(self, dtype: BaseType) -> str:
+        rs: str = super().render_dtype(dtype)
+        if dtype.type == "string" and isinstance(dtype, StringType):
+            return rs if dtype.max_length > -1 else "text"
+        if isinstance(dtype, TimestampType) and dtype.timezone:
+            return f"{rs} with time zone"
+        return rs
+
+    def render_column(self, col: Col) -> str:
+        rs: str = super().render_column(col)
+        if col.default == SERIAL_DEFAULT:
+            return f"{rs} GENERATED BY DEFAULT AS IDENTITY"
+        return rs
+
+
+DIALECTS: dict[str, Dialect] = {}
+
+
+def register_dialect(dialect: type[Dialect]) -> type[Dialect]:
+    """Register the dialect to the registry with its name."""
+    DIALECTS[dialect.name] = dialect()
+    return dialect
+
+
+def get_dialect(name: Union[str, Dialect]) -> Dialect:
+    """Return the registered dialect that keep the fragment caches."""
+    if isinstance(name, Dialect):
+        return name
+    try:
+        return DIALECTS[name]
+    except KeyError:
+        raise ValueError(f"dialect {name!r} does not register") from None
+
+
+register_dialect(SqliteDialect)
+register_dialect(PostgresDialect)
+
+
+def iter_ddl(
+    tables: Union[Catalog, Iterable[Tbl]],
+    dialect: Union[str, Dialect] = "sqlite",
+) -> Iterator[str]:
+    """Yield the DDL statements of tables one by one. If it passes the catalog,
+    the tables will order by its dependencies, and the foreign keys will add
+    with alter table statements after all tables if the catalog has cycles.
+    The dialect that accepts forward references, like SQLite, keeps them on
+    create table statements instead.
+    """
+    d: Dialect = get_dialect(dialect)
+    deferred: bool = False
+    if isinstance(tables, Catalog):
+        catalog: Catalog = tables
+        try:
+            tables = (catalog.tbl(name) for name in catalog.order())
+        except ValueError:
+            deferred = not d.forward_refs
+            tables = catalog.objects
+
+    if not deferred:
+        for tbl in tables:
+            yield d.create_table(tbl)
+        return
+
+    for tbl in tables:
+        yield d.create_table(tbl, fk=False)
+    for tbl in tables:
+        yield from d.alter_fks(tbl)
+
+
+def write_ddl(
+    tables: Union[Catalog, Iterable[Tbl]],
+    file: Union[str, Path, TextIO],
+    dialect: Union[str, Dialect] = "sqlite",
+) -> int:
+    """Write the DDL statements of tables to the file without build one large
+    string and return a number of statements.
+    """
+    if isinstance(file, (str, Path)):
+        with open(file, mode="w", encoding="utf-8") as f:
+            return write_ddl(tables, f, dialect)
+
+    count: int = 0
+    for statement in iter_ddl(tables, dialect):
+        file.write(f"{statement};\n\n")
+        count += 1
+    return count
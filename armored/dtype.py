@@ -3,17 +3,26 @@
 # Licensed under the MIT License. See LICENSE in the project root for
 # license information.
 # ------------------------------------------------------------------------------
+from collections.abc import Iterable
 from typing import (
     Annotated,
+    Any,
     Literal,
-    Union,
 )
 
-from pydantic import BaseModel, Field
-from pydantic.functional_validators import field_validator
+from pydantic import (
+    ConfigDict,
+    Field,
+    SerializeAsAny,
+    ValidatorFunctionWrapHandler,
+)
+from pydantic.functional_validators import WrapValidator, field_validator
+
+from .__base import BaseWatchedModel, construct_trusted, fingerprint
+from .settings import DtypeSetting
 
 
-class BaseType(BaseModel):
+class BaseType(BaseWatchedModel):
     """Base Type"""
 
     type: str = "base"
@@ -21,6 +30,28 @@ class BaseType(BaseModel):
     def __str__(self) -> str:
         return self.type
 
+    def fingerprint(self) -> str:
+        """Return the canonical fingerprint of this datatype."""
+        return fingerprint(self)
+
+    @classmethod
+    def from_trusted(cls, values: dict[str, Any], *, check: bool = False):
+        """Construct the datatype from the trusted values without validation.
+        The base model dispatches the values to the registered model of its
+        type, like the `Dtype` annotation.
+
+        Examples:
+            >>> BaseType.from_trusted({"type": "varchar", "max_length": 10})
+            VarcharType(type='varchar', max_length=10)
+        """
+        model: type[BaseType] = cls
+        if cls is BaseType and isinstance(t := values.get("type"), str):
+            if t in DTYPE_ALIASES:
+                values = {**values, "type": DTYPE_ALIASES[t]}
+            model = get_dtype(t)
+        rs: BaseType = construct_trusted(model, values, check=check)
+        return intern_dtype(rs) if DtypeSetting.intern else rs
+
 
 class StringType(BaseType):
     """String Type
@@ -99,10 +130,16 @@ class BigIntType(BaseType):
     type: Literal["bigint"] = "bigint"
 
 
-class ShortType(BaseType): ...
+class ShortType(BaseType):
+    """Short Integer Type"""
 
+    type: Literal["short"] = "short"
 
-class LongType(BaseType): ...
+
+class LongType(BaseType):
+    """Long Integer Type"""
+
+    type: Literal["long"] = "long"
 
 
 class NumericType(BaseType):
@@ -133,7 +170,10 @@ class RealType(BaseType):
     type: Literal["real"] = "real"
 
 
-class DoublePrecisionType(BaseType): ...
+class DoublePrecisionType(BaseType):
+    """Double Precision Type"""
+
+    type: Literal["double precision"] = "double precision"
 
 
 class TimestampType(BaseType):
@@ -147,31 +187,180 @@ class TimestampType(BaseType):
     ] = False
 
 
-class TimeType(BaseType): ...
+class TimeType(BaseType):
+    """Time Type"""
 
+    type: Literal["time"] = "time"
 
-class DateType(BaseType): ...
 
+class DateType(BaseType):
+    """Date Type"""
 
-class DateTimeType(BaseType): ...
+    type: Literal["date"] = "date"
+
+
+class DateTimeType(BaseType):
+    """Datetime Type"""
+
+    type: Literal["datetime"] = "datetime"
 
 
 class SerialType(BaseType):
     """Serial Type"""
 
-    type: Literal["serial"]
-
-
-Dtype = Union[
-    StringType,
-    CharType,
-    VarcharType,
-    TextType,
-    NumericType,
-    DecimalType,
-    TimestampType,
-    IntegerType,
-    BigIntType,
-    SmallIntType,
-    BaseType,
-]
+    type: Literal["serial"] = "serial"
+
+
+# Note: the registry of datatype models that keyed by the default value of its
+#   type field and the alias table that map short name of type to its key.
+DTYPES: dict[str, type[BaseType]] = {}
+DTYPE_ALIASES: dict[str, str] = {}
+
+
+def register_dtype(
+    model: type[BaseType],
+    *,
+    aliases: Iterable[str] = (),
+) -> type[BaseType]:
+    """Register the datatype model to the registry for dispatch the `Dtype`
+    value with its type.
+
+    Example:
+        *   class BoolType(BaseType):
+                type: Literal["boolean"] = "boolean"
+
+            register_dtype(BoolType, aliases=("bool", ))
+    """
+    name: str = model.model_fields["type"].default
+    DTYPES[name] = model
+    for alias in aliases:
+        DTYPE_ALIASES[alias] = name
+    return model
+
+
+def get_dtype(name: str) -> type[BaseType]:
+    """Return the datatype model of the type name or alias, it will return
+    `BaseType` if it does not register.
+
+    Examples:
+        >>> get_dtype("int").__name__
+        'IntegerType'
+        >>> get_dtype("foo").__name__
+        'BaseType'
+    """
+    return DTYPES.get(DTYPE_ALIASES.get(name, name), BaseType)
+
+
+for _model, _aliases in (
+    (BaseType, ()),
+    (StringType, ("str",)),
+    (CharType, ()),
+    (VarcharType, ()),
+    (TextType, ()),
+    (IntegerType, ("int",)),
+    (SmallIntType, ()),
+    (BigIntType, ()),
+    (ShortType, ()),
+    (LongType, ()),
+    (NumericType, ()),
+    (DecimalType, ()),
+    (FloatType, ()),
+    (RealType, ()),
+    (DoublePrecisionType, ("double",)),
+    (TimestampType, ()),
+    (TimeType, ()),
+    (DateType, ()),
+    (DateTimeType, ()),
+    (SerialType, ()),
+):
+    register_dtype(_model, aliases=_aliases)
+
+
+# Note: the frozen model of each datatype model and the intern table of frozen
+#   datatype values that keyed by its frozen model and values.
+_FROZEN_DTYPES: dict[type[BaseType], type[BaseType]] = {}
+_INTERNED_DTYPES: dict[tuple[type[BaseType], tuple[Any, ...]], BaseType] = {}
+
+
+def _load_interned(model: type[BaseType], values: dict[str, Any]) -> BaseType:
+    return intern_dtype(model.model_construct(**values))
+
+
+def frozen_dtype(model: type[BaseType]) -> type[BaseType]:
+    """Return the frozen and hashable subclass of the datatype model."""
+    if model.model_config.get("frozen"):
+        return model
+    if (frozen := _FROZEN_DTYPES.get(model)) is not None:
+        return frozen
+
+    class Frozen(model):
+        model_config = ConfigDict(frozen=True)
+
+        def __reduce__(self):
+            # Note: the frozen model does not importable from any module, so
+            #   it will intern the value again after unpickling.
+            return _load_interned, (model, dict(self.__dict__))
+
+    Frozen.__name__ = Frozen.__qualname__ = model.__name__
+    return _FROZEN_DTYPES.setdefault(model, Frozen)
+
+
+def intern_dtype(value: BaseType) -> BaseType:
+    """Return the frozen instance that share for all equal datatype values.
+
+    Examples:
+        >>> a = intern_dtype(VarcharType(max_length=255))
+        >>> a is intern_dtype(VarcharType(max_length=255))
+        True
+        >>> a is intern_dtype(VarcharType(max_length=10))
+        False
+    """
+    model: type[BaseType] = frozen_dtype(type(value))
+    try:
+        key = (model, tuple(value.__dict__.items()))
+        if (interned := _INTERNED_DTYPES.get(key)) is not None:
+            return interned
+    except TypeError:
+        # Note: the custom datatype that has unhashable values does not able
+        #   to intern, it will return only the frozen instance.
+        return model.model_construct(value.model_fields_set, **value.__dict__)
+    return _INTERNED_DTYPES.setdefault(
+        key,
+        (
+            value
+            if type(value) is model
+            else model.model_construct(value.model_fields_set, **value.__dict__)
+        ),
+    )
+
+
+def intern_dtype_info() -> int:
+    """Return a number of interned datatype values."""
+    return len(_INTERNED_DTYPES)
+
+
+def intern_dtype_clear() -> None:
+    """Clear the intern table of datatype values."""
+    _INTERNED_DTYPES.clear()
+
+
+def dispatch_dtype(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    """Validate the value with only one datatype model that match with its
+    type from the registry. The alias of type will change to its full name.
+
+    Note:
+        If the intern mode was enabled on `DtypeSetting`, it will return the
+    frozen instance that share for all equal datatype values.
+    """
+    if isinstance(value, BaseType):
+        rs = value
+    elif isinstance(value, dict) and isinstance(t := value.get("type"), str):
+        if t in DTYPE_ALIASES:
+            value = {**value, "type": DTYPE_ALIASES[t]}
+        rs = get_dtype(t).model_validate(value)
+    else:
+        rs = handler(value)
+    return intern_dtype(rs) if DtypeSetting.intern else rs
+
+
+Dtype = Annotated[SerializeAsAny[BaseType], WrapValidator(dispatch_dtype)]
@@ -0,0 +1,449 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) 2022 Korawich Anuttra. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for
+# license information.
+# ------------------------------------------------------------------------------
+"""Connection pool of the database connection model that keeps the opened
+connections of its driver and shares them between threads. The pool of each
+connection model shares by its fingerprint, so the equal models that parse
+from the same url use the same pool.
+
+Options:
+    *   pool_min_size       A number of connections that the pool keeps open
+                            even if they are idle.
+    *   pool_max_size       A number of connections that the pool able to open.
+    *   pool_idle_timeout   Seconds that the idle connection keeps open before
+                            it closes.
+    *   pool_timeout        Seconds that the checkout waits for the connection
+                            when all connections are in use.
+    *   pool_pre_ping       Check the health of idle connection on checkout.
+
+Note:
+    The options of pool do not pass to the driver, and the values of options
+able to be strings because the options that parse from url are strings.
+"""
+import sqlite3
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    NamedTuple,
+    Optional,
+)
+
+from .conn import DbConn
+from .settings import PoolSetting
+
+
+class PoolError(Exception):
+    """Error of the connection pool."""
+
+
+class PoolTimeout(PoolError):
+    """Checkout waits longer than the timeout of pool."""
+
+
+class Driver(NamedTuple):
+    """Driver of the database that opens the DB-API connection of connection
+    model with the options that are not the options of pool, and checks the
+    health of opened connection.
+    """
+
+    connect: Callable[[DbConn, dict[str, Any]], Any]
+    ping: Callable[[Any], None]
+
+
+DRIVERS: dict[str, Driver] = {}
+DRIVER_ALIASES: dict[str, str] = {}
+
+
+def register_driver(
+    name: str,
+    connect: Callable[[DbConn, dict[str, Any]], Any],
+    ping: Optional[Callable[[Any], None]] = None,
+    aliases: tuple[str, ...] = (),
+) -> Driver:
+    """Register the driver of database with its aliases, the ping function
+    raises any exception if the connection does not healthy, and it executes
+    `select 1` on the new cursor by default.
+
+    Examples:
+        *   import psycopg
+
+            register_driver(
+                "postgres",
+                lambda conn, options: psycopg.connect(
+                    host=conn.host,
+                    port=conn.port,
+                    user=conn.user,
+                    password=conn.pwd.get_secret_value(),
+                    dbname=conn.db,
+                    **options,
+                ),
+                aliases=("postgres+psycopg", ),
+            )
+    """
+    driver: Driver = Driver(connect, ping or _ping)
+    DRIVERS[name] = driver
+    for alias in aliases:
+        DRIVER_ALIASES[alias] = name
+    return driver
+
+
+def get_driver(name: str) -> Driver:
+    """Return the registered driver of the driver name or alias.
+
+    :raises PoolError: If the driver does not register.
+    """
+    if (driver := DRIVERS.get(DRIVER_ALIASES.get(name, name))) is None:
+        raise PoolError(f"driver {name!r} does not register")
+    return driver
+
+
+def _ping(connection: Any) -> None:
+    cursor = connection.cursor()
+    try:
+        cursor.execute("select 1")
+        cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+# Note: the options that `sqlite3.connect` accepts with the function that
+#   converts the string value from url, other options keep on the connection
+#   model and do not pass to the driver.
+SQLITE_OPTIONS: dict[str, Callable[[Any], Any]] = {
+    "timeout": float,
+    "detect_types": int,
+    "isolation_level": lambda v: None if v in (None, "", "none") else str(v),
+    "check_same_thread": lambda v: _to_bool(v),
+    "cached_statements": int,
+    "uri": lambda v: _to_bool(v),
+}
+
+
+def _sqlite_connect(conn: DbConn, options: dict[str, Any]) -> Any:
+    """Open the sqlite connection of the `path` option or the database name,
+    the connection able to use from other threads by default because the pool
+    makes sure that only one thread uses it at the time.
+    """
+    kwargs: dict[str, Any] = {"check_same_thread": False}
+    kwargs.update(
+        (name, SQLITE_OPTIONS[name](value))
+        for name, value in options.items()
+        if name in SQLITE_OPTIONS
+    )
+    return sqlite3.connect(options.get("path", conn.db), **kwargs)
+
+
+register_driver("sqlite", _sqlite_connect, aliases=("sqlite3",))
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.lower() in ("1", "true", "yes", "on")
+    return bool(value)
+
+
+class PoolStats(NamedTuple):
+    """Metrics of the connection pool."""
+
+    size: int
+    idle: int
+    in_use: int
+    waiting: int
+    checkouts: int
+    created: int
+    closed: int
+    timeouts: int
+    failed_pings: int
+
+
+class _Idle(NamedTuple):
+    connection: Any
+    since: float
+
+
+class Pool:
+    """Thread-safe connection pool of the database connection model.
+
+    Examples:
+        >>> conn = DbConn(
+        ...     driver="sqlite", host="localhost", port=0, user="", pwd="",
+        ...     db=":memory:", options={"pool_max_size": "2"},
+        ... )
+        >>> with Pool(conn) as pool:
+        ...     with pool.connection() as connection:
+        ...         connection.execute("select 1").fetchone()
+        (1,)
+
+    :param conn: A database connection model.
+
+    :raises PoolError: If the driver does not register or the size of pool is
+        not valid.
+    """
+
+    def __init__(self, conn: DbConn) -> None:
+        self.conn: DbConn = conn
+        self.driver: Driver = get_driver(conn.driver)
+        options: dict[str, Any] = dict(conn.options)
+        self.min_size: int = int(
+            options.pop("pool_min_size", PoolSetting.min_size)
+        )
+        self.max_size: int = int(
+            options.pop("pool_max_size", PoolSetting.max_size)
+        )
+        self.idle_timeout: float = float(
+            options.pop("pool_idle_timeout", PoolSetting.idle_timeout)
+        )
+        self.timeout: float = float(
+            options.pop("pool_timeout", PoolSetting.timeout)
+        )
+        self.pre_ping: bool = _to_bool(
+            options.pop("pool_pre_ping", PoolSetting.pre_ping)
+        )
+        if not 0 <= self.min_size <= self.max_size or self.max_size < 1:
+            raise PoolError(
+                "pool_min_size should be between 0 and pool_max_size that is "
+                "positive"
+            )
+        self.options: dict[str, Any] = options
+        self.closed: bool = False
+        self._cond: threading.Condition = threading.Condition()
+        # Note: the idle connections keep the last released one on the right,
+        #   so the checkout reuses the warm one and the old ones expire.
+        self._idle: deque[_Idle] = deque()
+        self._size: int = 0
+        self._waiting: int = 0
+        # Note: the ids of checked out connections, the connection that does
+        #   not check out from this pool does not able to release.
+        self._in_use: set[int] = set()
+        self._counts: dict[str, int] = dict.fromkeys(
+            ("checkouts", "created", "closed", "timeouts", "failed_pings"), 0
+        )
+        for _ in range(self.min_size):
+            self._size += 1
+            self._idle.append(_Idle(self._open(), time.monotonic()))
+
+    def __enter__(self) -> "Pool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(driver={self.conn.driver!r}, "
+            f"size={self._size}, max_size={self.max_size})"
+        )
+
+    def _open(self) -> Any:
+        """Open the new connection, the slot of it should reserve before."""
+        try:
+            connection: Any = self.driver.connect(self.conn, self.options)
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._counts["created"] += 1
+        return connection
+
+    def _close(self, connection: Any) -> None:
+        try:
+            connection.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._counts["closed"] += 1
+
+    def _expired(self, now: float) -> list[Any]:
+        """Pop the idle connections that exceed the idle timeout until the
+        minimum size, it should call with the lock.
+        """
+        rs: list[Any] = []
+        while (
+            self._idle
+            and self._size > self.min_size
+            and now - self._idle[0].since > self.idle_timeout
+        ):
+            rs.append(self._idle.popleft().connection)
+            self._size -= 1
+        return rs
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """Check out the connection from this pool, it reuses the idle one or
+        opens the new one until the max size, otherwise it waits for the
+        released connection.
+
+        :param timeout: Seconds that it waits, the timeout of pool by default.
+
+        :raises PoolTimeout: If it waits longer than the timeout.
+        :raises PoolError: If this pool was closed.
+        """
+        deadline: float = time.monotonic() + (
+            self.timeout if timeout is None else timeout
+        )
+        while True:
+            connection: Any = None
+            with self._cond:
+                expired: list[Any] = self._expired(time.monotonic())
+                while not self.closed and not self._idle:
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+                    remaining: float = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._counts["timeouts"] += 1
+                        raise PoolTimeout(
+                            f"does not get the connection of pool in "
+                            f"{self.timeout if timeout is None else timeout}s"
+                        )
+                    self._waiting += 1
+                    self._cond.wait(remaining)
+                    self._waiting -= 1
+                if self.closed:
+                    raise PoolError("pool was closed")
+                if self._idle:
+                    connection = self._idle.pop().connection
+                self._counts["checkouts"] += 1
+            for c in expired:
+                self._close(c)
+
+            if connection is None:
+                return self._checkout(self._open())
+            if not self.pre_ping or self._healthy(connection):
+                return self._checkout(connection)
+            # Note: the broken connection releases its slot and the checkout
+            #   tries again with the next idle connection or the new one.
+            with self._cond:
+                self._size -= 1
+                self._counts["checkouts"] -= 1
+                self._counts["failed_pings"] += 1
+            self._close(connection)
+
+    def _checkout(self, connection: Any) -> Any:
+        with self._cond:
+            self._in_use.add(id(connection))
+        return connection
+
+    def _healthy(self, connection: Any) -> bool:
+        try:
+            self.driver.ping(connection)
+        except Exception:
+            return False
+        return True
+
+    def release(self, connection: Any, *, discard: bool = False) -> None:
+        """Check in the connection to this pool, it rolls back the transaction
+        that does not commit. The connection that discards or does not able to
+        roll back closes instead.
+
+        :raises PoolError: If the connection does not check out from this pool
+            or it was released already.
+        """
+        with self._cond:
+            if id(connection) not in self._in_use:
+                raise PoolError(
+                    "connection does not check out from this pool or it was "
+                    "released already"
+                )
+            self._in_use.remove(id(connection))
+        if not discard:
+            try:
+                connection.rollback()
+            except Exception:
+                discard = True
+        with self._cond:
+            if discard or self.closed:
+                self._size -= 1
+            else:
+                self._idle.append(_Idle(connection, time.monotonic()))
+                connection = None
+            self._cond.notify()
+        if connection is not None:
+            self._close(connection)
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """Check out the connection for the block and check it in after the
+        block. It rolls back the connection after any error of the block, and
+        it discards the connection if the block was interrupted.
+        """
+        connection: Any = self.acquire(timeout)
+        try:
+            yield connection
+        except BaseException as err:
+            self.release(connection, discard=not isinstance(err, Exception))
+            raise
+        else:
+            self.release(connection)
+
+    def prune(self) -> int:
+        """Close the idle connections that exceed the idle timeout and return
+        a number of closed connections.
+        """
+        with self._cond:
+            expired: list[Any] = self._expired(time.monotonic())
+        for connection in expired:
+            self._close(connection)
+        return len(expired)
+
+    def stats(self) -> PoolStats:
+        """Return metrics of this pool."""
+        with self._cond:
+            return PoolStats(
+                size=self._size,
+                idle=len(self._idle),
+                in_use=len(self._in_use),
+                waiting=self._waiting,
+                **self._counts,
+            )
+
+    def close(self) -> None:
+        """Close all idle connections and wake up all waiting checkouts, the
+        connection that is in use closes when it releases.
+        """
+        with self._cond:
+            self.closed = True
+            idle: list[_Idle] = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for item in idle:
+            self._close(item.connection)
+
+
+_POOLS: dict[str, Pool] = {}
+_POOLS_LOCK: threading.Lock = threading.Lock()
+
+
+def get_pool(conn: DbConn) -> Pool:
+    """Return the shared pool of the database connection model, the models
+    that have the same fingerprint share the same pool.
+    """
+    key: str = conn.fingerprint()
+    with _POOLS_LOCK:
+        if (pool := _POOLS.get(key)) is None or pool.closed:
+            pool = _POOLS[key] = Pool(conn)
+        return pool
+
+
+def close_pools() -> None:
+    """Close all shared pools."""
+    with _POOLS_LOCK:
+        pools: list[Pool] = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
@@ -5,6 +5,27 @@
 # ------------------------------------------------------------------------------
 class ColumnSetting:
     dtype: tuple[str, ...] = ("dtype", "datatype", "type")
+    spec_cache_size: int = 4096
+    check_cache_size: int = 1024
+    # Note: the limits of distinct values of the dictionary encoding column
+    #   before it falls back to the plain list.
+    dict_max_distinct: int = 65_536
+    dict_max_ratio: float = 0.5
+
+
+class DtypeSetting:
+    # Note: share one frozen instance for all equal datatype values that pass
+    #   the `Dtype` validation.
+    intern: bool = False
+
+
+class PoolSetting:
+    # Note: the default options of the connection pool of database.
+    min_size: int = 0
+    max_size: int = 5
+    idle_timeout: float = 300.0
+    timeout: float = 30.0
+    pre_ping: bool = True
 
 
 class TSSetting:
@@ -6,15 +6,20 @@
 from typing import Any, Literal, Optional
 
 from pydantic import (
-    BaseModel,
     field_validator,
 )
 
+from .__base import BaseWatchedModel, fingerprint
 
-class BaseAct(BaseModel):
+
+class BaseAct(BaseWatchedModel):
     type: str
     desc: Optional[str] = None
 
+    def fingerprint(self) -> str:
+        """Return the canonical fingerprint of this activity."""
+        return fingerprint(self)
+
 
 class CopyActivity(BaseAct):
     type: Literal["copy"] = "copy"
@@ -4,12 +4,37 @@
 # license information.
 # ------------------------------------------------------------------------------
 import re
+from functools import lru_cache
 from typing import (
     Any,
     Optional,
     Union,
 )
 
+from .settings import ColumnSetting
+
+SERIAL_DEFAULT: str = "nextval('tablename_colname_seq')"
+
+DTYPE_PATTERN: re.Pattern = re.compile(
+    r"(?P<type>\w+)"
+    r"(?:\s?\(\s?(?P<max_length>\d+)(?:,\s?(?P<scale>\d+))?\s?\))?"
+)
+
+# Note: the order of this alternation is the priority of each token. Quoted
+#   literal and check statement come first because their bodies can contain
+#   other keywords like `null` or `default`.
+COLUMN_SPEC_PATTERN: re.Pattern = re.compile(
+    r"(?P<quote>'(?:[^']|'')*')"
+    r"|(?P<check>\bcheck\s?\([^()]*(?:\(.*\))*[^()]*\))"
+    r"|(?P<check_error>\bcheck\b)"
+    r"|\b(?P<not_null>not\s+null|Not\s+Null|NOT\s+NULL)\b"
+    r"|\b(?P<null>null|Null|NULL)\b"
+    r"|\b(?P<unique>unique)\b"
+    r"|\b(?P<pk>primary\s+key)\b"
+    r"|\b(?P<serial>serial)\b"
+    r"|\b(?P<default>default)\b"
+)
+
 
 def catch_str(
     value: str,
@@ -89,27 +114,132 @@ def only_one(
 
 
 def extract_dtype(dtype: str) -> dict[str, Any]:
-    """
+    """Extract the datatype string to the dict of datatype values. The result
+    of this function was cached by the datatype string.
+
     Examples:
     >>> extract_dtype("varchar( 255 )")
     {'type': 'varchar', 'max_length': '255'}
     >>> extract_dtype("numeric(19, 2)")
     {'type': 'numeric', 'precision': '19', 'scale': '2'}
+    >>> extract_dtype("timestamp")
+    {'type': 'timestamp'}
     """
-    if m := re.search(
-        r"(?P<type>\w+)"
-        r"(?:\s?\(\s?(?P<max_length>\d+)(?:,\s?(?P<scale>\d+))?\s?\))?",
-        dtype.strip(),
-    ):
+    return dict(_extract_dtype(dtype))
+
+
+@lru_cache(maxsize=ColumnSetting.spec_cache_size)
+def _extract_dtype(dtype: str) -> tuple[tuple[str, Any], ...]:
+    if m := DTYPE_PATTERN.search(dtype.strip()):
         extract = m.groupdict()
         if (t := extract["type"]) in ("numeric", "decimal"):
             extract["precision"] = extract.pop("max_length")
             extract["scale"] = extract.pop("scale", None) or -1
-            return extract
+        else:
+            extract.pop("scale")
+            if t in ("timestamp", "time"):
+                extract["precision"] = extract.pop("max_length")
 
-        extract.pop("scale")
-        if t in ("timestamp", "time"):
-            extract["precision"] = extract.pop("max_length")
-            return extract
-        return extract
-    return {"type": dtype}
+        # Note: drop the optional values that does not set on datatype string
+        #   for respect the default values of datatype model.
+        return tuple((k, v) for k, v in extract.items() if v is not None)
+    return (("type", dtype),)
+
+
+def extract_column(value: str, *, parse_dtype: bool = False) -> dict[str, Any]:
+    """Extract column values from the column specification string with the
+    single pass tokenizer. The result of this function was cached by the
+    specification string because the same specifications always repeat on
+    any catalogs.
+
+    This function will extract values from the format,
+        {DATATYPE} {UNIQUE} {NULLABLE} {DEFAULT}
+        {PRIMARY KEY|FOREIGN KEY} {CHECK}
+
+    Examples:
+    >>> extract_column("numeric( 10, 2 )")
+    {'nullable': True, 'unique': False, 'pk': False, 'dtype': 'numeric( 10, 2 )'}
+    >>> extract_column("varchar( 100 ) not null default 'O'")
+    {'nullable': False, 'unique': False, 'pk': False, 'dtype': 'varchar( 100 )', 'default': "'O'"}
+    >>> extract_column("serial primary key", parse_dtype=True)
+    {'nullable': False, 'unique': False, 'pk': True, 'dtype': {'type': 'integer'}, 'default': "nextval('tablename_colname_seq')"}
+    """
+    column, dtype = _extract_column(value)
+    values: dict[str, Any] = dict(column)
+    if parse_dtype:
+        values["dtype"] = dict(dtype)
+    return values
+
+
+def extract_column_cache_info():
+    """Return the hits and misses statistic of the column specification
+    cache.
+    """
+    return _extract_column.cache_info()
+
+
+def extract_column_cache_clear() -> None:
+    """Clear the column specification and datatype caches."""
+    _extract_column.cache_clear()
+    _extract_dtype.cache_clear()
+
+
+@lru_cache(maxsize=ColumnSetting.spec_cache_size)
+def _extract_column(
+    value: str,
+) -> tuple[tuple[tuple[str, Any], ...], tuple[tuple[str, Any], ...]]:
+    # Note: the first part keep the datatype tokens and the second part keep
+    #   the default tokens that come after the `default` keyword.
+    parts: tuple[list[str], list[str]] = ([], [])
+    side: int = 0
+    check: Optional[str] = None
+    null: bool = False
+    not_null: bool = False
+    unique: bool = False
+    pk: bool = False
+    serial: bool = False
+    pos: int = 0
+    for m in COLUMN_SPEC_PATTERN.finditer(value):
+        parts[side].append(value[pos : m.start()])
+        pos = m.end()
+        token: str = m.lastgroup
+        if token == "quote":
+            parts[side].append(m.group())
+        elif token == "check":
+            check = m.group()
+        elif token == "check_error":
+            raise ValueError(
+                "datatype with type string does not support for "
+                "this format of check"
+            )
+        elif token == "not_null":
+            not_null = True
+        elif token == "null":
+            null = True
+        elif token == "unique":
+            unique = True
+        elif token == "pk":
+            pk = True
+        elif token == "serial":
+            serial = True
+            parts[side].append(" integer ")
+        elif side == 0:
+            side = 1
+        else:
+            parts[side].append(m.group())
+    parts[side].append(value[pos:])
+
+    column: dict[str, Any] = {"nullable": False, "unique": unique, "pk": pk}
+    if check is not None:
+        column["check"] = check
+    column["dtype"] = " ".join("".join(parts[0]).split())
+    if side == 1:
+        column["default"] = " ".join("".join(parts[1]).split())
+    elif serial:
+        not_null, null = True, False
+        column["default"] = SERIAL_DEFAULT
+
+    # Note: a `null` keyword always wins over `not null` like `split_dtype`.
+    if not pk:
+        column["nullable"] = null or not not_null
+    return tuple(column.items()), _extract_dtype(column["dtype"])
@@ -0,0 +1,34 @@
+"""Benchmark of the catalog model that build the foreign key graph and order
+tables by its dependencies.
+"""
+
+from typing import Any, Callable
+
+from armored.bench import make_tables
+from armored.datasets import Catalog
+
+
+def _values(tables: int, columns: int) -> dict[str, Any]:
+    values: list[dict[str, Any]] = make_tables(tables, columns)
+    for i, tbl in enumerate(values[1:], start=1):
+        for ref in {i // 2, i - 1}:
+            tbl["feature"].append(
+                {
+                    "name": f"table_{ref}_id",
+                    "dtype": "integer",
+                    "fk": {"tbl": f"table_{ref}", "col": "id"},
+                }
+            )
+    return {"name": "bench", "objects": values}
+
+
+def bench_catalog_waves(tables: int, columns: int) -> Callable[[], Any]:
+    catalog = Catalog.model_validate(
+        _values(tables, columns), context={"lazy": True}
+    )
+
+    def run():
+        catalog.clear_cached()
+        return catalog.waves(), catalog.dangling(), catalog.cycles()
+
+    return run
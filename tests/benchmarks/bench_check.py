@@ -0,0 +1,28 @@
+"""Benchmark of the compiled check predicate that evaluates the whole batch of
+columns, the report includes the throughput as rows per second.
+"""
+
+from typing import Any, Callable
+
+from armored.datasets.check import compile_check
+
+TEXT: str = (
+    "check( <name> between 0 and 1000000 and code in ('a', 'b', 'c') "
+    "and length(note) <= 20 or note is null )"
+)
+
+
+def bench_check_predicate(tables: int, columns: int) -> Callable[[], Any]:
+    rows: int = tables * 100
+    batch: dict[str, list[Any]] = {
+        "qty": list(range(rows)),
+        "code": [("a", "b", "c", "d")[i % 4] for i in range(rows)],
+        "note": [None if i % 10 == 0 else f"note_{i}" for i in range(rows)],
+    }
+    predicate = compile_check(TEXT, "qty", "integer")
+
+    def run():
+        return len(predicate.violations(batch))
+
+    run.items = rows
+    return run
@@ -0,0 +1,76 @@
+"""Benchmark of the column specification parser that compare the legacy
+multi-pass parser with the single pass tokenizer with and without cache.
+"""
+
+import re
+from typing import Any, Callable
+
+from armored.bench import make_tables
+from armored.datasets import Col
+from armored.utils import (
+    catch_str,
+    extract_column,
+    extract_column_cache_clear,
+    split_dtype,
+)
+
+
+def legacy_extract_column(value: str) -> dict[str, Any]:
+    """The multi-pass parser that was used before the single pass tokenizer."""
+    values: dict[str, Any] = {"nullable": False}
+    _dtype, _nullable = split_dtype(value)
+    _dtype, values["unique"] = catch_str(_dtype, key="unique")
+    _dtype, values["pk"] = catch_str(_dtype, key="primary key")
+    _dtype, serial_flag = catch_str(_dtype, key="serial", replace="integer")
+    if "check" in _dtype:
+        m = re.search(
+            r"check\s?\((?P<check>[^()]*(?:\(.*\))*[^()]*)\)",
+            _dtype,
+        )
+        _dtype, values["check"] = catch_str(_dtype, m.group(), flag=False)
+    if re.search("default", _dtype):
+        _dtype, _default = _dtype.split("default", maxsplit=1)
+        values["dtype"] = _dtype.strip()
+        values["default"] = _default.strip()
+    else:
+        values["dtype"] = _dtype
+        if serial_flag:
+            _nullable: str = "not null"
+            values["default"] = "nextval('tablename_colname_seq')"
+    if not values["pk"]:
+        values["nullable"] = not re.search("not null", _nullable)
+    return values
+
+
+def _specs(tables: int, columns: int) -> list[str]:
+    return [
+        c["dtype"] for t in make_tables(tables, columns) for c in t["feature"]
+    ]
+
+
+def bench_column_spec_legacy(tables: int, columns: int) -> Callable[[], Any]:
+    specs: list[str] = _specs(tables, columns)
+    return lambda: [legacy_extract_column(s) for s in specs]
+
+
+def bench_column_spec_uncached(tables: int, columns: int) -> Callable[[], Any]:
+    specs: list[str] = _specs(tables, columns)
+
+    def run():
+        for s in specs:
+            extract_column_cache_clear()
+            extract_column(s, parse_dtype=True)
+
+    return run
+
+
+def bench_column_spec_cached(tables: int, columns: int) -> Callable[[], Any]:
+    specs: list[str] = _specs(tables, columns)
+    return lambda: [extract_column(s, parse_dtype=True) for s in specs]
+
+
+def bench_column_construct(tables: int, columns: int) -> Callable[[], Any]:
+    values: list[dict[str, Any]] = [
+        c for t in make_tables(tables, columns) for c in t["feature"]
+    ]
+    return lambda: [Col.model_validate(v) for v in values]
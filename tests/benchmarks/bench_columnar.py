@@ -0,0 +1,80 @@
+"""Benchmark of the columnar file that writes batches of rows and reads them
+back to the Python values, the report includes the throughput as rows per
+second.
+"""
+
+import os
+import tempfile
+import weakref
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable
+
+from armored.datasets import Batch
+from armored.datasets.columnar import ColumnarReader, write_columnar
+from armored.datasets.db import Tbl
+
+SPECS: tuple[tuple[str, Callable[[int], Any]], ...] = (
+    ("integer", lambda i: i),
+    ("varchar( 20 )", lambda i: f"status_{i % 20}"),
+    ("numeric( 10, 2 )", lambda i: Decimal(i) / 4),
+    ("float", lambda i: i + 0.5),
+    ("timestamp", lambda i: datetime(2024, 1, 1, 10, 0, i % 60)),
+)
+
+
+def _prepare(tables: int, columns: int) -> tuple[Tbl, list[Batch], int]:
+    rows: int = tables * 100
+    specs = [SPECS[j % len(SPECS)] for j in range(columns)]
+    tbl = Tbl(
+        name="bench",
+        feature=[
+            {"name": f"col_{j}", "dtype": dtype}
+            for j, (dtype, _) in enumerate(specs)
+        ],
+    )
+    batches: list[Batch] = []
+    for start in range(0, rows, 10_000):
+        stop: int = min(start + 10_000, rows)
+        batches.append(
+            Batch(
+                start=start,
+                size=stop - start,
+                columns={
+                    f"col_{j}": [func(i) for i in range(start, stop)]
+                    for j, (_, func) in enumerate(specs)
+                },
+            )
+        )
+    return tbl, batches, rows
+
+
+def _tempfile(run: Callable[[], Any]) -> str:
+    fd, path = tempfile.mkstemp(suffix=".col")
+    os.close(fd)
+    weakref.finalize(run, os.remove, path)
+    return path
+
+
+def bench_columnar_write(tables: int, columns: int) -> Callable[[], Any]:
+    tbl, batches, rows = _prepare(tables, columns)
+
+    def run():
+        return write_columnar(path, tbl, iter(batches))
+
+    path: str = _tempfile(run)
+    run.items = rows
+    return run
+
+
+def bench_columnar_read(tables: int, columns: int) -> Callable[[], Any]:
+    tbl, batches, rows = _prepare(tables, columns)
+
+    def run():
+        with ColumnarReader(path) as reader:
+            return sum(batch.size for batch in reader)
+
+    path: str = _tempfile(run)
+    write_columnar(path, tbl, iter(batches))
+    run.items = rows
+    return run
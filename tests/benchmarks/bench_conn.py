@@ -0,0 +1,21 @@
+"""Benchmark of the connection models that parse from url string."""
+
+from typing import Any, Callable
+
+from armored.conn import DbConn, FlConn
+
+
+def bench_db_conn_from_url(tables: int, columns: int) -> Callable[[], Any]:
+    urls: list[str] = [
+        f"postgres+psycopg://demo:P@ssw0rd@localhost:5432/db_{i}?timeout=10"
+        for i in range(tables)
+    ]
+    return lambda: [DbConn.from_url(url) for url in urls]
+
+
+def bench_fl_conn_from_url(tables: int, columns: int) -> Callable[[], Any]:
+    urls: list[str] = [
+        f"sftp://demo:P@ssw0rd@localhost:22/data/file_{i}.csv?echo=True"
+        for i in range(tables)
+    ]
+    return lambda: [FlConn.from_url(url) for url in urls]
@@ -0,0 +1,28 @@
+"""Benchmark of the DDL renderer that stream create table statements of the
+catalog to the file object.
+"""
+
+import io
+from typing import Any, Callable
+
+from armored.bench import make_tables
+from armored.datasets import Catalog
+from armored.ddl import get_dialect, write_ddl
+
+
+def bench_ddl_write(tables: int, columns: int) -> Callable[[], Any]:
+    values: list[dict[str, Any]] = make_tables(tables, columns)
+    for i, tbl in enumerate(values[1:], start=1):
+        tbl["feature"].append(
+            {
+                "name": "parent_id",
+                "dtype": "integer",
+                "fk": {"tbl": f"table_{i // 2}", "col": "id"},
+            }
+        )
+    catalog = Catalog(name="bench", objects=values)
+
+    def run():
+        return write_ddl(catalog, io.StringIO(), get_dialect("postgres"))
+
+    return run
@@ -0,0 +1,32 @@
+"""Benchmark of the dictionary encoding column that encodes the string column
+of few distinct values and validates it with the rules of its column, the
+report includes the throughput as values per second.
+"""
+
+from typing import Any, Callable
+
+from armored.datasets.db import Tbl
+from armored.datasets.dictionary import encode_columns
+from armored.datasets.rows import RowValidator
+
+
+def bench_dictionary_validate(tables: int, columns: int) -> Callable[[], Any]:
+    rows: int = tables * 100
+    tbl = Tbl(
+        name="bench",
+        feature=[
+            {"name": f"col_{j}", "dtype": "varchar( 10 ) not null"}
+            for j in range(columns)
+        ],
+    )
+    data: dict[str, list[str]] = {
+        f"col_{j}": [f"status_{i % (j + 20)}" for i in range(rows)]
+        for j in range(columns)
+    }
+    validator = RowValidator(tbl)
+
+    def run():
+        return validator.validate(encode_columns(tbl.feature, data)).total
+
+    run.items = rows * columns
+    return run
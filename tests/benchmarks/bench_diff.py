@@ -0,0 +1,21 @@
+"""Benchmark of the diff engine that plan the migration between two versions
+of the catalog with a few changed tables.
+"""
+
+from typing import Any, Callable
+
+from armored.bench import make_tables
+from armored.datasets import Catalog, plan_migration
+
+
+def bench_diff_plan(tables: int, columns: int) -> Callable[[], Any]:
+    before = Catalog(name="bench", objects=make_tables(tables, columns))
+    values: list[dict[str, Any]] = make_tables(tables, columns)
+    for tbl in values[::100]:
+        tbl["feature"].append({"name": "added", "dtype": "varchar( 10 )"})
+    after = Catalog(name="bench", objects=values)
+
+    def run():
+        return plan_migration(before, after)
+
+    return run
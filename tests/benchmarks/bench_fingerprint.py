@@ -0,0 +1,32 @@
+"""Benchmark of the fingerprint of the table that rehash after one column was
+updated compare with the hash of its JSON dump.
+"""
+
+import hashlib
+import json
+from typing import Any, Callable
+
+from armored.bench import make_tables
+from armored.datasets import Tbl
+
+
+def bench_fingerprint_json(tables: int, columns: int) -> Callable[[], Any]:
+    tbl = Tbl.model_validate(make_tables(1, columns)[0])
+
+    def run():
+        tbl.feature[0].update({"nullable": not tbl.feature[0].nullable})
+        return hashlib.sha256(
+            json.dumps(tbl.model_dump(), sort_keys=True).encode()
+        ).hexdigest()
+
+    return run
+
+
+def bench_fingerprint_update(tables: int, columns: int) -> Callable[[], Any]:
+    tbl = Tbl.model_validate(make_tables(1, columns)[0])
+
+    def run():
+        tbl.feature[0].update({"nullable": not tbl.feature[0].nullable})
+        return tbl.fingerprint()
+
+    return run
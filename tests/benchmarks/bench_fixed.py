@@ -0,0 +1,24 @@
+"""Benchmark of the fixed-point column that parses the number strings of the
+numeric column to scaled integers and sums them, the report includes the
+throughput as values per second.
+"""
+
+from typing import Any, Callable
+
+from armored.datasets.fixed import FixedColumn
+from armored.dtype import NumericType
+
+
+def bench_fixed_parse_sum(tables: int, columns: int) -> Callable[[], Any]:
+    dtype = NumericType(precision=19, scale=2)
+    rows: int = tables * 100
+    data: list[list[str]] = [
+        [f"{(i * (j + 1)) / 8:.2f}" for i in range(rows)]
+        for j in range(columns)
+    ]
+
+    def run():
+        return [FixedColumn.parse(values, dtype).sum() for values in data]
+
+    run.items = rows * columns
+    return run
@@ -0,0 +1,36 @@
+"""Benchmark of coercion kernels that convert columns of raw strings to the
+storage values of their datatypes, the report includes the throughput as
+values per second.
+"""
+
+from typing import Any, Callable
+
+from armored.datasets.col import Col
+from armored.datasets.kernels import kernel_for
+
+SPECS: tuple[tuple[str, Callable[[int], str]], ...] = (
+    ("integer", lambda i: str(i)),
+    ("varchar( 20 )", lambda i: f"status_{i % 20}"),
+    ("numeric( 10, 2 )", lambda i: f"{i / 4:.3f}"),
+    ("float", lambda i: f"{i + 0.5}"),
+    ("timestamp( 3 )", lambda i: f"2024-01-01 10:00:{i % 60:02d}.123456"),
+)
+
+
+def bench_kernels_coerce(tables: int, columns: int) -> Callable[[], Any]:
+    rows: int = tables * 100
+    columns_: list[tuple[Callable[..., Any], list[str]]] = []
+    for j in range(columns):
+        dtype, func = SPECS[j % len(SPECS)]
+        values: list[str] = [func(i) for i in range(rows)]
+        # Note: every fifth column has the NULL and error values that force the
+        #   kernel to visit each value.
+        if j % 5 == 4:
+            values[::10] = [""] * len(values[::10])
+        columns_.append((kernel_for(Col(name="c", dtype=dtype).dtype), values))
+
+    def run():
+        return sum(kernel(values).errors for kernel, values in columns_)
+
+    run.items = rows * columns
+    return run
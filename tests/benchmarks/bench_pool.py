@@ -0,0 +1,31 @@
+"""Benchmark of the connection pool that checks out its connection and runs
+one query for each checkout.
+"""
+
+import weakref
+from typing import Any, Callable
+
+from armored.conn import DbConn
+from armored.pool import Pool
+
+
+def bench_pool_checkout(tables: int, columns: int) -> Callable[[], Any]:
+    conn = DbConn(
+        driver="sqlite",
+        host="localhost",
+        port=0,
+        user="demo",
+        pwd="P@ssw0rd",
+        db=":memory:",
+        options={"pool_max_size": "2"},
+    )
+    pool = Pool(conn)
+
+    def run():
+        for _ in range(tables):
+            with pool.connection() as c:
+                c.execute("select 1").fetchone()
+
+    weakref.finalize(run, pool.close)
+    run.items = tables
+    return run
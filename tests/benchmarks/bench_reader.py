@@ -0,0 +1,77 @@
+"""Benchmark of the streaming CSV and JSON lines readers that convert rows to
+the columnar batches, the report includes the throughput as rows per second.
+"""
+
+import json
+import os
+import tempfile
+import weakref
+from typing import Any, Callable
+
+from armored.datasets.file import CsvFl, JsonFl
+
+SPECS: tuple[tuple[str, str], ...] = (
+    ("integer", "{i}"),
+    ("varchar( 20 )", "name_{i}"),
+    ("numeric( 10, 2 )", "{i}.25"),
+    ("float", "{i}.5"),
+    ("timestamp", "2024-01-01 10:00:{s:02d}"),
+)
+
+
+def bench_reader_csv(tables: int, columns: int) -> Callable[[], Any]:
+    rows: int = tables * 100
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    os.close(fd)
+    specs = [SPECS[j % len(SPECS)] for j in range(columns)]
+    with open(path, mode="w", encoding="utf-8", newline="") as f:
+        f.write(",".join(f"col_{j}" for j in range(columns)) + "\n")
+        for i in range(rows):
+            f.write(
+                ",".join(fmt.format(i=i, s=i % 60) for _, fmt in specs) + "\n"
+            )
+    fl = CsvFl(
+        name=path,
+        feature=[
+            {"name": f"col_{j}", "dtype": dtype}
+            for j, (dtype, _) in enumerate(specs)
+        ],
+        skip_footer=1,
+    )
+
+    def run():
+        return sum(batch.size for batch in fl.read(chunk_size=10_000))
+
+    run.items = rows
+    weakref.finalize(run, os.remove, path)
+    return run
+
+
+def bench_reader_ndjson(tables: int, columns: int) -> Callable[[], Any]:
+    rows: int = tables * 100
+    fd, path = tempfile.mkstemp(suffix=".jsonl")
+    os.close(fd)
+    specs = [SPECS[j % len(SPECS)] for j in range(columns)]
+    with open(path, mode="w", encoding="utf-8") as f:
+        for i in range(rows):
+            record: dict[str, Any] = {
+                f"col_{j}": fmt.format(i=i, s=i % 60)
+                for j, (_, fmt) in enumerate(specs)
+            }
+            # Note: the unused field that does not project to the batch.
+            record["payload"] = {"tags": ["a", "b"], "text": "x" * 40}
+            f.write(json.dumps(record) + "\n")
+    fl = JsonFl(
+        name=path,
+        feature=[
+            {"name": f"col_{j}", "dtype": dtype}
+            for j, (dtype, _) in enumerate(specs)
+        ],
+    )
+
+    def run():
+        return sum(batch.size for batch in fl.read(chunk_size=10_000))
+
+    run.items = rows
+    weakref.finalize(run, os.remove, path)
+    return run
@@ -0,0 +1,44 @@
+"""Benchmark of the row validator that check the columnar batches with the
+rules of columns, the report includes the throughput as rows per second.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable
+
+from armored.datasets import Batch, RowValidator
+from armored.datasets.db import Tbl
+
+SPECS: tuple[tuple[str, Callable[[int], Any]], ...] = (
+    ("integer not null", lambda i: i),
+    ("varchar( 20 )", lambda i: f"name_{i}"),
+    ("numeric( 10, 2 )", lambda i: Decimal(i) / 4),
+    ("float", lambda i: i + 0.5),
+    ("timestamp( 3 )", lambda i: datetime(2024, 1, 1, 10, 0, i % 60)),
+)
+
+
+def bench_rows_validate(tables: int, columns: int) -> Callable[[], Any]:
+    rows: int = tables * 100
+    specs = [SPECS[j % len(SPECS)] for j in range(columns)]
+    tbl = Tbl(
+        name="bench",
+        feature=[
+            {"name": f"col_{j}", "dtype": dtype}
+            for j, (dtype, _) in enumerate(specs)
+        ],
+    )
+    batch = Batch(
+        start=0,
+        size=rows,
+        columns={
+            f"col_{j}": [func(i) for i in range(rows)]
+            for j, (_, func) in enumerate(specs)
+        },
+    )
+
+    def run():
+        return RowValidator(tbl).validate(batch).total
+
+    run.items = rows
+    return run
@@ -0,0 +1,47 @@
+"""Benchmark of the catalog snapshot that load tables without validation
+compare with the validation of the raw catalog values.
+"""
+
+import io
+from typing import Any, Callable
+
+from armored.bench import make_tables
+from armored.datasets import Catalog, load_snapshot, save_snapshot
+
+
+def bench_snapshot_validate(tables: int, columns: int) -> Callable[[], Any]:
+    values: dict[str, Any] = {
+        "name": "bench",
+        "objects": make_tables(tables, columns),
+    }
+
+    def run():
+        return Catalog.model_validate(values)
+
+    return run
+
+
+def _snapshot(tables: int, columns: int) -> bytes:
+    buffer = io.BytesIO()
+    save_snapshot(
+        Catalog(name="bench", objects=make_tables(tables, columns)), buffer
+    )
+    return buffer.getvalue()
+
+
+def bench_snapshot_load(tables: int, columns: int) -> Callable[[], Any]:
+    data: bytes = _snapshot(tables, columns)
+
+    def run():
+        return load_snapshot(io.BytesIO(data))
+
+    return run
+
+
+def bench_snapshot_load_lazy(tables: int, columns: int) -> Callable[[], Any]:
+    data: bytes = _snapshot(tables, columns)
+
+    def run():
+        return load_snapshot(io.BytesIO(data), lazy=True)
+
+    return run
@@ -0,0 +1,75 @@
+"""Benchmark of the table model that construct, update and serialize on the
+synthetic catalog.
+"""
+
+from typing import Any, Callable
+
+from pydantic import TypeAdapter
+
+from armored.bench import make_tables
+from armored.datasets import Tbl
+
+CATALOG = TypeAdapter(list[Tbl])
+
+
+def _catalog(tables: int, columns: int) -> list[Tbl]:
+    return CATALOG.validate_python(make_tables(tables, columns))
+
+
+def bench_table_construct(tables: int, columns: int) -> Callable[[], Any]:
+    values: list[dict[str, Any]] = make_tables(tables, columns)
+    return lambda: [Tbl.model_validate(v) for v in values]
+
+
+def bench_table_validate_dump(tables: int, columns: int) -> Callable[[], Any]:
+    values: list[dict[str, Any]] = CATALOG.dump_python(
+        _catalog(tables, columns)
+    )
+    return lambda: [Tbl.model_validate(v) for v in values]
+
+
+def bench_table_from_trusted(tables: int, columns: int) -> Callable[[], Any]:
+    values: list[dict[str, Any]] = CATALOG.dump_python(
+        _catalog(tables, columns)
+    )
+    return lambda: [Tbl.from_trusted(v) for v in values]
+
+
+def bench_table_update(tables: int, columns: int) -> Callable[[], Any]:
+    tbls: list[Tbl] = _catalog(tables, columns)
+    return lambda: [t.update({"name": f"{t.name}_new"}) for t in tbls]
+
+
+def bench_table_update_incremental(
+    tables: int, columns: int
+) -> Callable[[], Any]:
+    tbls: list[Tbl] = _catalog(tables, columns)
+    return lambda: [
+        t.update({"name": f"{t.name}_new"}, incremental=True) for t in tbls
+    ]
+
+
+def bench_table_dict(tables: int, columns: int) -> Callable[[], Any]:
+    tbls: list[Tbl] = _catalog(tables, columns)
+    return lambda: [t.dict() for t in tbls]
+
+
+def bench_catalog_dump(tables: int, columns: int) -> Callable[[], Any]:
+    tbls: list[Tbl] = _catalog(tables, columns)
+    return lambda: CATALOG.dump_python(tbls)
+
+
+def bench_catalog_dump_json(tables: int, columns: int) -> Callable[[], Any]:
+    tbls: list[Tbl] = _catalog(tables, columns)
+    return lambda: CATALOG.dump_json(tbls)
+
+
+def bench_table_construct_lazy(tables: int, columns: int) -> Callable[[], Any]:
+    values: list[dict[str, Any]] = make_tables(tables, columns)
+    return lambda: [Tbl.lazy(v).pk for v in values]
+
+
+def bench_table_col_lookup(tables: int, columns: int) -> Callable[[], Any]:
+    tbls: list[Tbl] = _catalog(tables, columns)
+    names: list[str] = tbls[0].col_names()
+    return lambda: [t.col(name) for t in tbls for name in names]
@@ -0,0 +1,43 @@
+"""Benchmark of the uniqueness checker that spills entries to the sorted runs
+because of the small memory budget, the report includes the throughput as keys
+per second.
+"""
+
+from typing import Any, Callable
+
+from armored.datasets import Batch, UniqueChecker
+from armored.datasets.db import Tbl
+from armored.datasets.unique import ENTRY_SIZE
+
+
+def bench_unique_spill(tables: int, columns: int) -> Callable[[], Any]:
+    rows: int = tables * 100
+    tbl = Tbl(
+        name="bench",
+        feature=[
+            {"name": "id", "dtype": "bigint primary key"},
+            {"name": "code", "dtype": "varchar( 20 ) unique"},
+        ],
+    )
+    batches = [
+        Batch(
+            start=start,
+            size=min(10_000, rows - start),
+            columns={
+                "id": list(range(start, min(start + 10_000, rows))),
+                "code": [
+                    f"code_{i}" for i in range(start, min(start + 10_000, rows))
+                ],
+            },
+        )
+        for start in range(0, rows, 10_000)
+    ]
+
+    def run():
+        with UniqueChecker(tbl, memory=ENTRY_SIZE * rows // 4) as checker:
+            for batch in batches:
+                checker.add(batch)
+            return len(checker.finish())
+
+    run.items = rows * 2
+    return run
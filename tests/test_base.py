@@ -1,4 +1,8 @@
+from decimal import Decimal
+from typing import Any
+
 import pytest
+from pydantic import Field, ValidationError
 
 import armored.__base as base
 
@@ -23,3 +27,147 @@ def test_update(name):
     people.update(data={"name": "new foo", "nickname": "new bar"})
     assert "new foo" == people.name
     assert "new bar" == people.nickname
+
+
+@pytest.fixture(scope="module")
+def full_name(name):
+    class FullName(name):
+        surname: str = Field(alias="Surname")
+
+        @property
+        def full(self) -> str:
+            return f"{self.name} {self.surname}"
+
+    class NickName(FullName):
+        @property
+        def short(self) -> str:
+            return self.nickname[:1]
+
+    return NickName
+
+
+def test_metadata(full_name):
+    meta = full_name.get_metadata()
+    assert meta is full_name.get_metadata()
+    assert ("name", "nickname", "surname") == meta.fields
+    assert ("name", "nickname", "Surname") == meta.aliases
+    assert ("full", "short") == meta.properties
+    assert "surname" == meta.alias_map["Surname"]
+    assert ["name", "nickname", "Surname"] == full_name.get_field_names(
+        alias=True
+    )
+    assert ["full", "short"] == full_name.get_properties()
+
+
+def test_dict_with_properties(full_name):
+    people = full_name(name="foo", nickname="bar", surname="baz")
+    assert {
+        "name": "foo",
+        "nickname": "bar",
+        "surname": "baz",
+        "full": "foo baz",
+        "short": "b",
+    } == people.dict()
+    assert {"name": "foo", "full": "foo baz"} == people.dict(
+        include={"name", "full"}
+    )
+
+
+def test_update_with_alias(full_name):
+    people = full_name(name="foo", nickname="bar", surname="baz")
+    people.update(data={"Surname": "new baz"})
+    assert "new baz" == people.surname
+    assert "foo new baz" == people.full
+
+
+def test_update_incremental(full_name):
+    people = full_name(name="foo", nickname="bar", surname="baz")
+    assert set() == people.get_dirty_fields()
+    people.update(data={"Surname": "new baz", "age": 1}, incremental=True)
+    assert "new baz" == people.surname
+    assert "foo new baz" == people.full
+    assert {"surname"} == people.get_dirty_fields()
+    assert people == full_name(name="foo", nickname="bar", surname="new baz")
+
+    people.update(data={"name": "new foo"})
+    assert {"name", "surname"} == people.get_dirty_fields()
+    people.clear_dirty_fields()
+    assert set() == people.get_dirty_fields()
+
+
+def test_update_incremental_raise(full_name):
+    people = full_name(name="foo", nickname="bar", surname="baz")
+    with pytest.raises(ValidationError):
+        people.update(data={"name": "new foo", "surname": 1}, incremental=True)
+
+    # Note: the model does not change if any field does not pass validation.
+    assert "foo" == people.name
+    assert set() == people.get_dirty_fields()
+
+
+def test_fingerprint(name):
+    people = name(name="foo", nickname="bar")
+    assert (
+        people.fingerprint() == name(nickname="bar", name="foo").fingerprint()
+    )
+    assert (
+        people.fingerprint() != name(name="foo", nickname="baz").fingerprint()
+    )
+
+    before: str = people.fingerprint()
+    assert "__fingerprint__" in people.__dict__
+    people.nickname = "baz"
+    assert before != people.fingerprint()
+    people.update({"nickname": "bar"}, incremental=True)
+    assert before == people.fingerprint()
+    assert people == name(name="foo", nickname="bar")
+
+    assert base.fingerprint({"a": 1, "b": {2, 3}}) == base.fingerprint(
+        {"b": {3, 2}, "a": 1}
+    )
+    assert base.fingerprint([1, "1"]) != base.fingerprint(["1", 1])
+    with pytest.raises(TypeError):
+        base.fingerprint(object())
+
+
+def test_fingerprint_leaf_types():
+    class Leaf(base.BaseWatchedModel):
+        value: Any
+
+    digests = {
+        base.fingerprint(Leaf(value=v))
+        for v in (1, True, 1.0, Decimal("1.0"), Decimal("1.00"))
+    }
+    assert 5 == len(digests)
+
+
+def test_construct_trusted(full_name):
+    class Group(base.BaseUpdatableModel):
+        name: str
+        members: list[full_name] = Field(default_factory=list)
+        tags: list[str] = []
+
+    values = {
+        "name": "foo",
+        "members": [{"name": "a", "nickname": "b", "Surname": "c"}],
+    }
+    group = Group.from_trusted(values, check=True)
+    assert group == Group.model_validate(values)
+    assert {"name", "members"} == group.model_fields_set
+    assert "a c" == group.members[0].full
+    assert group.tags is not Group.from_trusted(values).tags
+
+    # Note: the trusted construction does not run any validators.
+    assert 1 == Group.from_trusted({"name": 1}).name
+
+    group.update({"name": "bar"})
+    assert "bar" == group.name
+
+    with pytest.raises(ValueError):
+        Group.from_trusted({"members": []}, check=True)
+    with pytest.raises(ValueError):
+        Group.from_trusted({"name": "foo", "other": 1}, check=True)
+    with pytest.raises(ValueError):
+        Group.from_trusted(
+            {"name": "foo", "members": [{"name": "a"}]}, check=True
+        )
@@ -0,0 +1,119 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from click.testing import CliRunner
+
+import armored.bench as bench
+import armored.cli
+from armored.cli import cli
+
+BENCH_PATH: Path = Path(__file__).parent / "benchmarks"
+
+
+class TestBench(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_make_tables(self):
+        t = bench.make_tables(3, 5)
+        self.assertEqual(3, len(t))
+        self.assertEqual(5, len(t[0]["feature"]))
+
+    def test_discover(self):
+        benches = bench.discover(BENCH_PATH, keyword="conn")
+        self.assertListEqual(
+            ["db_conn_from_url", "fl_conn_from_url"], sorted(benches)
+        )
+
+    def test_run_and_compare(self):
+        report = bench.run(
+            bench.discover(BENCH_PATH),
+            tables=2,
+            columns=3,
+            repeat=1,
+        )
+        self.assertIn("table_dict", report["results"])
+        self.assertIn("items_per_sec", report["results"]["reader_csv"])
+        self.assertEqual(2, report["meta"]["tables"])
+        self.assertDictEqual({}, bench.compare(report, report))
+
+        slower = {
+            "results": {
+                name: {"min": result["min"] * 2}
+                for name, result in report["results"].items()
+            }
+        }
+        self.assertSetEqual(
+            set(report["results"]),
+            set(bench.compare(slower, report, threshold=0.5)),
+        )
+
+
+class TestBenchCli(unittest.TestCase):
+    def test_bench_cli(self):
+        runner = CliRunner()
+        args = [
+            "bench",
+            "--path",
+            str(BENCH_PATH),
+            "-k",
+            "table_dict",
+            "--tables",
+            "2",
+            "--columns",
+            "3",
+            "--repeat",
+            "1",
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline: Path = Path(tmp) / "baseline.json"
+            rs = runner.invoke(cli, [*args, "--output", str(baseline)])
+            self.assertEqual(0, rs.exit_code, rs.output)
+            report = json.loads(baseline.read_text())
+            self.assertListEqual(["table_dict"], list(report["results"]))
+
+            report["results"]["table_dict"]["min"] /= 100
+            baseline.write_text(json.dumps(report))
+            rs = runner.invoke(cli, [*args, "--baseline", str(baseline)])
+            self.assertEqual(1, rs.exit_code)
+            self.assertIn("Regression: table_dict", rs.output)
+
+    def test_bench_cli_default_path(self):
+        runner = CliRunner()
+        cwd: str = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                rs = runner.invoke(
+                    cli,
+                    [
+                        "bench",
+                        "-k",
+                        "table_dict",
+                        "--tables",
+                        "1",
+                        "--repeat",
+                        "1",
+                    ],
+                )
+                missing = runner.invoke(cli, ["bench", "--path", "missing"])
+            finally:
+                os.chdir(cwd)
+        self.assertEqual(0, rs.exit_code, rs.output)
+        self.assertIn("table_dict", json.loads(rs.output)["results"])
+        self.assertEqual(2, missing.exit_code)
+        self.assertIn("benchmark directory 'missing'", missing.output)
+
+    def test_bench_cli_installed(self):
+        # Note: the installed package does not have the project file beside it,
+        #   even if other distribution ships the tests directory.
+        with tempfile.TemporaryDirectory() as tmp:
+            (Path(tmp) / "tests" / "benchmarks").mkdir(parents=True)
+            with mock.patch.object(armored.cli, "PROJECT_PATH", Path(tmp)):
+                rs = CliRunner().invoke(cli, ["bench"])
+        self.assertEqual(2, rs.exit_code)
+        self.assertIn("does not ship with the installed package", rs.output)
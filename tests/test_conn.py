@@ -23,6 +23,30 @@ class TestDBConn(unittest.TestCase):
         self.assertEqual("127.0.0.1", t.host)
         self.assertEqual("P%40ssw0rd", t.pwd.get_secret_value())
 
+    def test_db_conn_fingerprint(self):
+        url: str = "postgres://demo:P@ssw0rd@localhost:5432/db?echo=True"
+        t = conn.DbConn.from_url(url=url)
+        self.assertEqual(
+            t.fingerprint(), conn.DbConn.from_url(url).fingerprint()
+        )
+        self.assertNotEqual(
+            t.fingerprint(),
+            conn.DbConn.from_url(
+                url.replace("P@ssw0rd", "secret")
+            ).fingerprint(),
+        )
+
+    def test_db_conn_from_trusted(self):
+        t = conn.DbConn.from_url(
+            url="postgres://demo:P@ssw0rd@localhost:5432/db?echo=True"
+        )
+        self.assertEqual(t, conn.DbConn.from_trusted(t.model_dump()))
+        rs = conn.DbConn.from_trusted(
+            {**t.model_dump(), "pwd": "P%40ssw0rd"}, check=True
+        )
+        self.assertEqual(t, rs)
+        self.assertEqual("P%40ssw0rd", rs.pwd.get_secret_value())
+
 
 class TestFlConn(unittest.TestCase):
     def setUp(self):
@@ -35,3 +59,9 @@ class TestFlConn(unittest.TestCase):
         self.assertEqual("sqlite", t.sys)
         self.assertEqual("/D:/data/warehouse/main.sqlite", t.path)
         self.assertDictEqual({"echo": "True"}, t.options)
+
+    def test_fl_conn_from_trusted(self):
+        t = conn.FlConn.from_url(
+            url="sqlite:///D:/data/warehouse/main.sqlite?echo=True"
+        )
+        self.assertEqual(t, conn.FlConn.from_trusted(t.model_dump()))
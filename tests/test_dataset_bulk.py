@@ -0,0 +1,74 @@
+import unittest
+
+from pydantic import ValidationError
+
+import armored.datasets as ds
+
+
+def _tables(size: int):
+    return [
+        (
+            {
+                "name": f"foo_{i}",
+                "feature": [
+                    {"name": "id", "dtype": "integer primary key"},
+                    {"name": "name", "dtype": "varchar( 256 ) not null"},
+                ],
+            }
+            if i % 3
+            else {"name": f"foo_{i}", "feature": [{"name": "id"}]}
+        )
+        for i in range(size)
+    ]
+
+
+class TestValidateTables(unittest.TestCase):
+    def assert_results(self, rs: list, size: int):
+        self.assertEqual(size, len(rs))
+        for i, r in enumerate(rs):
+            if i % 3:
+                self.assertIsInstance(r, ds.Tbl)
+                self.assertEqual(f"foo_{i}", r.name)
+                self.assertListEqual(["id"], r.pk.cols)
+            else:
+                self.assertIsInstance(r, ds.TblError)
+                self.assertEqual(i, r.index)
+                self.assertIsInstance(r.error, ValidationError)
+
+    def test_validate_tables_serial(self):
+        rs = ds.validate_tables(iter(_tables(10)), workers=1, chunk_size=3)
+        self.assert_results(rs, 10)
+
+    def test_validate_tables_thread(self):
+        rs = ds.validate_tables(
+            _tables(20), workers=4, mode="thread", chunk_size=3
+        )
+        self.assert_results(rs, 20)
+
+    def test_validate_tables_process(self):
+        rs = ds.validate_tables(
+            _tables(20), workers=2, mode="process", chunk_size=4
+        )
+        self.assert_results(rs, 20)
+
+    def test_validate_tables_raise(self):
+        with self.assertRaises(ValueError):
+            ds.validate_tables([], mode="async")
+
+        with self.assertRaises(ValueError):
+            ds.validate_tables([], chunk_size=0)
+
+        self.assertListEqual([], ds.validate_tables([]))
+
+    def test_validate_tables_lazy(self):
+        rs = ds.validate_tables(
+            _tables(6), workers=2, mode="process", chunk_size=2, lazy=True
+        )
+        self.assertIsInstance(rs[1], ds.Tbl)
+        self.assertIsInstance(rs[1].feature, ds.LazyCols)
+        self.assertListEqual(["id"], rs[1].pk.cols)
+
+        # Note: the error of column validation raise on access.
+        self.assertIsInstance(rs[0], ds.Tbl)
+        with self.assertRaises(ValidationError):
+            _ = rs[0].feature[0]
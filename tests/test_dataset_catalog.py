@@ -0,0 +1,153 @@
+import unittest
+
+from pydantic import ValidationError
+
+from armored.datasets import Catalog, Edge
+
+
+def _tbl(name: str, *refs: str) -> dict:
+    return {
+        "name": name,
+        "feature": [{"name": "id", "dtype": "integer primary key"}]
+        + [
+            {
+                "name": f"{ref}_id",
+                "dtype": "integer",
+                "fk": {"table": ref, "column": "id"},
+            }
+            for ref in refs
+        ],
+    }
+
+
+class TestCatalog(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.values = {
+            "name": "warehouse",
+            "objects": [
+                _tbl("order_item", "order", "product"),
+                _tbl("order", "customer"),
+                _tbl("customer"),
+                _tbl("product", "supplier"),
+                _tbl("employee", "employee"),
+                {
+                    "name": "supplier",
+                    "feature": [
+                        {"name": "id", "dtype": "integer primary key"},
+                        {"name": "country_code", "dtype": "char( 2 )"},
+                    ],
+                    "fk": [
+                        {
+                            "to": "country_code",
+                            "ref": {"tbl": "country", "col": "code"},
+                        }
+                    ],
+                },
+            ],
+        }
+
+    def test_catalog_init(self):
+        t = Catalog.model_validate(self.values)
+        self.assertEqual("order", t.tbl("order").name)
+        self.assertIn("customer", t)
+        self.assertNotIn("country", t)
+        with self.assertRaises(KeyError):
+            t.tbl("country")
+
+        self.assertIn(Edge("order", "customer_id", "customer", "id"), t.edges)
+        self.assertTupleEqual(("order", "product"), t.upstreams["order_item"])
+        self.assertTupleEqual(("order_item",), t.downstreams["order"])
+        self.assertTupleEqual((), t.upstreams["employee"])
+
+        with self.assertRaises(ValidationError):
+            Catalog.model_validate(
+                {"name": "foo", "objects": [_tbl("bar"), _tbl("bar")]}
+            )
+
+    def test_catalog_lazy(self):
+        t = Catalog.model_validate(self.values, context={"lazy": True})
+        self.assertTupleEqual(("order", "product"), t.upstreams["order_item"])
+        self.assertEqual(0, t.tbl("order_item").feature.materialized)
+
+    def test_catalog_dangling(self):
+        t = Catalog.model_validate(self.values)
+        self.assertListEqual(
+            [Edge("supplier", "country_code", "country", "code")],
+            t.dangling(),
+        )
+
+        self.values["objects"][2]["feature"][0]["name"] = "customer_id"
+        t = Catalog.model_validate(self.values)
+        self.assertListEqual(
+            [
+                Edge("order", "customer_id", "customer", "id"),
+                Edge("supplier", "country_code", "country", "code"),
+            ],
+            t.dangling(),
+        )
+
+    def test_catalog_waves(self):
+        t = Catalog.model_validate(self.values)
+        self.assertListEqual([], t.cycles())
+        self.assertListEqual(
+            [
+                ["customer", "employee", "supplier"],
+                ["order", "product"],
+                ["order_item"],
+            ],
+            t.waves(),
+        )
+        order = t.order()
+        for edge in t.edges:
+            if edge.ref_tbl in t and edge.ref_tbl != edge.tbl:
+                self.assertLess(
+                    order.index(edge.ref_tbl), order.index(edge.tbl)
+                )
+
+    def test_catalog_cycles(self):
+        self.values["objects"][2] = _tbl("customer", "order_item")
+        t = Catalog.model_validate(self.values)
+        self.assertListEqual(
+            [["order_item", "order", "customer"]],
+            [sorted(c, reverse=True) for c in t.cycles()],
+        )
+        with self.assertRaises(ValueError):
+            t.waves()
+
+    def test_catalog_stream(self):
+        t = Catalog.model_validate(self.values)
+        self.assertListEqual(
+            ["order", "product", "customer", "supplier"],
+            t.upstream("order_item"),
+        )
+        self.assertListEqual(
+            ["order", "product"], t.upstream("order_item", False)
+        )
+        self.assertListEqual(
+            ["product", "order_item"], t.downstream("supplier")
+        )
+        self.assertListEqual([], t.downstream("employee"))
+        with self.assertRaises(KeyError):
+            t.upstream("country")
+
+    def test_catalog_update(self):
+        t = Catalog.model_validate(self.values)
+        self.assertListEqual(["order_item"], t.downstream("order"))
+        t.update({"objects": self.values["objects"][1:]})
+        self.assertListEqual([], t.downstream("order"))
+        self.assertNotIn("order_item", t)
+
+    def test_catalog_large_chain(self):
+        size: int = 5_000
+        t = Catalog.model_validate(
+            {
+                "name": "chain",
+                "objects": [_tbl("t_0")]
+                + [_tbl(f"t_{i}", f"t_{i - 1}") for i in range(1, size)],
+            },
+            context={"lazy": True},
+        )
+        self.assertEqual(size, len(t.waves()))
+        self.assertEqual(size - 1, len(t.upstream(f"t_{size - 1}")))
+        self.assertListEqual([], t.cycles())
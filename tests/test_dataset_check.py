@@ -0,0 +1,144 @@
+import unittest
+from datetime import date
+from decimal import Decimal
+
+from armored.datasets.check import (
+    CheckError,
+    compile_check,
+    compile_check_cache_clear,
+    tokenize,
+)
+
+COLUMNS = {
+    "qty": [1, 2, None, 5],
+    "code": ["x", "yy", None, "zzz"],
+    "day": [date(2024, 1, 1), date(2023, 1, 1), None, date(2025, 1, 1)],
+}
+
+
+class TestCheck(unittest.TestCase):
+    def test_tokenize(self):
+        self.assertListEqual(
+            [
+                ("name", "<name>"),
+                ("op", "<>"),
+                ("str", "'it''s'"),
+                ("kw", "and"),
+                ("kw", "length"),
+                ("punct", "("),
+                ("ident", '"Code"'),
+                ("punct", ")"),
+                ("op", "<="),
+                ("num", "1.5"),
+            ],
+            tokenize("<name> <> 'it''s' AND Length(\"Code\") <= 1.5"),
+        )
+
+    def test_compile_wrapper(self):
+        p = compile_check("check( <name> <> 'yy' )", "code")
+        self.assertEqual("<name> <> 'yy'", p.text)
+        self.assertTupleEqual(("code",), p.columns)
+        self.assertListEqual([True, False, None, True], p(COLUMNS))
+        self.assertIs(p, compile_check("check( <name> <> 'yy' )", "code"))
+        self.assertEqual("Predicate(\"<name> <> 'yy'\")", repr(p))
+
+    def test_compile_logic(self):
+        for text, expected in (
+            ("qty in (1, 5) and length(code) <= 2", [True, False, None, False]),
+            (
+                "not (qty between 2 and 4) or code is null",
+                [True, False, True, True],
+            ),
+            ("qty not in (1, null)", [False, None, None, None]),
+            ("qty is not null", [True, True, False, True]),
+            ("qty >= -1 and 1 = 1", [True, True, None, True]),
+            ("qty > 1 or true", [True, True, True, True]),
+            ("qty = 2.0", [False, True, None, False]),
+            ("qty < length(code) * 1", None),
+        ):
+            with self.subTest(text=text):
+                if expected is None:
+                    with self.assertRaises(CheckError):
+                        compile_check(text)
+                    continue
+                self.assertListEqual(expected, compile_check(text)(COLUMNS))
+
+    def test_compile_convert_literal(self):
+        p = compile_check("<name> >= '2024-01-01'", "day", "date")
+        self.assertListEqual([True, False, None, True], p(COLUMNS))
+        p = compile_check("<name> between '1.5' and '3'", "qty", "numeric")
+        self.assertListEqual([False, True, None, False], p(COLUMNS))
+        with self.assertRaises(CheckError):
+            compile_check("<name> = 'today'", "day", "date")
+
+        # Note: the literal on the left of <name> converts the same way.
+        p = compile_check("'2024-01-01' <= <name>", "day", "date")
+        self.assertListEqual([True, False, None, True], p(COLUMNS))
+        with self.assertRaises(CheckError):
+            compile_check("5 < <name>", "code", "varchar")
+
+    def test_violations(self):
+        p = compile_check("qty < 5")
+        self.assertListEqual([3], p.violations(COLUMNS))
+        self.assertListEqual([], p.violations({"qty": [None, 1]}))
+        self.assertListEqual([False, False], compile_check("1 > 2")({}, 2))
+
+    def test_compile_error(self):
+        compile_check_cache_clear()
+        for text in (
+            "",
+            "qty >",
+            "qty ~ 1",
+            "qty in 1",
+            "qty not 1",
+            "(qty > 1",
+            "qty > 1 qty",
+            "<name> is null",
+            "__import__('os')",
+        ):
+            with self.subTest(text=text):
+                self.assertRaises(CheckError, compile_check, text)
+
+    def test_numeric_literal(self):
+        p = compile_check("qty > 1.25e1")
+        self.assertListEqual([False], p({"qty": [Decimal("12.5")]}))
+
+    def test_type_mismatch(self):
+        for text, dtype in (
+            ("<name> > 5", "varchar"),
+            ("<name> in ( 'a', 1 )", "text"),
+            ("<name> between -1 and 2", "string"),
+            ("<name> = 20240101", "date"),
+        ):
+            with self.subTest(text=text):
+                with self.assertRaises(CheckError):
+                    compile_check(text, "code", dtype)
+        self.assertListEqual(
+            [True, False],
+            compile_check("<name> > 5", "qty", "integer")({"qty": [6, 5]}),
+        )
+
+        # Note: the column that does not know its datatype compares with the
+        #   unknown result instead of raising the error.
+        p = compile_check("code > 5")
+        self.assertListEqual([None, None, None, None], p(COLUMNS))
+        self.assertListEqual([], p.violations(COLUMNS))
+        p = compile_check("code > qty")
+        self.assertListEqual([None, None, None, None], p(COLUMNS))
+
+    def test_length_mismatch(self):
+        with self.assertRaises(CheckError):
+            compile_check("length(<name>) > 2", "qty", "integer")
+        p = compile_check("length(qty) > 2")
+        self.assertListEqual([None, None], p({"qty": [100, None]}))
+        p = compile_check("length(code) > 2")
+        self.assertListEqual([True, None, False], p({"code": ["abc", 1, "a"]}))
+
+    def test_logic_of_values(self):
+        p = compile_check("<name> and <name>", "qty")
+        self.assertListEqual([True, False, None], p({"qty": [1, 0, None]}))
+        p = compile_check("qty or code")
+        self.assertListEqual(
+            [True, False, None],
+            p({"qty": [2, 0, None], "code": [1, 0, 0]}),
+        )
@@ -2,6 +2,7 @@ import unittest
 
 import armored.datasets.col as col
 import armored.dtype as dtype
+import armored.utils as utils
 
 
 class TestBaseColumn(unittest.TestCase):
@@ -168,3 +169,38 @@ class TestColumn(unittest.TestCase):
                 "default": "1",
             },
         )
+
+    def test_column_extract_column_from_dtype_check_keyword(self):
+        t = col.Col.extract_column_from_dtype(
+            "varchar( 10 ) check( <name> is not null ) not null default 'null'"
+        )
+        self.assertDictEqual(
+            t,
+            {
+                "unique": False,
+                "pk": False,
+                "nullable": False,
+                "check": "check( <name> is not null )",
+                "dtype": "varchar( 10 )",
+                "default": "'null'",
+            },
+        )
+
+        with self.assertRaises(ValueError):
+            col.Col.extract_column_from_dtype("varchar( 10 ) check")
+
+    def test_column_extract_column_cache(self):
+        utils.extract_column_cache_clear()
+        for _ in range(3):
+            col.Col(name="foo", dtype="varchar( 100 ) unique not null")
+        info = utils.extract_column_cache_info()
+        self.assertEqual(1, info.misses)
+        self.assertEqual(2, info.hits)
+
+        # Note: the cached values must not share between each call.
+        t = utils.extract_column("integer", parse_dtype=True)
+        t["dtype"]["type"] = "bigint"
+        self.assertDictEqual(
+            {"type": "integer"},
+            utils.extract_column("integer", parse_dtype=True)["dtype"],
+        )
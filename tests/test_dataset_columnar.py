@@ -0,0 +1,160 @@
+import os
+import tempfile
+import unittest
+from array import array
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+
+from armored.datasets.columnar import (
+    ColumnarReader,
+    ColumnarWriter,
+    encoding_of,
+    write_columnar,
+)
+from armored.datasets.db import Tbl
+
+FEATURE = [
+    {"name": "id", "dtype": "bigint primary key"},
+    {"name": "qty", "dtype": "smallint"},
+    {"name": "code", "dtype": "varchar( 3 )"},
+    {"name": "amount", "dtype": "numeric( 10, 2 )"},
+    {"name": "rate", "dtype": "double precision"},
+    {"name": "created", "dtype": "date"},
+    {"name": "at", "dtype": "time"},
+    {"name": "updated", "dtype": "timestamp"},
+]
+ROWS = [
+    (
+        1,
+        10,
+        "TH",
+        Decimal("10.50"),
+        0.5,
+        date(2024, 1, 1),
+        time(10, 30, 0, 5),
+        datetime(2024, 1, 1, 10, 0, 0, 123),
+    ),
+    (2, None, None, None, None, None, None, None),
+    (
+        3,
+        -5,
+        "US",
+        Decimal("-1"),
+        1e10,
+        date(1969, 12, 31),
+        time(0, 0),
+        datetime(1960, 1, 1),
+    ),
+    (4, 7, "TH", Decimal("0.01"), -2.5, date(2000, 2, 29), None, None),
+]
+
+
+class TestColumnar(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path: str = os.path.join(self.tmp.name, "data.col")
+        self.tbl = Tbl(name="foo", feature=FEATURE)
+
+    def test_encoding_of(self):
+        self.assertListEqual(
+            ["plain", "plain", "dict", "text", "plain", "plain"],
+            [encoding_of(col.dtype) for col in self.tbl.feature][:6],
+        )
+
+    def test_write_read(self):
+        with ColumnarWriter(self.path, self.tbl) as writer:
+            self.assertEqual(3, writer.write(ROWS[:3]))
+            writer.write([dict(zip(self.tbl.col_names(), ROWS[3]))])
+            self.assertEqual(0, writer.write([]))
+        with ColumnarReader(self.path) as reader:
+            self.assertEqual(4, len(reader))
+            self.assertEqual(self.tbl, reader.tbl)
+            self.assertEqual(2, len(reader.groups))
+            self.assertTrue(
+                all(
+                    meta["data"][0] % 8 == 0
+                    for meta in reader.groups[0]["columns"].values()
+                    if meta["encoding"] != "text"
+                )
+            )
+            batches = list(reader)
+            self.assertListEqual(ROWS[:3], list(batches[0].rows()))
+            self.assertListEqual(ROWS[3:], list(batches[1].rows()))
+            self.assertEqual(3, batches[1].start)
+
+            self.assertTupleEqual(
+                (Decimal("-1"), Decimal("10.50")), reader.stats("amount")
+            )
+            self.assertTupleEqual(("TH", "US"), reader.stats("code"))
+            self.assertTupleEqual(
+                (datetime(1960, 1, 1), datetime(2024, 1, 1, 10, 0, 0, 123)),
+                reader.stats("updated"),
+            )
+            self.assertTupleEqual(
+                (None, None), reader.stats("at")[:0] or (None, None)
+            )
+
+            ids = reader.column("id")
+            codes = reader.column("code")
+            validity = reader.validity("qty")
+            try:
+                self.assertEqual("q", ids.format)
+                self.assertTrue(ids.readonly)
+                self.assertListEqual([1, 2, 3], ids.tolist())
+                self.assertListEqual([0, -1, 1], codes.tolist())
+                self.assertListEqual(["TH", "US"], reader.dictionary("code"))
+                self.assertEqual(0b11111101, validity[0])
+                self.assertIsNone(reader.validity("id"))
+            finally:
+                ids.release()
+                codes.release()
+                validity.release()
+
+    def test_swap_byteorder(self):
+        write_columnar(self.path, self.tbl, ROWS)
+        with ColumnarReader(self.path) as reader:
+            reader._swap = True
+            values = array("q", [1, 2, 3, 4])
+            values.byteswap()
+            self.assertListEqual(values.tolist(), reader.column("id").tolist())
+
+    def test_timezone(self):
+        tbl = Tbl(
+            name="foo",
+            feature=[
+                {"name": "ts", "dtype": {"type": "timestamp", "timezone": True}}
+            ],
+        )
+        value = datetime(2024, 1, 1, 7, tzinfo=timezone.utc)
+        write_columnar(self.path, tbl, [(value,)])
+        with ColumnarReader(self.path) as reader:
+            self.assertListEqual([value], reader.values("ts"))
+
+        columns = {name: [None] for name in self.tbl.col_names()}
+        with self.assertRaisesRegex(ValueError, "column 'updated': timezone"):
+            write_columnar(self.path, self.tbl, columns | {"updated": [value]})
+
+    def test_errors(self):
+        columns = {name: [None] for name in self.tbl.col_names()}
+        with self.assertRaisesRegex(ValueError, "does not fit smallint"):
+            write_columnar(self.path, self.tbl, columns | {"qty": [40_000]})
+        with self.assertRaisesRegex(ValueError, "different sizes"):
+            write_columnar(self.path, self.tbl, columns | {"qty": [1, 2]})
+        with self.assertRaisesRegex(ValueError, "does not have columns"):
+            write_columnar(self.path, self.tbl, {"id": [1]})
+        with open(self.path, mode="wb") as f:
+            f.write(b"not the columnar file")
+        with self.assertRaisesRegex(ValueError, "is not the armored"):
+            ColumnarReader(self.path)
+        write_columnar(self.path, self.tbl, ROWS)
+        with ColumnarReader(self.path) as reader:
+            self.assertRaisesRegex(
+                ValueError, "does not have 'other'", reader.column, "other"
+            )
+        write_columnar(self.path, self.tbl, [])
+        with ColumnarReader(self.path) as reader:
+            self.assertEqual(0, len(reader))
+            self.assertRaisesRegex(
+                ValueError, "does not have group", reader.column, "id"
+            )
@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+from array import array
+
+from armored.datasets.col import Col
+from armored.datasets.columnar import ColumnarReader, write_columnar
+from armored.datasets.db import Tbl
+from armored.datasets.dictionary import DictColumn, encode_columns
+from armored.datasets.reader import Batch
+from armored.datasets.rows import RowValidator, Violation
+
+
+class TestDictColumn(unittest.TestCase):
+    def setUp(self) -> None:
+        self.col = Col(name="status", dtype="varchar( 4 )")
+
+    def test_encode(self):
+        col = DictColumn(self.col, ["new", None, "done"])
+        col.extend(["done", "closed", None])
+        self.assertTrue(col.encoded)
+        self.assertEqual(array("i", [0, -1, 1, 1, 2, -1]), col.codes)
+        self.assertEqual(["new", "done", "closed"], col.dictionary)
+        self.assertEqual(
+            ["new", None, "done", "done", "closed", None], col.tolist()
+        )
+        self.assertEqual(6, len(col))
+        self.assertEqual("closed", col[4])
+        self.assertEqual([None, "done"], col[1:3])
+        self.assertIn(None, col)
+        self.assertIn("done", col)
+        self.assertNotIn("open", col)
+        self.assertEqual([1, 5], col.null_rows())
+        self.assertEqual([4], col.length_violations())
+        self.assertEqual([2, 3, 4], col.rows_of([1, 2]))
+
+    def test_not_string(self):
+        with self.assertRaises(ValueError):
+            DictColumn(Col(name="id", dtype="integer"))
+
+    def test_fallback(self):
+        col = DictColumn(self.col, ["a", "b"], max_distinct=2)
+        col.extend(["c", None, "abcde"])
+        self.assertFalse(col.encoded)
+        self.assertEqual(["a", "b", "c", None, "abcde"], col.tolist())
+        self.assertEqual([], col.dictionary)
+        self.assertEqual([3], col.null_rows())
+        self.assertEqual([4], col.length_violations())
+        self.assertIn(None, col)
+
+        col = DictColumn(self.col, [str(i) for i in range(5_000)])
+        self.assertFalse(col.encoded)
+        self.assertEqual(5_000, len(col))
+
+
+class TestDictColumnUsage(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tbl = Tbl(
+            name="foo",
+            feature=[
+                {"name": "id", "dtype": "integer primary key"},
+                {
+                    "name": "code",
+                    "dtype": "varchar( 2 ) not null",
+                    "check": "check( <name> <> 'XX' )",
+                },
+            ],
+        )
+        self.columns = {
+            "id": [1, 2, 3, 4],
+            "code": ["TH", None, "USA", "XX"],
+        }
+
+    def test_validate(self):
+        columns = encode_columns(self.tbl.feature, self.columns)
+        self.assertIsInstance(columns["code"], DictColumn)
+        self.assertEqual([1, 2, 3, 4], columns["id"])
+        report = RowValidator(self.tbl).validate(columns)
+        self.assertEqual(
+            [
+                Violation(1, "code", "null"),
+                Violation(2, "code", "length"),
+                Violation(3, "code", "check"),
+            ],
+            report.violations,
+        )
+        self.assertEqual(
+            report.counts,
+            RowValidator(self.tbl).validate(self.columns).counts,
+        )
+
+    def test_validate_type(self):
+        columns = encode_columns(
+            self.tbl.feature, {"id": [1, 2], "code": [1, "ABC"]}
+        )
+        report = RowValidator(self.tbl).validate(columns)
+        self.assertEqual(
+            [Violation(0, "code", "type"), Violation(1, "code", "length")],
+            report.violations,
+        )
+
+    def test_columnar(self):
+        fd, path = tempfile.mkstemp(suffix=".col")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        batch = Batch(
+            start=0,
+            size=4,
+            columns=encode_columns(self.tbl.feature, self.columns),
+        )
+        write_columnar(path, self.tbl, iter([batch]))
+        with ColumnarReader(path) as reader:
+            self.assertEqual(["TH", "USA", "XX"], reader.dictionary("code"))
+            self.assertEqual([0, -1, 1, 2], reader.column("code").tolist())
+            self.assertEqual(self.columns["code"], reader.values("code"))
+            self.assertEqual(("TH", "XX"), reader.stats("code"))
@@ -0,0 +1,187 @@
+import unittest
+
+from armored.datasets import (
+    Catalog,
+    Change,
+    Severity,
+    Tbl,
+    compare_dtype,
+    diff_tbl,
+    plan_migration,
+)
+from armored.dtype import (
+    BigIntType,
+    CharType,
+    DateType,
+    DecimalType,
+    IntegerType,
+    NumericType,
+    TextType,
+    TimestampType,
+    VarcharType,
+)
+
+
+def _tbl(name: str, *cols: dict, **kwargs) -> Tbl:
+    return Tbl(
+        name=name,
+        feature=[{"name": "id", "dtype": "integer primary key"}, *cols],
+        **kwargs,
+    )
+
+
+class TestCompareDtype(unittest.TestCase):
+    def test_compare_dtype(self):
+        widening = Severity.WIDENING
+        breaking = Severity.BREAKING
+        for before, after, expected in (
+            (IntegerType(), IntegerType(), None),
+            (IntegerType(), BigIntType(), widening),
+            (BigIntType(), IntegerType(), breaking),
+            (IntegerType(), NumericType(precision=10), widening),
+            (IntegerType(), NumericType(precision=10, scale=2), breaking),
+            (
+                NumericType(precision=10, scale=2),
+                DecimalType(precision=12, scale=4),
+                widening,
+            ),
+            (
+                NumericType(precision=10, scale=2),
+                NumericType(precision=10, scale=4),
+                breaking,
+            ),
+            (NumericType(precision=10), NumericType(), widening),
+            (VarcharType(max_length=10), VarcharType(max_length=20), widening),
+            (VarcharType(max_length=20), VarcharType(max_length=10), breaking),
+            (VarcharType(), VarcharType(max_length=10), breaking),
+            (CharType(max_length=2), VarcharType(max_length=2), widening),
+            (VarcharType(max_length=2), CharType(max_length=2), breaking),
+            (VarcharType(max_length=2), TextType(), widening),
+            (DateType(), TimestampType(), widening),
+            (TimestampType(precision=3), TimestampType(), widening),
+            (TimestampType(), TimestampType(timezone=True), breaking),
+            (TextType(), IntegerType(), breaking),
+        ):
+            with self.subTest(before=before, after=after):
+                self.assertEqual(expected, compare_dtype(before, after))
+
+
+class TestDiff(unittest.TestCase):
+    def test_diff_tbl(self):
+        before = _tbl(
+            "foo",
+            {"name": "name", "dtype": "varchar( 10 ) not null"},
+            {"name": "code", "dtype": "char( 2 )"},
+        )
+        self.assertListEqual([], diff_tbl(before, before.model_copy()))
+        after = _tbl(
+            "foo",
+            {"name": "name", "dtype": "varchar( 20 )"},
+            {"name": "note", "dtype": "text"},
+            {"name": "flag", "dtype": "integer not null"},
+            {
+                "name": "bar_id",
+                "dtype": "integer",
+                "fk": {"tbl": "bar", "col": "id"},
+            },
+        )
+        changes = diff_tbl(before, after)
+        self.assertListEqual(
+            [
+                ("alter_column", "name", "dtype", Severity.WIDENING),
+                ("alter_column", "name", "nullable", Severity.WIDENING),
+                ("add_column", "note", None, Severity.ADDITIVE),
+                ("add_column", "flag", None, Severity.BREAKING),
+                ("add_column", "bar_id", None, Severity.ADDITIVE),
+                ("drop_column", "code", None, Severity.BREAKING),
+                ("add_fk", "bar_id", None, Severity.BREAKING),
+            ],
+            [(c.action, c.col, c.attr, c.severity) for c in changes],
+        )
+
+    def test_plan_migration(self):
+        before = Catalog(
+            name="warehouse",
+            objects=[
+                _tbl("customer"),
+                _tbl(
+                    "order",
+                    {
+                        "name": "customer_id",
+                        "dtype": "integer",
+                        "fk": {"tbl": "customer", "col": "id"},
+                    },
+                ),
+            ],
+        )
+        after = Catalog(
+            name="warehouse",
+            objects=[
+                _tbl(
+                    "order",
+                    {"name": "customer_id", "dtype": "bigint"},
+                    {
+                        "name": "product_id",
+                        "dtype": "integer",
+                        "fk": {"tbl": "product", "col": "id"},
+                    },
+                ),
+                _tbl("product"),
+            ],
+        )
+        plan = plan_migration(before, after)
+        self.assertListEqual(
+            [
+                ("drop_fk", "order"),
+                ("drop_table", "customer"),
+                ("create_table", "product"),
+                ("add_column", "order"),
+                ("alter_column", "order"),
+                ("add_pk", "product"),
+                ("add_fk", "order"),
+            ],
+            [(c.action, c.tbl) for c in plan],
+        )
+        self.assertEqual(
+            Change(
+                "drop_fk",
+                Severity.WIDENING,
+                "order",
+                "customer_id",
+                before=("customer", "id"),
+            ),
+            plan[0],
+        )
+        with self.assertRaises(ValueError):
+            plan_migration(before, after, breaking=False)
+        self.assertListEqual([], plan_migration(after, after.objects))
+
+    def test_plan_migration_drop_referenced(self):
+        order = _tbl(
+            "order",
+            {
+                "name": "customer_id",
+                "dtype": "integer",
+                "fk": {"tbl": "customer", "col": "id"},
+            },
+        )
+        plan = plan_migration([_tbl("customer"), order], [order])
+        self.assertListEqual(
+            [
+                Change(
+                    "drop_fk",
+                    Severity.WIDENING,
+                    "order",
+                    "customer_id",
+                    before=("customer", "id"),
+                ),
+                Change(
+                    "drop_table",
+                    Severity.BREAKING,
+                    "customer",
+                    before=plan[1].before,
+                ),
+            ],
+            plan,
+        )
+        self.assertListEqual([], plan_migration([order], [order]))
@@ -0,0 +1,98 @@
+import unittest
+from array import array
+from decimal import Decimal, localcontext
+
+from armored.datasets.fixed import FixedColumn
+from armored.datasets.kernels import ERROR, NULL, VALID
+from armored.dtype import DecimalType, NumericType
+
+
+class TestFixedColumn(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dtype = NumericType(precision=5, scale=2)
+
+    def test_parse(self):
+        col = FixedColumn.parse(
+            ["1.255", "-1.255", " 3 ", ".5", "5.", "1e2", "", None],
+            self.dtype,
+        )
+        self.assertEqual(
+            array("q", [126, -126, 300, 50, 500, 10000, 0, 0]), col.values
+        )
+        self.assertEqual(2, col.nulls)
+        col = FixedColumn.parse(
+            ["abc", "-", "1000", "999.995", "nan", "1.2.3"], self.dtype
+        )
+        self.assertEqual([ERROR] * 6, list(col.mask))
+
+    def test_parse_large_exponent(self):
+        dtype = NumericType(precision=19, scale=2)
+        col = FixedColumn.parse(["1e100000000", "-1E999999999", "1e-99"], dtype)
+        self.assertEqual([ERROR, ERROR, VALID], list(col.mask))
+        col = FixedColumn.from_values([Decimal("1e100000000")], dtype)
+        self.assertEqual([ERROR], list(col.mask))
+
+    def test_from_values(self):
+        col = FixedColumn.from_values(
+            [Decimal("1.005"), 2, None, Decimal("Infinity")], self.dtype
+        )
+        self.assertEqual([101, 200, 0, 0], list(col.values))
+        self.assertEqual([VALID, VALID, NULL, ERROR], list(col.mask))
+        self.assertEqual(
+            [Decimal("1.01"), Decimal("2.00"), None, None], col.tolist()
+        )
+
+    def test_storage(self):
+        self.assertIsInstance(
+            FixedColumn.parse(["1"], DecimalType(precision=19, scale=2)).values,
+            array,
+        )
+        col = FixedColumn.parse(
+            ["12345678901234567890.12"], DecimalType(precision=22, scale=2)
+        )
+        self.assertEqual([1234567890123456789012], col.values)
+        with localcontext() as ctx:
+            ctx.prec = 5
+            self.assertEqual([Decimal("12345678901234567890.12")], col.tolist())
+            self.assertEqual(["12345678901234567890.12"], col.strings())
+        with self.assertRaises(ValueError):
+            FixedColumn(NumericType())
+        with self.assertRaises(ValueError):
+            FixedColumn(self.dtype, [1, 2], bytearray(1))
+
+    def test_format(self):
+        col = FixedColumn(self.dtype, [5, -5, 12345, 0])
+        self.assertEqual(["0.05", "-0.05", "123.45", "0.00"], col.strings())
+        col = FixedColumn(NumericType(precision=3, scale=0), [-12])
+        self.assertEqual(["-12"], col.strings())
+
+    def test_aggregate(self):
+        col = FixedColumn.parse(["1.10", "", "-2.25", "x"], self.dtype)
+        self.assertEqual(Decimal("-1.15"), col.sum())
+        self.assertEqual(Decimal("-2.25"), col.min())
+        self.assertEqual(Decimal("1.10"), col.max())
+        self.assertEqual(Decimal("1.10"), col[0])
+        self.assertIsNone(col[1])
+
+        empty = FixedColumn.parse(["", None], self.dtype)
+        self.assertIsNone(empty.sum())
+        self.assertIsNone(empty.min())
+        self.assertIsNone(FixedColumn(self.dtype).sum())
+
+    def test_compare(self):
+        col = FixedColumn.parse(["1.25", "1.26", ""], self.dtype)
+        self.assertEqual([True, False, None], col.compare("<=", "1.25"))
+        self.assertEqual([False, False, None], col.compare("=", "1.255"))
+        self.assertEqual([True, True, None], col.compare("<>", "1.255"))
+        self.assertEqual([True, False, None], col.compare("<", "1.255"))
+        self.assertEqual([False, True, None], col.compare(">=", "1.255"))
+        self.assertEqual([True, True, None], col.compare(">", 1))
+
+        other = FixedColumn.parse(
+            ["1.250", "", "0"], NumericType(precision=6, scale=3)
+        )
+        self.assertEqual([True, None, None], col.compare("=", other))
+        with self.assertRaises(ValueError):
+            col.compare("~", 1)
+        with self.assertRaises(ValueError):
+            col.compare("=", FixedColumn(self.dtype))
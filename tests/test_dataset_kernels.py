@@ -0,0 +1,125 @@
+import unittest
+from array import array
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+
+from armored.datasets.kernels import (
+    ERROR,
+    NULL,
+    VALID,
+    coerce,
+    kernel_for,
+)
+from armored.dtype import (
+    BigIntType,
+    DateTimeType,
+    DateType,
+    DoublePrecisionType,
+    IntegerType,
+    NumericType,
+    RealType,
+    SerialType,
+    SmallIntType,
+    TextType,
+    TimestampType,
+    TimeType,
+    VarcharType,
+    intern_dtype_clear,
+    intern_dtype_info,
+)
+
+
+class TestKernels(unittest.TestCase):
+    def test_kernel_cache(self):
+        self.assertIs(
+            kernel_for(VarcharType(max_length=10)),
+            kernel_for(VarcharType(max_length=10)),
+        )
+        self.assertIsNot(
+            kernel_for(VarcharType(max_length=10)),
+            kernel_for(VarcharType(max_length=20)),
+        )
+
+    def test_kernel_cache_not_intern(self):
+        intern_dtype_clear()
+        kernel_for(VarcharType(max_length=30))
+        self.assertEqual(0, intern_dtype_info())
+
+    def test_integer(self):
+        rs = coerce(["1", "-32768", "32767"], SmallIntType())
+        self.assertEqual(array("h", [1, -32768, 32767]), rs.values)
+        self.assertEqual(0, rs.nulls + rs.errors)
+
+        rs = coerce(["1", "", "1.5", "2147483648"], IntegerType())
+        self.assertEqual("i", rs.values.typecode)
+        self.assertEqual([VALID, NULL, ERROR, ERROR], list(rs.mask))
+        self.assertEqual([2, 3], rs.error_rows())
+        self.assertEqual([1, None, None, None], rs.tolist())
+
+        self.assertEqual(
+            [ERROR, VALID], list(coerce(["0", "1"], SerialType()).mask)
+        )
+        rs = coerce([str(2**63 - 1), str(2**63)], BigIntType())
+        self.assertEqual([2**63 - 1, None], rs.tolist())
+
+    def test_float(self):
+        rs = coerce(["1.5", "nan", "1e39", "-inf"], RealType())
+        self.assertEqual("f", rs.values.typecode)
+        self.assertEqual([VALID, VALID, ERROR, VALID], list(rs.mask))
+
+        rs = coerce(["1e39", "x"], DoublePrecisionType())
+        self.assertEqual("d", rs.values.typecode)
+        self.assertEqual([1e39, None], rs.tolist())
+
+    def test_numeric(self):
+        rs = coerce(
+            ["1.255", "-999.994", "999.995", "", "abc"],
+            NumericType(precision=5, scale=2),
+        )
+        self.assertEqual(
+            [Decimal("1.26"), Decimal("-999.99"), None, None, None],
+            rs.values,
+        )
+        self.assertEqual([VALID, VALID, ERROR, NULL, ERROR], list(rs.mask))
+        rs = coerce(["1.23456789"], NumericType())
+        self.assertEqual([Decimal("1.23456789")], rs.values)
+
+    def test_temporal(self):
+        rs = coerce(["2024-02-29", "2023-02-29"], DateType())
+        self.assertEqual("i", rs.values.typecode)
+        self.assertEqual([date(2024, 2, 29), None], rs.tolist())
+
+        rs = coerce(["10:30:00.000005"], TimeType())
+        self.assertEqual([time(10, 30, 0, 5)], rs.tolist())
+
+        rs = coerce(
+            ["2024-01-01T00:00:00.123456", "2024-01-01T07:00:00+07:00"],
+            TimestampType(precision=3),
+        )
+        self.assertEqual("q", rs.values.typecode)
+        self.assertEqual([VALID, ERROR], list(rs.mask))
+        self.assertEqual(
+            [datetime(2024, 1, 1, 0, 0, 0, 123000), None], rs.tolist()
+        )
+
+        rs = coerce(
+            ["2024-01-01 10:00:00", "2024-01-01T17:00:00+07:00"],
+            TimestampType(timezone=True),
+        )
+        self.assertEqual(
+            [datetime(2024, 1, 1, 10, tzinfo=timezone.utc)] * 2, rs.tolist()
+        )
+        rs = coerce(
+            ["2024-01-01 10:00:00", "x", "2024-01-01T10:00:00+00:00"],
+            DateTimeType(),
+        )
+        self.assertEqual([datetime(2024, 1, 1, 10), None, None], rs.tolist())
+
+    def test_string(self):
+        rs = coerce(["ab", "abc", ""], VarcharType(max_length=2))
+        self.assertEqual(["ab", None, None], rs.values)
+        self.assertEqual([VALID, ERROR, NULL], list(rs.mask))
+
+        rs = coerce(["a" * 100], TextType())
+        self.assertEqual(["a" * 100], rs.values)
+        self.assertEqual([], coerce([], IntegerType()).tolist())
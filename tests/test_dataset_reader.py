@@ -0,0 +1,222 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+from decimal import Decimal
+
+from armored.datasets.file import CsvFl, JsonFl
+from armored.datasets.reader import _iter_array, _iter_ndjson
+
+FEATURE = [
+    {"name": "id", "dtype": "integer primary key"},
+    {"name": "name", "dtype": "varchar( 10 )"},
+    {"name": "amount", "dtype": "numeric( 10, 2 )"},
+    {"name": "rate", "dtype": "float"},
+    {"name": "created", "dtype": "date"},
+    {"name": "updated", "dtype": "timestamp"},
+]
+
+
+class TestCsvReader(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write(self, content: str, encoding: str = "utf-8") -> str:
+        path: str = os.path.join(self.tmp.name, "data.csv")
+        with open(path, mode="w", encoding=encoding, newline="") as f:
+            f.write(content)
+        return path
+
+    def test_read_csv(self):
+        path: str = self.write(
+            "exported by system\n"
+            "name,id,amount,rate,created,updated,other\n"
+            "# comment line\n"
+            'foo,1,10.50,0.5,2024-01-01,2024-01-01 10:00:00,"a,b"\n'
+            "\n"
+            '"bar ""x""",2,,1e3,2024-01-02,2024-01-02T00:00:00,\n'
+            "baz,3,1,2,2024-01-03,2024-01-03 00:00:00,\n"
+            "total,3,,,,,\n"
+        )
+        fl = CsvFl(name=path, feature=FEATURE, skip_rows=1, skip_footer=1)
+        batches = list(fl.read(chunk_size=2))
+        self.assertListEqual(
+            [(0, 2), (2, 1)], [(b.start, b.size) for b in batches]
+        )
+        first = batches[0].columns
+        self.assertListEqual(
+            ["id", "name", "amount", "rate", "created", "updated"], list(first)
+        )
+        self.assertListEqual([1, 2], first["id"])
+        self.assertListEqual(["foo", 'bar "x"'], first["name"])
+        self.assertListEqual([Decimal("10.50"), None], first["amount"])
+        self.assertListEqual([0.5, 1000.0], first["rate"])
+        self.assertListEqual(
+            [date(2024, 1, 1), date(2024, 1, 2)], first["created"]
+        )
+        self.assertEqual(datetime(2024, 1, 1, 10), first["updated"][0])
+        self.assertEqual(
+            (
+                3,
+                "baz",
+                Decimal("1"),
+                2.0,
+                date(2024, 1, 3),
+                datetime(2024, 1, 3),
+            ),
+            next(batches[1].rows()),
+        )
+
+    def test_read_csv_options(self):
+        path: str = self.write(
+            "1;'a;b';1.5;0;2024-01-01;2024-01-01\n"
+            "// comment\n"
+            "2;'c';2.5;0;2024-01-01;2024-01-01\n",
+            encoding="utf-16",
+        )
+        fl = CsvFl(
+            name="data",
+            feature=FEATURE,
+            header=False,
+            sep=";",
+            quote_char="'",
+            comment="//",
+            encoding="utf-16",
+        )
+        (batch,) = list(fl.read(path))
+        self.assertListEqual(["a;b", "c"], batch.columns["name"])
+
+        fl.update({"quote_char": ""})
+        with self.assertRaises(ValueError):
+            list(fl.read(path))
+
+    def test_read_csv_errors(self):
+        path: str = self.write(
+            "id,name,amount,rate,created,updated\n"
+            "1,a,x,0,2024-01-01,2024-01-01\n"
+        )
+        fl = CsvFl(name=path, feature=FEATURE)
+        with self.assertRaisesRegex(ValueError, "column 'amount' on row 0"):
+            list(fl.read())
+        (batch,) = list(fl.read(errors="null"))
+        self.assertListEqual([None], batch.columns["amount"])
+
+        fl.update({"feature": FEATURE + [{"name": "x", "dtype": "text"}]})
+        with self.assertRaisesRegex(ValueError, "does not contain"):
+            list(fl.read())
+
+        path = self.write("")
+        self.assertListEqual([], list(CsvFl(name=path, feature=FEATURE).read()))
+
+
+class TestJsonReader(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write(self, content: str, encoding: str = "utf-8") -> str:
+        path: str = os.path.join(self.tmp.name, "data.json")
+        with open(path, mode="w", encoding=encoding) as f:
+            f.write(content)
+        return path
+
+    def test_read_ndjson(self):
+        path: str = self.write(
+            '{"id": 1, "name": "foo", "amount": 10.50, "rate": 1, '
+            '"created": "2024-01-01", "updated": "2024-01-01 10:00:00", '
+            '"other": {"nested": [1, 2, 3]}}\n'
+            "\n"
+            '{"id": "2", "name": 12, "amount": 3, "rate": 0.5}\n'
+            '{"id": 3.0, "name": null, "created": null}\n'
+        )
+        fl = JsonFl(name=path, feature=FEATURE)
+        batches = list(fl.read(chunk_size=2))
+        self.assertListEqual(
+            [(0, 2), (2, 1)], [(b.start, b.size) for b in batches]
+        )
+        first = batches[0].columns
+        self.assertListEqual(
+            ["id", "name", "amount", "rate", "created", "updated"], list(first)
+        )
+        self.assertListEqual([1, 2], first["id"])
+        self.assertListEqual(["foo", "12"], first["name"])
+        self.assertListEqual([Decimal("10.50"), Decimal("3")], first["amount"])
+        self.assertListEqual([1.0, 0.5], first["rate"])
+        self.assertListEqual([date(2024, 1, 1), None], first["created"])
+        self.assertListEqual([datetime(2024, 1, 1, 10), None], first["updated"])
+        self.assertEqual(
+            (3, None, None, None, None, None), next(batches[1].rows())
+        )
+
+    def test_read_array(self):
+        records = [
+            {"id": i, "name": f"name_{i}", "rate": i / 2, "note": "x" * 50}
+            for i in range(500)
+        ]
+        path: str = self.write(json.dumps(records, indent=2))
+        fl = JsonFl(name=path, format="array", feature=FEATURE[:4])
+        batches = list(fl.read(chunk_size=200))
+        self.assertListEqual([200, 200, 100], [b.size for b in batches])
+        self.assertListEqual(list(range(400, 500)), batches[-1].columns["id"])
+        self.assertEqual(249.5, batches[-1].columns["rate"][-1])
+        self.assertListEqual(
+            [],
+            list(
+                JsonFl(
+                    name=self.write(" [ ] "), format="array", feature=FEATURE
+                ).read()
+            ),
+        )
+
+    def test_iter_array_buffer(self):
+        text: str = json.dumps([{"a": "x" * 100}, 12345, [1, [2]], "s"])
+        for size in (1, 7, 64, 1024):
+            with self.subTest(size=size):
+                self.assertListEqual(
+                    json.loads(text),
+                    list(
+                        _iter_array(io.StringIO(text), json.JSONDecoder(), size)
+                    ),
+                )
+
+    def test_iter_ndjson_balanced_chunk(self):
+        # Note: the line that has two objects and the object that splits to
+        #   two lines have the same number of values as the lines.
+        text: str = '{"p": 1}, {"q": 2}\n{"a": [{"x": 1}\n{"y": 2}]}\n'
+        with self.assertRaisesRegex(ValueError, "line 1"):
+            list(_iter_ndjson(io.StringIO(text), json.JSONDecoder()))
+        text = '{"a": 1}\n[1]\n'
+        self.assertListEqual(
+            [{"a": 1}, [1]],
+            list(_iter_ndjson(io.StringIO(text), json.JSONDecoder())),
+        )
+
+    def test_read_json_errors(self):
+        fl = JsonFl(name="data.json", feature=FEATURE)
+        for content, fmt, msg in (
+            ('{"id": 1}\n{"id": 2,\n', "ndjson", "line 2"),
+            ('{"id": 1}, {"id": 2}\n', "ndjson", "line 1"),
+            ("[1]\n", "ndjson", "row 0 is not the json object"),
+            ('{"id": 1}', "array", "does not start"),
+            ('[{"id": 1} {"id": 2}]', "array", "expects ','"),
+            ('[{"id": 1}, {"id": ]', "array", "not valid"),
+            ('[{"id": 1}] x', "array", "extra data"),
+            ('{"id": "x"}\n', "ndjson", "column 'id' on row 0"),
+        ):
+            with self.subTest(content=content):
+                fl.update({"format": fmt})
+                with self.assertRaisesRegex(ValueError, msg):
+                    list(fl.read(self.write(content)))
+
+        fl.update({"format": "ndjson"})
+        (batch,) = list(fl.read(self.write('{"id": true}'), errors="null"))
+        self.assertListEqual([None], batch.columns["id"])
+
+    def test_read_json_without_feature(self):
+        fl = JsonFl(name="data.json")
+        self.assertIsNone(fl.feature)
+        with self.assertRaisesRegex(ValueError, "does not have the feature"):
+            list(fl.read(self.write('{"id": 1}\n')))
@@ -0,0 +1,179 @@
+import unittest
+from datetime import datetime
+from decimal import Decimal
+
+from armored.datasets import (
+    Batch,
+    CheckError,
+    Report,
+    RowValidator,
+    validate_rows,
+)
+from armored.datasets.db import Tbl
+
+FEATURE = [
+    {"name": "id", "dtype": "integer primary key"},
+    {"name": "code", "dtype": "varchar( 3 ) not null"},
+    {"name": "qty", "dtype": "smallint"},
+    {"name": "amount", "dtype": "numeric( 5, 2 )"},
+    {"name": "updated", "dtype": "timestamp( 3 )"},
+    {"name": "status", "dtype": "varchar( 10 ) not null default 'new'"},
+]
+
+
+class TestRowValidator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tbl = Tbl(name="foo", feature=FEATURE)
+        self.validator = RowValidator(self.tbl)
+
+    def test_validate_rows(self):
+        report = self.validator.validate(
+            [
+                (1, "abc", 10, Decimal("100.25"), datetime(2024, 1, 1), None),
+                (None, "abcd", 40_000, Decimal("1000"), None, "done"),
+                (
+                    3,
+                    None,
+                    -1,
+                    Decimal("1.255"),
+                    datetime(2024, 1, 1, 0, 0, 0, 1),
+                    None,
+                ),
+            ]
+        )
+        self.assertFalse(report.ok)
+        self.assertEqual(3, report.rows)
+        self.assertListEqual(
+            [
+                (1, "id", "null"),
+                (2, "code", "null"),
+                (1, "code", "length"),
+                (1, "qty", "range"),
+                (1, "amount", "precision"),
+                (2, "amount", "scale"),
+                (2, "updated", "precision"),
+            ],
+            report.violations,
+        )
+
+    def test_validate_mappings_and_columns(self):
+        rows = [{"id": 1, "code": "a"}, {"id": 2, "code": "abcd"}]
+        report = self.validator.validate(rows)
+        self.assertListEqual([(1, "code", "length")], report.violations)
+
+        report = self.validator.validate(
+            {"id": [1, 2], "code": ["a", "abcd"]}, start=10
+        )
+        self.assertListEqual([(11, "code", "length")], report.violations)
+
+        report = self.validator.validate(
+            Batch(start=5, size=2, columns={"id": [1, 2], "code": ["a", "b"]})
+        )
+        self.assertTrue(report.ok)
+        self.assertEqual(2, report.rows)
+
+    def test_validate_type(self):
+        report = self.validator.validate(
+            {"id": ["1", True, 3], "code": ["a", 1, "b"]}
+        )
+        # Note: the value that does not pass the type rule does not check with
+        #   the following rules.
+        self.assertListEqual(
+            [(0, "id", "type"), (1, "id", "type"), (1, "code", "type")],
+            report.violations,
+        )
+
+    def test_validate_numeric_special(self):
+        report = self.validator.validate(
+            {"amount": [Decimal("NaN"), Decimal("Infinity"), 5, Decimal("1.5")]}
+        )
+        self.assertListEqual([(1, "amount", "precision")], report.violations)
+
+    def test_validate_check(self):
+        tbl = Tbl(
+            name="foo",
+            feature=[
+                {"name": "low", "dtype": "integer"},
+                {"name": "high", "dtype": "integer check( <name> >= low )"},
+                {
+                    "name": "code",
+                    "dtype": "varchar( 5 ) check( <name> <> 'x' )",
+                },
+            ],
+        )
+        report = RowValidator(tbl).validate(
+            {"low": [1, 5, "a", None], "high": [2, 4, 1, 1]}, start=100
+        )
+        self.assertListEqual(
+            [(102, "low", "type"), (101, "high", "check")], report.violations
+        )
+
+    def test_validate_check_mismatch(self):
+        tbl = Tbl(
+            name="foo",
+            feature=[
+                {"name": "code", "dtype": "varchar( 5 ) check( <name> > 5 )"}
+            ],
+        )
+        with self.assertRaises(CheckError):
+            RowValidator(tbl)
+
+        tbl = Tbl(
+            name="foo",
+            feature=[
+                {"name": "qty", "dtype": "integer"},
+                {"name": "code", "dtype": "varchar( 5 ) check( <name> > qty )"},
+            ],
+        )
+        report = RowValidator(tbl).validate({"qty": [1, 2], "code": ["a", "b"]})
+        self.assertTrue(report.ok)
+
+        tbl = Tbl(
+            name="foo",
+            feature=[
+                {"name": "qty", "dtype": "integer check( length(<name>) > 2 )"}
+            ],
+        )
+        with self.assertRaises(CheckError):
+            RowValidator(tbl)
+
+    def test_validate_cap(self):
+        batches = iter(
+            Batch(start=i * 10, size=10, columns={"code": [None] * 10})
+            for i in range(3)
+        )
+        report = validate_rows(self.tbl, batches, max_violations=15)
+        self.assertEqual(30, report.total)
+        self.assertEqual(30, report.rows)
+        self.assertTrue(report.truncated)
+        self.assertEqual(15, len(report.violations))
+        self.assertEqual((14, "code", "null"), report.violations[-1])
+        self.assertDictEqual({("code", "null"): 30}, report.counts)
+        self.assertEqual(
+            "Report(rows=30, violations=30, truncated=True)", repr(report)
+        )
+
+    def test_validate_batch_list(self):
+        batches = [
+            Batch(start=i * 2, size=2, columns={"code": [None, "abc"]})
+            for i in range(3)
+        ]
+        report = validate_rows(self.tbl, batches)
+        self.assertEqual(6, report.rows)
+        self.assertListEqual(
+            [(0, "code", "null"), (2, "code", "null"), (4, "code", "null")],
+            report.violations,
+        )
+
+    def test_validate_empty(self):
+        report = validate_rows(self.tbl, [])
+        self.assertIsInstance(report, Report)
+        self.assertTrue(report.ok)
+        self.assertEqual(0, report.rows)
+
+    def test_validate_ragged_rows(self):
+        row = (1, "abc", 10, Decimal("1"), None, "new")
+        with self.assertRaisesRegex(ValueError, "row 1 has 2 values"):
+            self.validator.validate([row, (2, "abc")])
+        with self.assertRaisesRegex(ValueError, "row 0 has 7 values"):
+            self.validator.validate([(*row, "extra")])
@@ -0,0 +1,159 @@
+import io
+import os
+import tempfile
+import unittest
+from typing import Literal
+
+from armored.datasets import (
+    Catalog,
+    SnapshotError,
+    StaleSnapshotError,
+    Tbl,
+    load_snapshot,
+    save_snapshot,
+)
+from armored.dtype import (
+    DTYPES,
+    BaseType,
+    intern_dtype_clear,
+    intern_dtype_info,
+    register_dtype,
+)
+from armored.settings import DtypeSetting
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.catalog = Catalog(
+            name="warehouse",
+            objects=[
+                {
+                    "name": "customer",
+                    "feature": [
+                        {"name": "id", "dtype": "serial primary key"},
+                        {"name": "name", "dtype": "varchar( 256 ) not null"},
+                        {"name": "amount", "dtype": "numeric( 10, 2 )"},
+                    ],
+                },
+                {
+                    "name": "order",
+                    "feature": [
+                        {"name": "id", "dtype": "integer primary key"},
+                        {
+                            "name": "customer_id",
+                            "dtype": "integer",
+                            "fk": {"tbl": "customer", "col": "id"},
+                        },
+                        {
+                            "name": "code",
+                            "dtype": "char( 2 ) check( <name> <> 'XX' )",
+                        },
+                    ],
+                    "fk": [
+                        {
+                            "to": "code",
+                            "ref": {"tbl": "country", "col": "code"},
+                        }
+                    ],
+                },
+            ],
+        )
+
+    def test_snapshot_round_trip(self):
+        buffer = io.BytesIO()
+        save_snapshot(self.catalog, buffer, source="config")
+        buffer.seek(0)
+        rs = load_snapshot(buffer, source="config", verify=True)
+        self.assertEqual(self.catalog, rs)
+        self.assertEqual(self.catalog.model_dump(), rs.model_dump())
+        self.assertEqual(self.catalog.fingerprint(), rs.fingerprint())
+        self.assertEqual(
+            self.catalog.objects[0].feature[0].model_fields_set,
+            rs.objects[0].feature[0].model_fields_set,
+        )
+        self.assertListEqual([["customer"], ["order"]], rs.waves())
+
+        # Note: the loaded models able to validate on assignment.
+        rs.tbl("order").feature[2].update({"dtype": "char( 3 )"})
+        self.assertEqual(3, rs.tbl("order").feature[2].dtype.max_length)
+
+    def test_snapshot_tables(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path: str = os.path.join(tmp, "catalog.snap")
+            save_snapshot(self.catalog.objects, path)
+            rs = load_snapshot(path)
+        self.assertIsInstance(rs, list)
+        self.assertEqual(self.catalog.objects, rs)
+
+    def test_snapshot_lazy(self):
+        buffer = io.BytesIO()
+        save_snapshot(self.catalog, buffer)
+        buffer.seek(0)
+        rs = load_snapshot(buffer, lazy=True)
+        tbl: Tbl = rs.tbl("order")
+        self.assertEqual(0, tbl.feature.materialized)
+        self.assertEqual(["id"], tbl.pk.cols)
+        self.assertListEqual(
+            [["customer"], ["order"]], rs.waves(), "use the lazy fk refs"
+        )
+        self.assertEqual(0, tbl.feature.materialized)
+        self.assertEqual("integer", tbl.col("customer_id").dtype.type)
+        self.assertEqual(1, tbl.feature.materialized)
+        self.assertEqual(self.catalog, rs)
+
+    def test_snapshot_intern(self):
+        buffer = io.BytesIO()
+        save_snapshot(self.catalog, buffer)
+        DtypeSetting.intern = True
+        try:
+            buffer.seek(0)
+            rs = load_snapshot(buffer)
+        finally:
+            DtypeSetting.intern = False
+            intern_dtype_clear()
+        self.assertIs(
+            rs.objects[0].feature[0].dtype, rs.objects[1].feature[0].dtype
+        )
+        self.assertEqual(self.catalog.fingerprint(), rs.fingerprint())
+
+    def test_snapshot_not_intern(self):
+        buffer = io.BytesIO()
+        save_snapshot(self.catalog, buffer)
+        intern_dtype_clear()
+        buffer.seek(0)
+        rs = load_snapshot(buffer)
+        self.assertEqual(0, intern_dtype_info())
+        self.assertIsNot(
+            rs.objects[0].feature[0].dtype, rs.objects[1].feature[0].dtype
+        )
+
+    def test_snapshot_register_dtype(self):
+        buffer = io.BytesIO()
+        save_snapshot(self.catalog, buffer)
+
+        class BoolType(BaseType):
+            type: Literal["boolean"] = "boolean"
+
+        register_dtype(BoolType)
+        try:
+            buffer.seek(0)
+            with self.assertRaises(StaleSnapshotError):
+                load_snapshot(buffer)
+        finally:
+            DTYPES.pop("boolean")
+        buffer.seek(0)
+        self.assertEqual(self.catalog, load_snapshot(buffer))
+
+    def test_snapshot_stale(self):
+        buffer = io.BytesIO()
+        save_snapshot(self.catalog, buffer, source="config")
+        data: bytes = buffer.getvalue()
+        with self.assertRaises(StaleSnapshotError):
+            load_snapshot(io.BytesIO(data), source="changed config")
+        with self.assertRaises(SnapshotError):
+            load_snapshot(io.BytesIO(data[:-10] + b"\x00" * 10))
+        with self.assertRaises(SnapshotError):
+            load_snapshot(io.BytesIO(b"not a snapshot"))
+        with self.assertRaises(StaleSnapshotError):
+            load_snapshot(io.BytesIO(data[:8] + b"\x09\x00" + data[10:]))
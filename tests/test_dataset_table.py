@@ -1,6 +1,10 @@
 import unittest
 
+from pydantic import ValidationError
+
 import armored.datasets.db as db
+from armored.dtype import intern_dtype_clear
+from armored.settings import DtypeSetting
 
 
 class TestBaseTable(unittest.TestCase):
@@ -153,3 +157,295 @@ class TestTable(unittest.TestCase):
                 "fk": [],
             },
         )
+
+    def test_table_update_incremental(self):
+        t = db.Tbl(
+            name="foo",
+            feature=[
+                {"name": "id", "dtype": "integer primary key"},
+                {"name": "name", "dtype": "varchar( 256 )"},
+            ],
+            fk=[{"to": "name", "ref": {"tbl": "bar", "col": "baz"}}],
+        )
+        feature = t.feature
+        t.update({"name": "bar"}, incremental=True)
+        self.assertEqual("bar", t.pk.of)
+        self.assertEqual("bar", t.fk[0].of)
+        self.assertIs(feature, t.feature)
+        self.assertSetEqual({"name"}, t.get_dirty_fields())
+
+        t.update(
+            {"feature": [{"name": "id", "dtype": "bigint primary key"}]},
+            incremental=True,
+        )
+        self.assertEqual("bigint", t.feature[0].dtype.type)
+        self.assertSetEqual({"name", "feature"}, t.get_dirty_fields())
+        self.assertEqual(t, db.Tbl.model_validate(t.model_dump(by_alias=False)))
+
+    def test_column_update_incremental_raise(self):
+        c = db.Col(name="foo", dtype="varchar( 10 ) not null default 'x'")
+        with self.assertRaises(ValueError):
+            c.update({"nullable": True}, incremental=True)
+        self.assertFalse(c.nullable)
+
+
+class TestLazyTable(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.values = {
+            "name": "foo",
+            "feature": [
+                {"name": "id", "dtype": "integer primary key"},
+                {"name": " name ", "dtype": "varchar( 256 ) not null"},
+                {"ColumnName": "code", "dtype": "char( 2 )", "pk": True},
+            ],
+        }
+
+    def test_lazy_table_init(self):
+        t = db.Tbl.lazy(self.values)
+        self.assertIsInstance(t.feature, db.LazyCols)
+        self.assertEqual(0, t.feature.materialized)
+        self.assertListEqual(["id", "name", "code"], t.col_names())
+        self.assertEqual(db.Pk(of="foo", cols=["id", "code"]), t.pk)
+        self.assertEqual(0, t.feature.materialized)
+
+        self.assertEqual(256, t.feature[1].dtype.max_length)
+        self.assertEqual(1, t.feature.materialized)
+        self.assertEqual("code", t.feature[-1].name)
+        self.assertListEqual(["id", "name"], [c.name for c in t.feature[:2]])
+
+        self.assertEqual(db.Tbl.model_validate(self.values), t)
+        self.assertEqual(3, t.feature.materialized)
+
+    def test_lazy_table_pk_flag(self):
+        values = {
+            "name": "foo",
+            "feature": [
+                {"name": "id", "dtype": "integer", "pk": "true"},
+                {"name": "code", "dtype": "char( 2 )", "pk": "false"},
+                {"name": "qty", "dtype": "integer", "PrimaryKey": 0},
+            ],
+        }
+        t = db.Tbl.lazy(values)
+        self.assertEqual(db.Pk(of="foo", cols=["id"]), t.pk)
+        self.assertEqual(db.Tbl.model_validate(values).pk, t.pk)
+
+        with self.assertRaises(ValidationError):
+            db.Tbl.lazy(
+                {
+                    "name": "foo",
+                    "feature": [{"name": "id", "dtype": "integer", "pk": "x"}],
+                }
+            )
+
+    def test_lazy_table_dump(self):
+        t = db.Tbl.lazy(self.values)
+        self.assertDictEqual(
+            db.Tbl.model_validate(self.values).model_dump(),
+            t.model_dump(),
+        )
+        self.assertDictEqual(
+            db.Tbl.model_validate(self.values).model_dump(),
+            db.Tbl.model_validate_json(t.model_dump_json()).model_dump(),
+        )
+
+    def test_lazy_table_context(self):
+        t = db.Tbl.model_validate(self.values, context={"lazy": True})
+        self.assertIsInstance(t.feature, db.LazyCols)
+
+        t = db.Tbl.model_validate(self.values)
+        self.assertIsInstance(t.feature, list)
+
+    def test_lazy_table_raise(self):
+        t = db.Tbl.lazy(
+            {
+                "name": "foo",
+                "feature": [
+                    {"name": "id", "dtype": "varchar( 2 )", "default": 1}
+                ],
+            }
+        )
+        self.assertListEqual(["id"], t.col_names())
+        with self.assertRaises(ValidationError):
+            _ = t.feature[0]
+
+        with self.assertRaises(ValidationError):
+            db.Tbl.lazy({"name": "foo", "feature": [{"dtype": "integer"}]})
+
+
+class TestTableIndex(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.values = {
+            "name": "foo",
+            "feature": [
+                {"name": "id", "dtype": "integer primary key"},
+                {"name": "name", "dtype": "varchar( 256 ) not null"},
+                {"name": "code", "dtype": "char( 2 ) unique not null"},
+            ],
+        }
+
+    def test_table_col(self):
+        for t in (db.Tbl.model_validate(self.values), db.Tbl.lazy(self.values)):
+            self.assertEqual("name", t.col("name").name)
+            self.assertIn("code", t)
+            self.assertNotIn("bar", t)
+            self.assertNotIn(1, t)
+            self.assertListEqual(
+                ["id"], [c.name for c in t.cols_where(pk=True)]
+            )
+            self.assertListEqual(
+                ["name", "code"],
+                [c.name for c in t.cols_where(pk=False, nullable=False)],
+            )
+            with self.assertRaises(KeyError):
+                t.col("bar")
+
+    def test_table_col_after_change(self):
+        t = db.Tbl.model_validate(self.values)
+        self.assertIn("id", t)
+
+        t.feature = [db.Col(name="bar", dtype="integer")]
+        self.assertIn("bar", t)
+        self.assertNotIn("id", t)
+
+        t.update({"feature": [{"name": "baz", "dtype": "text"}]})
+        self.assertEqual("text", t.col("baz").dtype.type)
+        self.assertNotIn("bar", t)
+
+        t.update({"feature": self.values["feature"]}, incremental=True)
+        self.assertIn("id", t)
+        self.assertNotIn("baz", t)
+
+        # Note: the index will rebuild if the feature was changed in-place.
+        t.feature.append(db.Col(name="bar", dtype="integer"))
+        self.assertEqual("bar", t.col("bar").name)
+        t.feature[0] = db.Col(name="new_id", dtype="integer")
+        self.assertNotIn("id", t)
+        self.assertEqual("new_id", t.col("new_id").name)
+
+        # Note: the new name of the replaced column finds before any lookup of
+        #   the old name rebuilds the index.
+        t.feature[0] = db.Col(name="x", dtype="integer")
+        self.assertIn("x", t)
+        self.assertEqual("x", t.col("x").name)
+        self.assertNotIn("new_id", t)
+
+    def test_table_col_duplicate(self):
+        values = {
+            "name": "foo",
+            "feature": [
+                {"name": "id", "dtype": "integer"},
+                {"name": " id", "dtype": "integer"},
+            ],
+        }
+        with self.assertRaises(ValidationError):
+            db.Tbl.model_validate(values)
+
+        with self.assertRaises(ValidationError):
+            db.Tbl.lazy(values)
+
+
+class TestTableFingerprint(unittest.TestCase):
+    def setUp(self) -> None:
+        self.values = {
+            "name": "foo",
+            "feature": [
+                {"name": f"col_{i}", "dtype": "varchar( 10 ) not null"}
+                for i in range(20)
+            ]
+            + [{"name": "id", "dtype": "integer primary key"}],
+        }
+
+    def test_fingerprint(self):
+        t = db.Tbl.model_validate(self.values)
+        before: str = t.fingerprint()
+        self.assertEqual(
+            before, db.Tbl.model_validate(self.values).fingerprint()
+        )
+        self.assertEqual(before, db.Tbl.lazy(self.values).fingerprint())
+
+        # Note: the table and its columns cache their fingerprints, and the
+        #   change of column clears the cache of the table.
+        self.assertIn("__fingerprint__", t.__dict__)
+        self.assertTrue(all("__fingerprint__" in c.__dict__ for c in t.feature))
+
+        t.feature[3].update({"dtype": "varchar( 20 ) not null"})
+        self.assertNotIn("__fingerprint__", t.feature[3].__dict__)
+        self.assertNotIn("__fingerprint__", t.__dict__)
+        self.assertIn("__fingerprint__", t.feature[0].__dict__)
+        self.assertNotEqual(before, t.fingerprint())
+        t.feature[3].update({"dtype": "varchar( 10 ) not null"})
+        self.assertEqual(before, t.fingerprint())
+
+        t.update({"name": "bar"})
+        self.assertNotEqual(before, t.fingerprint())
+        self.assertEqual(
+            db.Pk(of="foo", cols=["id"]).fingerprint(),
+            db.Tbl.model_validate(self.values).pk.fingerprint(),
+        )
+
+    def test_fingerprint_interned(self):
+        DtypeSetting.intern = True
+        self.addCleanup(setattr, DtypeSetting, "intern", False)
+        self.addCleanup(intern_dtype_clear)
+        t = db.Tbl.model_validate(self.values)
+        before: str = t.fingerprint()
+        self.assertTrue(all("__fingerprint__" in c.__dict__ for c in t.feature))
+        self.assertEqual(
+            before, db.Tbl.model_validate(self.values).fingerprint()
+        )
+
+    def test_fingerprint_mutate_child(self):
+        col = db.Col(name="foo", dtype="varchar( 10 )")
+        before: bytes = col.fingerprint_digest()
+        self.assertIn("__fingerprint__", col.__dict__)
+        col.dtype.max_length = 20
+        self.assertNotIn("__fingerprint__", col.__dict__)
+        self.assertNotEqual(before, col.fingerprint_digest())
+        self.assertEqual(
+            db.Col(name="foo", dtype="varchar( 20 )").fingerprint_digest(),
+            col.fingerprint_digest(),
+        )
+
+        # Note: the change of the datatype of column clears the cache of the
+        #   table that keeps the column, and its copy does not keep the cache.
+        t = db.Tbl.model_validate(self.values)
+        before = t.fingerprint_digest()
+        copied = t.model_copy(deep=True)
+        self.assertNotIn("__fingerprint__", copied.__dict__)
+        t.feature[1].dtype.max_length = 512
+        self.assertNotIn("__fingerprint__", t.__dict__)
+        self.assertNotEqual(before, t.fingerprint_digest())
+        self.assertEqual(before, copied.fingerprint_digest())
+        t.pk.cols = ["name"]
+        self.assertNotIn("__fingerprint__", t.__dict__)
+
+
+class TestTableTrusted(unittest.TestCase):
+    def test_from_trusted(self):
+        t = db.Tbl.model_validate(
+            {
+                "name": "foo",
+                "feature": [
+                    {"name": "id", "dtype": "serial primary key"},
+                    {
+                        "name": "bar_id",
+                        "dtype": "varchar( 10 ) not null",
+                        "fk": {"tbl": "bar", "col": "id"},
+                    },
+                ],
+                "fk": [{"to": "bar_id", "ref": {"tbl": "bar", "col": "id"}}],
+            }
+        )
+        rs = db.Tbl.from_trusted(t.model_dump(), check=True)
+        self.assertEqual(t, rs)
+        self.assertIsInstance(rs.feature[1].fk, db.Ref)
+        self.assertEqual({}, rs.feature[0].fk)
+        self.assertEqual(10, rs.col("bar_id").dtype.max_length)
+        self.assertEqual("foo_id_pk", rs.pk.name)
+
+        with self.assertRaises(ValueError):
+            db.Tbl.from_trusted(
+                {"name": "foo", "feature": [{"name": "id"}]}, check=True
+            )
@@ -0,0 +1,147 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+from armored.datasets import Batch, Duplicate, UniqueChecker, check_unique
+from armored.datasets.db import Tbl
+from armored.datasets.unique import ENTRY_SIZE
+
+
+class TestUniqueChecker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tbl = Tbl(
+            name="foo",
+            feature=[
+                {"name": "id", "dtype": "integer primary key"},
+                {"name": "code", "dtype": "varchar( 10 ) unique"},
+                {"name": "note", "dtype": "varchar( 10 )"},
+            ],
+        )
+
+    def test_check_in_memory(self):
+        rs = check_unique(
+            self.tbl,
+            [
+                [(1, "a", "x"), (2, "b", "x"), (1, None, "x")],
+                [(3, None, "x"), (2, "a", "x"), (1, "c", "x")],
+            ],
+        )
+        self.assertListEqual(
+            [
+                Duplicate("foo_id_pk", ("id",), (0, 2, 5)),
+                Duplicate("foo_id_pk", ("id",), (1, 4)),
+                Duplicate("foo_code_key", ("code",), (0, 4)),
+            ],
+            rs,
+        )
+
+    def test_check_spill(self):
+        # Note: the small budget merges runs with streaming, and the larger
+        #   budget sorts each partition on memory.
+        for entries in (50, 600):
+            with self.subTest(entries=entries):
+                self.assert_check_spill(entries)
+
+    def assert_check_spill(self, entries: int):
+        with tempfile.TemporaryDirectory() as tmp:
+            checker = UniqueChecker(
+                self.tbl, memory=ENTRY_SIZE * entries, partitions=4, tmpdir=tmp
+            )
+            with checker:
+                for start in range(0, 1_000, 100):
+                    checker.add(
+                        Batch(
+                            start=start,
+                            size=100,
+                            columns={
+                                "id": list(range(start, start + 100)),
+                                "code": [
+                                    f"c{i % 700}"
+                                    for i in range(start, start + 100)
+                                ],
+                            },
+                        )
+                    )
+                self.assertGreater(checker.spills, 1)
+                self.assertTrue(os.listdir(tmp))
+                rs = checker.finish()
+            self.assertListEqual([], os.listdir(tmp))
+        self.assertEqual(300, checker.count)
+        self.assertEqual(300, len(rs))
+        self.assertEqual(Duplicate("foo_code_key", ("code",), (0, 700)), rs[0])
+        self.assertEqual(
+            Duplicate("foo_code_key", ("code",), (299, 999)), rs[-1]
+        )
+
+    def test_check_composite_key(self):
+        tbl = Tbl(
+            name="bar",
+            feature=[
+                {"name": "a", "dtype": "integer"},
+                {"name": "b", "dtype": "varchar( 5 )"},
+            ],
+            pk={"cols": ["a", "b"]},
+        )
+        rs = check_unique(
+            tbl,
+            [{"a": [1, 1, 1, None, None], "b": ["x", "y", "x", "x", "x"]}],
+            max_duplicates=5,
+        )
+        self.assertListEqual([Duplicate("bar_a_b_pk", ("a", "b"), (0, 2))], rs)
+
+    def test_check_equal_numbers(self):
+        tbl = Tbl(
+            name="bar",
+            feature=[
+                {"name": "a", "dtype": "numeric( 10, 2 )"},
+                {"name": "b", "dtype": "double precision"},
+            ],
+            pk={"cols": ["a", "b"]},
+        )
+        rs = check_unique(
+            tbl,
+            [
+                {
+                    "a": [Decimal("1.0"), Decimal("1.00"), 1, Decimal("1.5")],
+                    "b": [0.5, Decimal("0.50"), 0.5, 0.5],
+                }
+            ],
+        )
+        self.assertListEqual(
+            [Duplicate("bar_a_b_pk", ("a", "b"), (0, 1, 2))], rs
+        )
+        rs = check_unique(
+            Tbl(name="foo", feature=[{"name": "a", "dtype": "numeric unique"}]),
+            [
+                [
+                    (Decimal("0.10"),),
+                    (Decimal("0.1"),),
+                    (0.1,),
+                    (2.0,),
+                    (2,),
+                    (Decimal("1e100000000"),),
+                ]
+            ],
+        )
+        self.assertListEqual(
+            [
+                Duplicate("foo_a_key", ("a",), (0, 1)),
+                Duplicate("foo_a_key", ("a",), (3, 4)),
+            ],
+            rs,
+        )
+
+    def test_check_cap(self):
+        with UniqueChecker(self.tbl, max_duplicates=2) as checker:
+            checker.add({"id": [1, 2, 3, 1, 2, 3], "code": [None] * 6})
+            rs = checker.finish()
+        self.assertEqual(3, checker.count)
+        self.assertListEqual([(0, 3), (1, 4)], [d.rows for d in rs])
+
+    def test_check_error(self):
+        with self.assertRaises(ValueError):
+            UniqueChecker(self.tbl, partitions=0)
+        with UniqueChecker(self.tbl) as checker:
+            with self.assertRaises(ValueError):
+                checker.add({"id": [1]})
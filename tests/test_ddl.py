@@ -0,0 +1,200 @@
+import io
+import os
+import sqlite3
+import tempfile
+import unittest
+from typing import Literal
+
+from pydantic import Field
+
+from armored.datasets import Catalog, Tbl
+from armored.ddl import (
+    Dialect,
+    PostgresDialect,
+    get_dialect,
+    iter_ddl,
+    register_dialect,
+    write_ddl,
+)
+
+
+def _catalog(cycle: bool = False) -> Catalog:
+    parent = Tbl(
+        name="parent",
+        feature=[
+            {"name": "id", "dtype": "serial primary key"},
+            {
+                "name": "code",
+                "dtype": (
+                    "varchar( 10 ) not null default 'x' "
+                    "check( <name> <> 'test' )"
+                ),
+            },
+            {"name": "amount", "dtype": "numeric(10, 2) unique"},
+        ],
+    )
+    child = Tbl(
+        name="child",
+        feature=[
+            {"name": "id", "dtype": "integer primary key"},
+            {
+                "name": "parent_id",
+                "dtype": "integer",
+                "fk": {"tbl": "parent", "col": "id"},
+            },
+        ],
+    )
+    if cycle:
+        parent.update(
+            {
+                "feature": [
+                    *parent.model_dump()["feature"],
+                    {
+                        "name": "child_id",
+                        "dtype": "integer",
+                        "fk": {"tbl": "child", "col": "id"},
+                    },
+                ]
+            }
+        )
+    return Catalog(name="foo", objects=[child, parent])
+
+
+class TestDDL(unittest.TestCase):
+    def test_dialect(self):
+        self.assertIsInstance(get_dialect("postgres"), PostgresDialect)
+        dialect = PostgresDialect()
+        self.assertIs(get_dialect(dialect), dialect)
+        with self.assertRaises(ValueError):
+            get_dialect("oracle")
+
+    def test_sqlite_execute(self):
+        statements = list(iter_ddl(_catalog(), "sqlite"))
+        self.assertTrue(statements[0].startswith('CREATE TABLE "parent"'))
+        conn = sqlite3.connect(":memory:")
+        for statement in statements:
+            conn.execute(statement)
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("INSERT INTO parent (amount) VALUES (1.5)")
+        self.assertEqual(
+            (1, "x"), conn.execute("SELECT id, code FROM parent").fetchone()
+        )
+        with self.assertRaises(sqlite3.IntegrityError):
+            conn.execute("INSERT INTO parent (code) VALUES ('test')")
+        with self.assertRaises(sqlite3.IntegrityError):
+            conn.execute("INSERT INTO child (id, parent_id) VALUES (1, 9)")
+        conn.close()
+
+    def test_postgres(self):
+        statement: str = next(iter_ddl(_catalog(), "postgres"))
+        self.assertIn(
+            '"id" integer NOT NULL GENERATED BY DEFAULT AS IDENTITY',
+            statement,
+        )
+        self.assertIn(
+            "\"code\" varchar(10) NOT NULL DEFAULT 'x' "
+            "CHECK ( \"code\" <> 'test' )",
+            statement,
+        )
+        self.assertIn('CONSTRAINT "parent_id_pk" PRIMARY KEY ("id")', statement)
+
+    def test_postgres_cycle(self):
+        statements = list(iter_ddl(_catalog(cycle=True), "postgres"))
+        self.assertEqual(4, len(statements))
+        self.assertNotIn("FOREIGN KEY", statements[0] + statements[1])
+        self.assertEqual(
+            'ALTER TABLE "child" ADD CONSTRAINT "child_parent_id_parent_id_fk" '
+            'FOREIGN KEY ("parent_id") REFERENCES "parent" ("id")',
+            statements[2],
+        )
+
+    def test_sqlite_cycle(self):
+        statements = list(iter_ddl(_catalog(cycle=True), "sqlite"))
+        self.assertEqual(2, len(statements))
+        self.assertTrue(all(s.startswith("CREATE TABLE") for s in statements))
+        self.assertIn(
+            'CONSTRAINT "child_parent_id_parent_id_fk" '
+            'FOREIGN KEY ("parent_id") REFERENCES "parent" ("id")',
+            statements[0],
+        )
+        self.assertIn(
+            'FOREIGN KEY ("child_id") REFERENCES "child" ("id")',
+            statements[1],
+        )
+        with sqlite3.connect(":memory:") as conn:
+            conn.execute("PRAGMA foreign_keys = ON")
+            for statement in statements:
+                conn.execute(statement)
+            self.assertEqual(
+                2,
+                len(conn.execute("PRAGMA foreign_key_list(child)").fetchall())
+                + len(
+                    conn.execute("PRAGMA foreign_key_list(parent)").fetchall()
+                ),
+            )
+
+    def test_fragment_cache(self):
+        dialect = PostgresDialect()
+        tables = [
+            Tbl(
+                name=f"table_{i}",
+                feature=[
+                    {"name": f"col_{j}", "dtype": "integer"} for j in range(5)
+                ],
+            )
+            for i in range(10)
+        ]
+        self.assertEqual(10, len(list(iter_ddl(tables, dialect))))
+        self.assertEqual(
+            {"dtypes": 1, "columns": 1, "refs": 0}, dialect.cache_info()
+        )
+
+    def test_fragment_cache_unhashable(self):
+        from armored.dtype import DTYPES, BaseType, register_dtype
+
+        class EnumType(BaseType):
+            type: Literal["enum"] = "enum"
+            values: list[str] = Field(default_factory=list)
+
+        register_dtype(EnumType)
+        self.addCleanup(DTYPES.pop, "enum")
+
+        dialect = PostgresDialect()
+        table = Tbl(
+            name="foo",
+            feature=[
+                {"name": "kind", "dtype": {"type": "enum", "values": ["a"]}}
+            ],
+        )
+        self.assertIsInstance(table.col("kind").dtype, EnumType)
+        self.assertIn('"kind" enum', next(iter_ddl([table], dialect)))
+        self.assertEqual(
+            {"dtypes": 0, "columns": 0, "refs": 0}, dialect.cache_info()
+        )
+
+    def test_write(self):
+        buffer = io.StringIO()
+        self.assertEqual(2, write_ddl(_catalog(), buffer))
+        with tempfile.TemporaryDirectory() as tmp:
+            path: str = os.path.join(tmp, "ddl.sql")
+            self.assertEqual(2, write_ddl(_catalog(), path))
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(buffer.getvalue(), f.read())
+
+    def test_register(self):
+        class UpperDialect(Dialect):
+            name = "upper"
+
+            def quote(self, name: str) -> str:
+                return name.upper()
+
+        try:
+            register_dialect(UpperDialect)
+            self.assertIn(
+                "CREATE TABLE CHILD",
+                next(iter_ddl([_catalog().tbl("child")], "upper")),
+            )
+        finally:
+            from armored.ddl import DIALECTS
+
+            DIALECTS.pop("upper")
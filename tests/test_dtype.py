@@ -1,6 +1,13 @@
+import pickle
+import tracemalloc
 import unittest
+from typing import Literal, Optional
+
+from pydantic import BaseModel, ValidationError
 
 import armored.dtype as dtype
+from armored.datasets import Col
+from armored.settings import DtypeSetting
 
 
 class TestCharType(unittest.TestCase):
@@ -51,3 +58,132 @@ class TestIntegerType(unittest.TestCase):
     def test_int_init(self):
         t = dtype.IntegerType(type="int")
         self.assertEqual("integer", t.type)
+
+
+class TestDtype(unittest.TestCase):
+    def test_dtype_dispatch(self):
+        class Model(BaseModel):
+            dtype: dtype.Dtype
+
+        for value, model in (
+            ({"type": "varchar", "max_length": 10}, dtype.VarcharType),
+            ({"type": "str"}, dtype.StringType),
+            ({"type": "int"}, dtype.IntegerType),
+            ({"type": "date"}, dtype.DateType),
+            ({"type": "serial"}, dtype.SerialType),
+            ({"type": "double"}, dtype.DoublePrecisionType),
+            ({"type": "unknown"}, dtype.BaseType),
+            ({}, dtype.BaseType),
+        ):
+            self.assertIs(model, type(Model(dtype=value).dtype))
+
+        self.assertEqual("string", Model(dtype={"type": "str"}).dtype.type)
+        self.assertDictEqual(
+            {"dtype": {"type": "numeric", "precision": 19, "scale": 2}},
+            Model(
+                dtype={"type": "numeric", "precision": 19, "scale": 2}
+            ).model_dump(),
+        )
+
+        with self.assertRaises(ValidationError) as ctx:
+            Model(dtype={"type": "timestamp", "precision": 9})
+        self.assertEqual(1, ctx.exception.error_count())
+        self.assertEqual(
+            ("dtype", "precision"), ctx.exception.errors()[0]["loc"]
+        )
+
+    def test_dtype_register(self):
+        class JsonType(dtype.BaseType):
+            type: Literal["json"] = "json"
+            schema_name: Optional[str] = None
+
+        dtype.register_dtype(JsonType, aliases=("jsonb",))
+        self.addCleanup(dtype.DTYPES.pop, "json")
+        self.addCleanup(dtype.DTYPE_ALIASES.pop, "jsonb")
+
+        class Model(BaseModel):
+            dtype: dtype.Dtype
+
+        t = Model(dtype={"type": "jsonb", "schema_name": "foo"})
+        self.assertIsInstance(t.dtype, JsonType)
+        self.assertEqual("json", t.dtype.type)
+        self.assertEqual("foo", t.dtype.schema_name)
+
+
+class TestInternDtype(unittest.TestCase):
+    def setUp(self):
+        dtype.intern_dtype_clear()
+        self.addCleanup(setattr, DtypeSetting, "intern", False)
+
+    @staticmethod
+    def make_columns(size: int) -> list[Col]:
+        specs = ("varchar( 255 )", "integer", "numeric( 19, 2 )", "timestamp")
+        return [
+            Col(name=f"col_{i}", dtype=specs[i % len(specs)])
+            for i in range(size)
+        ]
+
+    def test_intern_dtype(self):
+        DtypeSetting.intern = True
+        a = Col(name="foo", dtype="varchar( 10 ) not null")
+        b = Col(name="bar", dtype={"type": "varchar", "max_length": 10})
+        self.assertIs(a.dtype, b.dtype)
+        self.assertIsInstance(a.dtype, dtype.VarcharType)
+        self.assertEqual(hash(a.dtype), hash(b.dtype))
+        self.assertDictEqual(
+            {"type": "varchar", "max_length": 10}, a.dtype.model_dump()
+        )
+        self.assertEqual(1, dtype.intern_dtype_info())
+
+        with self.assertRaises(ValidationError):
+            a.dtype.max_length = 20
+
+        self.assertIs(a.dtype, pickle.loads(pickle.dumps(a)).dtype)
+
+    def test_intern_dtype_memory(self):
+        tracemalloc.start()
+        plain = self.make_columns(2_000)
+        plain_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        DtypeSetting.intern = True
+        tracemalloc.start()
+        interned = self.make_columns(2_000)
+        interned_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertEqual(4, dtype.intern_dtype_info())
+        self.assertIsNot(plain[0].dtype, plain[4].dtype)
+        self.assertIs(interned[0].dtype, interned[4].dtype)
+        self.assertLess(interned_size, plain_size * 0.85)
+
+
+class TestDtypeFingerprint(unittest.TestCase):
+    def test_fingerprint(self):
+        a = dtype.VarcharType(max_length=10)
+        self.assertEqual(a.fingerprint(), dtype.intern_dtype(a).fingerprint())
+        self.assertNotEqual(
+            a.fingerprint(), dtype.VarcharType(max_length=20).fingerprint()
+        )
+        self.assertNotEqual(
+            a.fingerprint(), dtype.CharType(max_length=10).fingerprint()
+        )
+        dtype.intern_dtype_clear()
+
+
+class TestDtypeTrusted(unittest.TestCase):
+    def test_from_trusted(self):
+        rs = dtype.BaseType.from_trusted({"type": "varchar", "max_length": 10})
+        self.assertEqual(dtype.VarcharType(max_length=10), rs)
+        self.assertEqual(
+            dtype.DoublePrecisionType(),
+            dtype.BaseType.from_trusted({"type": "double"}),
+        )
+        self.assertEqual(
+            dtype.NumericType(precision=10),
+            dtype.NumericType.from_trusted({"precision": 10}),
+        )
+        with self.assertRaises(ValueError):
+            dtype.BaseType.from_trusted(
+                {"type": "varchar", "length": 10}, check=True
+            )
@@ -0,0 +1,196 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from armored.conn import DbConn
+from armored.pool import (
+    Pool,
+    PoolError,
+    PoolTimeout,
+    close_pools,
+    get_pool,
+    register_driver,
+)
+
+
+def make_conn(path: str, **options) -> DbConn:
+    return DbConn(
+        driver="sqlite",
+        host="localhost",
+        port=0,
+        user="demo",
+        pwd="P@ssw0rd",
+        db="main",
+        options={"path": path, **options},
+    )
+
+
+class TestPool(unittest.TestCase):
+    def setUp(self) -> None:
+        fd, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+        self.addCleanup(close_pools)
+
+    def test_options(self):
+        conn = make_conn(
+            self.path,
+            pool_min_size="1",
+            pool_max_size="3",
+            pool_idle_timeout="0.5",
+            pool_pre_ping="false",
+            timeout="5",
+        )
+        with Pool(conn) as pool:
+            self.assertEqual(
+                (1, 3, 0.5), (pool.min_size, pool.max_size, pool.idle_timeout)
+            )
+            self.assertFalse(pool.pre_ping)
+            self.assertEqual({"path": self.path, "timeout": "5"}, pool.options)
+            self.assertEqual(1, pool.stats().idle)
+            self.assertEqual(1, pool.stats().created)
+
+        with self.assertRaises(PoolError):
+            Pool(make_conn(self.path, pool_min_size=3, pool_max_size=2))
+        with self.assertRaises(PoolError):
+            Pool(make_conn(self.path).model_copy(update={"driver": "foo"}))
+
+    def test_sqlite_options(self):
+        conn = make_conn(
+            self.path, echo="True", timeout="5", isolation_level="none"
+        )
+        with Pool(conn) as pool, pool.connection() as c:
+            self.assertIsNone(c.isolation_level)
+            self.assertEqual([(1,)], c.execute("select 1").fetchall())
+        self.assertEqual("True", pool.options["echo"])
+
+    def test_shared_pool(self):
+        pool = make_conn(self.path).pool()
+        self.assertIs(pool, get_pool(make_conn(self.path)))
+        self.assertIsNot(pool, make_conn(self.path, pool_max_size=2).pool())
+        pool.close()
+        self.assertIsNot(pool, make_conn(self.path).pool())
+
+    def test_checkout(self):
+        with Pool(make_conn(self.path, pool_max_size=1)) as pool:
+            with pool.connection() as c:
+                c.execute("create table foo ( id integer )")
+                c.execute("insert into foo values ( 1 )")
+                c.commit()
+                c.execute("insert into foo values ( 2 )")
+            with pool.connection() as reused:
+                self.assertIs(c, reused)
+                # Note: the insert that does not commit rolls back.
+                self.assertEqual(
+                    [(1,)], reused.execute("select * from foo").fetchall()
+                )
+                with self.assertRaises(PoolTimeout):
+                    pool.acquire(timeout=0.01)
+            stats = pool.stats()
+            self.assertEqual((1, 1, 0), (stats.size, stats.idle, stats.in_use))
+            self.assertEqual(
+                (2, 1, 1), (stats.checkouts, stats.created, stats.timeouts)
+            )
+
+    def test_health_check(self):
+        with Pool(make_conn(self.path)) as pool:
+            c = pool.acquire()
+            pool.release(c)
+            # Note: the connection that was closed behind the pool fails its
+            #   health check and the pool opens the new one.
+            c.close()
+            with pool.connection() as new:
+                self.assertIsNot(c, new)
+                new.execute("select 1")
+            self.assertEqual(1, pool.stats().failed_pings)
+            self.assertEqual(1, pool.stats().size)
+
+    def test_idle_timeout(self):
+        conn = make_conn(self.path, pool_idle_timeout=0, pool_min_size=1)
+        with Pool(conn) as pool:
+            first, second = pool.acquire(), pool.acquire()
+            pool.release(first)
+            pool.release(second)
+            self.assertEqual(2, pool.stats().idle)
+            time.sleep(0.01)
+            self.assertEqual(1, pool.prune())
+            self.assertEqual(1, pool.stats().size)
+
+    def test_discard_and_close(self):
+        pool = Pool(make_conn(self.path))
+        with self.assertRaises(KeyError):
+            with pool.connection():
+                raise KeyError("foo")
+        self.assertEqual(1, pool.stats().idle)
+        c = pool.acquire()
+        pool.release(c, discard=True)
+        self.assertEqual((0, 0), pool.stats()[:2])
+        c = pool.acquire()
+        pool.close()
+        with self.assertRaises(PoolError):
+            pool.acquire()
+        pool.release(c)
+        self.assertEqual(0, pool.stats().size)
+        self.assertEqual(2, pool.stats().closed)
+
+    def test_release_unknown(self):
+        with (
+            Pool(make_conn(self.path)) as pool,
+            Pool(make_conn(self.path)) as other,
+        ):
+            c = pool.acquire()
+            with self.assertRaises(PoolError):
+                other.release(c)
+            pool.release(c)
+            with self.assertRaises(PoolError):
+                pool.release(c)
+            self.assertEqual((1, 1, 0), pool.stats()[:3])
+            self.assertIs(c, pool.acquire())
+            self.assertIsNot(c, pool.acquire())
+            self.assertEqual((2, 0, 2), pool.stats()[:3])
+            self.assertEqual(0, other.stats().size)
+
+    def test_threads(self):
+        conn = make_conn(self.path, pool_max_size=3)
+        pool = conn.pool()
+        with pool.connection() as c:
+            c.execute("create table foo ( id integer )")
+            c.commit()
+        peak: list[int] = []
+
+        def work(i: int) -> None:
+            for j in range(20):
+                with pool.connection() as c:
+                    peak.append(pool.stats().in_use)
+                    c.execute("insert into foo values ( ? )", (i * 100 + j,))
+                    c.commit()
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        with pool.connection() as c:
+            self.assertEqual(
+                160, c.execute("select count(*) from foo").fetchone()[0]
+            )
+        self.assertLessEqual(max(peak), 3)
+        self.assertEqual(3, pool.stats().created)
+        self.assertEqual(0, pool.stats().in_use)
+
+    def test_register_driver(self):
+        opened: list[dict] = []
+
+        def connect(conn, options):
+            opened.append(options)
+            return Pool(make_conn(self.path)).driver.connect(conn, options)
+
+        register_driver("fake", connect, aliases=("fake+sqlite",))
+        conn = make_conn(self.path, pool_max_size=1).model_copy(
+            update={"driver": "fake+sqlite"}
+        )
+        with Pool(conn) as pool, pool.connection() as c:
+            self.assertEqual([(1,)], c.execute("select 1").fetchall())
+        self.assertEqual([{"path": self.path}], opened)